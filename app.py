@@ -524,6 +524,7 @@ with col_refresh:
     if st.button("🔄 Refresh Metrics", use_container_width=True, help="Force recalculation if values don't update"):
         # Clear ALL caches including DashboardAdapter cache
         st.cache_data.clear()
+        DashboardAdapter.clear_cache()
         # Force DashboardAdapter to recompute on next access by clearing its specific cache
         if hasattr(st.session_state, '_dashboard_adapter_last_cache_key'):
             del st.session_state._dashboard_adapter_last_cache_key
@@ -1219,7 +1220,7 @@ with tab1:
         st.markdown("---")
         st.markdown("### 📊 Channel Performance Comparison")
         
-        df_channels = pd.DataFrame(gtm_metrics['channels_breakdown'])
+        df_channels = pd.DataFrame(dict(gtm_metrics['channels_breakdown']))
         
         if len(df_channels) > 0:
             # Quick metrics
@@ -1260,7 +1261,7 @@ with tab1:
             }), use_container_width=True, hide_index=True)
     
     # Channel Performance Analysis (detailed charts)
-    if gtm_metrics.get('channels_breakdown') and len(gtm_metrics['channels_breakdown']) > 0:
+    if gtm_metrics.get('channels_breakdown') and len(gtm_metrics['channels_breakdown']['name']) > 0:
         st.markdown("---")
         st.markdown("### 📊 Channel Performance Analysis")
         
@@ -1280,16 +1281,16 @@ with tab1:
             total_sales = 0
             
             # Get actual channel configs to use real conversion rates
-            for idx, ch_data in enumerate(gtm_metrics['channels_breakdown']):
+            breakdown = gtm_metrics['channels_breakdown']
+            for ch_name, leads, sales in zip(breakdown['name'], breakdown['leads'], breakdown['sales']):
                 # Find matching channel config to get actual rates
                 channel_config = None
                 for ch in st.session_state.gtm_channels:
-                    if ch['name'] == ch_data['name'] and ch.get('enabled', True):
+                    if ch['name'] == ch_name and ch.get('enabled', True):
                         channel_config = ch
                         break
                 
                 # Calculate funnel stages using ACTUAL conversion rates from config
-                leads = ch_data['leads']
                 if channel_config:
                     contact_rate = channel_config.get('contact_rate', 0.6)
                     meeting_rate = channel_config.get('meeting_rate', 0.3)
@@ -1304,8 +1305,6 @@ with tab1:
                     meetings_scheduled = contacts * 0.3
                     meetings_held = meetings_scheduled * 0.7
                 
-                sales = ch_data['sales']
-                
                 # Add to totals
                 total_leads += leads
                 total_contacts += contacts
@@ -1314,7 +1313,7 @@ with tab1:
                 total_sales += sales
                 
                 funnel_fig.add_trace(go.Funnel(
-                    name=ch_data['name'],
+                    name=ch_name,
                     y=['Leads', 'Contacts', 'Meetings Scheduled', 'Meetings Held', 'Sales'],
                     x=[leads, contacts, meetings_scheduled, meetings_held, sales],
                     textinfo="value+percent initial"
@@ -1353,8 +1352,8 @@ with tab1:
         
         # Create pie chart for revenue distribution
         revenue_data = {
-            'Channel': [ch['name'] for ch in gtm_metrics['channels_breakdown']],
-            'Revenue': [ch['revenue'] for ch in gtm_metrics['channels_breakdown']]
+            'Channel': list(gtm_metrics['channels_breakdown']['name']),
+            'Revenue': gtm_metrics['channels_breakdown']['revenue']
         }
         
         pie_fig = go.Figure(data=[go.Pie(
@@ -2049,7 +2048,7 @@ with tab3:
     st.markdown("---")
     st.markdown("### 📊 Channel Performance Analysis")
     
-    if gtm_metrics.get('channels_breakdown') and len(gtm_metrics['channels_breakdown']) > 0:
+    if gtm_metrics.get('channels_breakdown') and len(gtm_metrics['channels_breakdown']['name']) > 0:
         chart_cols = st.columns(2)
         
         with chart_cols[0]:
@@ -2066,16 +2065,16 @@ with tab3:
             total_sales = 0
             
             # Get actual channel configs to use real conversion rates
-            for ch_data in gtm_metrics['channels_breakdown']:
+            breakdown = gtm_metrics['channels_breakdown']
+            for ch_name, leads, sales in zip(breakdown['name'], breakdown['leads'], breakdown['sales']):
                 # Find matching channel config to get actual rates
                 channel_config = None
                 for ch in st.session_state.gtm_channels:
-                    if ch['name'] == ch_data['name'] and ch.get('enabled', True):
+                    if ch['name'] == ch_name and ch.get('enabled', True):
                         channel_config = ch
                         break
                 
                 # Calculate funnel stages using ACTUAL conversion rates from config
-                leads = ch_data['leads']
                 if channel_config:
                     contact_rate = channel_config.get('contact_rate', 0.6)
                     meeting_rate = channel_config.get('meeting_rate', 0.3)
@@ -2090,8 +2089,6 @@ with tab3:
                     meetings_scheduled = contacts * 0.3
                     meetings_held = meetings_scheduled * 0.7
                 
-                sales = ch_data['sales']
-                
                 # Add to totals
                 total_leads += leads
                 total_contacts += contacts
@@ -2100,7 +2097,7 @@ with tab3:
                 total_sales += sales
                 
                 funnel_fig.add_trace(go.Funnel(
-                    name=ch_data['name'],
+                    name=ch_name,
                     y=['Leads', 'Contacts', 'Meetings Scheduled', 'Meetings Held', 'Sales'],
                     x=[leads, contacts, meetings_scheduled, meetings_held, sales],
                     textinfo="value+percent initial"
@@ -2139,8 +2136,8 @@ with tab3:
         
         # Create pie chart for revenue distribution
         revenue_data = {
-            'Channel': [ch['name'] for ch in gtm_metrics['channels_breakdown']],
-            'Revenue': [ch['revenue'] for ch in gtm_metrics['channels_breakdown']]
+            'Channel': list(gtm_metrics['channels_breakdown']['name']),
+            'Revenue': gtm_metrics['channels_breakdown']['revenue']
         }
         
         pie_fig = go.Figure(data=[go.Pie(
@@ -2169,7 +2166,7 @@ with tab3:
         # Channel Performance Table
         st.markdown("#### 📈 Channel Performance Breakdown")
         
-        channel_perf_df = pd.DataFrame(gtm_metrics['channels_breakdown'])
+        channel_perf_df = pd.DataFrame(dict(gtm_metrics['channels_breakdown']))
         
         # Format for display
         display_df = channel_perf_df[['name', 'segment', 'leads', 'sales', 'revenue', 'roas', 'close_rate']].copy()
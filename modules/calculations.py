@@ -5,20 +5,25 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
-from .config import config
+from .config import (
+    config, CARRIER_RATE, CONTRACT_MONTHS, DEFAULT_CONTACTS_PER_SETTER,
+    DEFAULT_MEETINGS_PER_CLOSER, DEFAULT_PERSISTENCY, DEFAULT_RAMP_TIME_MONTHS,
+    DEFERRED_MONTH, MIN_LTV_CAC_RATIO, PCT_DEFERRED, PCT_IMMEDIATE,
+    STANDARD_PIPELINE_COVERAGE, TARGET_EBITDA_MARGIN, TARGET_LTV_CAC_RATIO
+)
 
 class RevenueCalculator:
     """Handles all revenue calculations"""
     
     @staticmethod
     def calculate_compensation(premium_monthly: float, 
-                              carrier_rate: float = config.CARRIER_RATE,
-                              contract_months: int = config.CONTRACT_MONTHS) -> Dict[str, float]:
+                              carrier_rate: float = CARRIER_RATE,
+                              contract_months: int = CONTRACT_MONTHS) -> Dict[str, float]:
         """Calculate total compensation structure"""
         total_premium = premium_monthly * contract_months
         total_compensation = total_premium * carrier_rate
-        immediate_payment = total_compensation * config.PCT_IMMEDIATE
-        deferred_payment = total_compensation * config.PCT_DEFERRED
+        immediate_payment = total_compensation * PCT_IMMEDIATE
+        deferred_payment = total_compensation * PCT_DEFERRED
         
         return {
             'total_premium': total_premium,
@@ -27,7 +32,7 @@ class RevenueCalculator:
             'deferred_payment': deferred_payment,
             'immediate_per_sale': immediate_payment,
             'deferred_per_sale': deferred_payment,
-            'expected_total': immediate_payment + (deferred_payment * config.DEFAULT_PERSISTENCY)
+            'expected_total': immediate_payment + (deferred_payment * DEFAULT_PERSISTENCY)
         }
     
     @staticmethod
@@ -42,9 +47,9 @@ class RevenueCalculator:
         
         # Deferred revenue from 18 months ago (if applicable)
         deferred_revenue = 0
-        if month_number > config.DEFERRED_MONTH:
+        if month_number > DEFERRED_MONTH:
             # Assuming same sales 18 months ago for now
-            deferred_revenue = sales * comp['deferred_per_sale'] * config.DEFAULT_PERSISTENCY
+            deferred_revenue = sales * comp['deferred_per_sale'] * DEFAULT_PERSISTENCY
         
         return {
             'immediate': immediate_revenue,
@@ -60,10 +65,12 @@ class RevenueCalculator:
                                 growth_rate: float = 0.0) -> pd.DataFrame:
         """Project revenue over multiple months with growth"""
         timeline = []
+        growth = 1.0  # (1 + growth_rate) ** (month - 1), carried forward
         
         for month in range(1, num_months + 1):
             # Apply growth rate
-            sales = monthly_sales * ((1 + growth_rate) ** (month - 1))
+            sales = monthly_sales * growth
+            growth *= 1 + growth_rate
             
             revenue = RevenueCalculator.calculate_monthly_revenue(sales, avg_premium, month)
             
@@ -77,7 +84,7 @@ class RevenueCalculator:
             })
         
         df = pd.DataFrame(timeline)
-        df['cumulative_revenue'] = df['total_revenue'].cumsum()
+        df['cumulative_revenue'] = np.cumsum(df['total_revenue'].to_numpy())
         
         # Add quarter and year columns
         df['quarter'] = ((df['month'] - 1) // 3) + 1
@@ -118,7 +125,7 @@ class FunnelCalculator:
                                  close_rate: float,
                                  meeting_rate: float,
                                  contact_rate: float,
-                                 pipeline_coverage: float = config.STANDARD_PIPELINE_COVERAGE) -> Dict[str, float]:
+                                 pipeline_coverage: float = STANDARD_PIPELINE_COVERAGE) -> Dict[str, float]:
         """Reverse engineer required pipeline from revenue target"""
         # Required closed deals
         deals_needed = revenue_target / avg_deal_size
@@ -149,8 +156,8 @@ class TeamCalculator:
     @staticmethod
     def calculate_team_capacity(num_closers: int,
                               num_setters: int,
-                              meetings_per_closer: int = config.DEFAULT_MEETINGS_PER_CLOSER,
-                              contacts_per_setter: int = config.DEFAULT_CONTACTS_PER_SETTER) -> Dict[str, float]:
+                              meetings_per_closer: int = DEFAULT_MEETINGS_PER_CLOSER,
+                              contacts_per_setter: int = DEFAULT_CONTACTS_PER_SETTER) -> Dict[str, float]:
         """Calculate team capacity"""
         # Monthly capacity
         closer_capacity_meetings = num_closers * meetings_per_closer * 4  # 4 weeks
@@ -167,7 +174,7 @@ class TeamCalculator:
     
     @staticmethod
     def calculate_ramp_schedule(new_hires: int,
-                               ramp_months: int = config.DEFAULT_RAMP_TIME_MONTHS,
+                               ramp_months: int = DEFAULT_RAMP_TIME_MONTHS,
                                productivity_curve: Optional[List[float]] = None) -> pd.DataFrame:
         """Calculate ramping schedule for new hires"""
         if productivity_curve is None:
@@ -193,7 +200,7 @@ class TeamCalculator:
     @staticmethod
     def calculate_hiring_plan(revenue_targets: List[float],
                             avg_quota_per_rep: float,
-                            ramp_months: int = config.DEFAULT_RAMP_TIME_MONTHS,
+                            ramp_months: int = DEFAULT_RAMP_TIME_MONTHS,
                             attrition_rate: float = 0.1) -> pd.DataFrame:
         """Create hiring plan based on revenue targets"""
         hiring_plan = []
@@ -333,7 +340,7 @@ class UnitEconomicsCalculator:
             'ebitda': ebitda,
             'ebitda_margin': ebitda_margin,
             'cos_percentage': cos_percentage,
-            'is_healthy': ebitda_margin >= config.TARGET_EBITDA_MARGIN
+            'is_healthy': ebitda_margin >= TARGET_EBITDA_MARGIN
         }
     
     @staticmethod
@@ -360,8 +367,8 @@ class UnitEconomicsCalculator:
             'cac': cac,
             'ltv_cac_ratio': ltv_cac_ratio,
             'payback_months': payback_months,
-            'is_healthy': ltv_cac_ratio >= config.MIN_LTV_CAC_RATIO,
-            'health_status': 'Healthy' if ltv_cac_ratio >= config.TARGET_LTV_CAC_RATIO else 
-                           'Acceptable' if ltv_cac_ratio >= config.MIN_LTV_CAC_RATIO else 
+            'is_healthy': ltv_cac_ratio >= MIN_LTV_CAC_RATIO,
+            'health_status': 'Healthy' if ltv_cac_ratio >= TARGET_LTV_CAC_RATIO else 
+                           'Acceptable' if ltv_cac_ratio >= MIN_LTV_CAC_RATIO else 
                            'Needs Improvement'
         }
@@ -1,10 +1,179 @@
 """
 Enhanced Calculations Module - Preserves all original calculations + adds new ones
 """
+import operator
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from .jit import njit, NUMBA_AVAILABLE
+
+# Copy-on-Write is always on from pandas 3.0, so a shallow copy of a cached
+# frame is enough to isolate callers. On 2.x it is a process-wide opt-in we
+# must not flip from a library module, so hand out deep copies there.
+_PANDAS_ALWAYS_COW = int(pd.__version__.split('.')[0]) >= 3
+
+# Inputs are rounded to this many decimals before cache lookup so that
+# float noise from sliders doesn't defeat the cache
+_CACHE_PRECISION = 6
+
+
+def _round_key(value: float) -> float:
+    """Round a numeric input for use in a cache key"""
+    return round(float(value), _CACHE_PRECISION)
+
+
+@njit(cache=True, fastmath=True)
+def _timeline_core(num_months, monthly_sales, immediate_per_sale, deferred_per_sale,
+                   persistency, growth_rate):
+    """Single-pass timeline kernel, compiled when Numba is installed"""
+    sales = np.empty(num_months, dtype=np.float64)
+    immediate = np.empty(num_months, dtype=np.float64)
+    deferred = np.empty(num_months, dtype=np.float64)
+    
+    current_sales = monthly_sales
+    for i in range(num_months):
+        sales[i] = current_sales
+        immediate[i] = current_sales * immediate_per_sale
+        # Deferred revenue from month-18 sales (if applicable)
+        if i >= 18:
+            deferred[i] = sales[i - 18] * deferred_per_sale * persistency
+        else:
+            deferred[i] = 0.0
+        current_sales *= 1.0 + growth_rate
+    
+    return sales, immediate, deferred
+
+
+def _timeline_arrays(num_months: int,
+                     monthly_sales: float,
+                     immediate_per_sale: float,
+                     deferred_per_sale: float,
+                     persistency: float,
+                     growth_rate: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sales, immediate and deferred revenue per month"""
+    if NUMBA_AVAILABLE:
+        return _timeline_core(num_months, monthly_sales, immediate_per_sale,
+                              deferred_per_sale, persistency, growth_rate)
+    
+    # Current month sales (with growth) - compounding is a running product,
+    # one multiply per month instead of a pow
+    if growth_rate == 0:
+        sales = np.full(num_months, float(monthly_sales))
+    else:
+        growth = np.empty(num_months)
+        growth[:1] = 1.0
+        np.multiply.accumulate(np.full(max(num_months - 1, 0), 1.0 + growth_rate), out=growth[1:])
+        sales = monthly_sales * growth
+    
+    # Immediate revenue from current month (70% from today's sales)
+    immediate = sales * immediate_per_sale
+    
+    # Deferred revenue from month-18 sales (if applicable)
+    deferred = np.zeros(num_months)
+    deferred[18:] = sales[:-18] * deferred_per_sale * persistency
+    
+    return sales, immediate, deferred
+
+
+@lru_cache(maxsize=128)
+def _per_sale_constants(avg_premium: float,
+                        carrier_rate: float,
+                        pct_immediate: float,
+                        pct_deferred: float) -> Tuple[float, float]:
+    """Immediate and deferred commission earned per sale"""
+    total_comp_per_sale = avg_premium * 300 * carrier_rate  # 300 months contract
+    return total_comp_per_sale * pct_immediate, total_comp_per_sale * pct_deferred
+
+
+@lru_cache(maxsize=512)
+def _calculate_monthly_timeline_cached(monthly_sales: float,
+                                       avg_premium: float,
+                                       num_months: int,
+                                       carrier_rate: float,
+                                       pct_immediate: float,
+                                       pct_deferred: float,
+                                       persistency: float,
+                                       growth_rate: float,
+                                       start_date: date) -> pd.DataFrame:
+    """Build the revenue timeline (cached - callers must not mutate the result)"""
+    # Per-sale amounts depend only on price and split, not on volume or growth
+    immediate_per_sale, deferred_per_sale = _per_sale_constants(
+        avg_premium, carrier_rate, pct_immediate, pct_deferred
+    )
+    
+    # Struct-of-arrays: one column per field, filled with vector ops
+    months = np.arange(1, num_months + 1, dtype=np.int16)
+    sales, immediate, deferred = _timeline_arrays(
+        num_months, monthly_sales, immediate_per_sale, deferred_per_sale, persistency, growth_rate
+    )
+    
+    total = immediate + deferred
+    
+    # Monthly flows are stored as float32 (~7 significant digits: cent-accurate
+    # up to ~$131k/month, which is plenty for charts); running totals are
+    # accumulated and kept in float64 so they don't drift
+    df = pd.DataFrame({
+        'month': months,
+        'year': (months - 1) // 12 + 1,
+        'quarter': (months - 1) // 3 + 1,
+        'sales': sales.astype(np.float32),
+        'immediate_revenue': immediate.astype(np.float32),
+        'deferred_revenue': deferred.astype(np.float32),
+        'total_revenue': total.astype(np.float32),
+        'cash_collected_today': immediate.astype(np.float32),
+        'cash_pending_month_18': (sales * deferred_per_sale).astype(np.float32),  # Will arrive in month+18
+        'cumulative_immediate': np.cumsum(immediate),
+        'cumulative_total': np.cumsum(total)
+    })
+    
+    # Add date columns for clarity - the deferred dates are the same monthly
+    # grid shifted 18 months, so offset the anchor once instead of every row
+    first_month = pd.offsets.MonthBegin().rollforward(pd.Timestamp(start_date))
+    df['date'] = pd.date_range(start=first_month, periods=num_months, freq='MS')
+    df['date_deferred_arrives'] = pd.date_range(
+        start=first_month + pd.DateOffset(months=18), periods=num_months, freq='MS'
+    )
+    
+    return df
+
+
+@lru_cache(maxsize=256)
+def _calculate_ramp_impact_cached(new_hires: int,
+                                  ramp_months: int,
+                                  productivity_curve: Tuple[float, ...]) -> Dict[str, np.ndarray]:
+    """Build the ramp columns (cached - arrays are read-only)"""
+    months = np.arange(1, ramp_months + 2)  # Include fully ramped month
+    
+    # Curve values first, fully productive afterwards
+    productivity = np.ones(len(months))
+    ramped = min(len(productivity_curve), len(months))
+    productivity[:ramped] = productivity_curve[:ramped]
+    
+    columns = {
+        'month': months,
+        'new_hires': np.full(len(months), new_hires),
+        'productivity': productivity,
+        'effective_capacity': new_hires * productivity,
+        'cost_efficiency': productivity.copy(),  # They cost 100% but produce X%
+        'status': np.where(productivity < 1.0, 'Ramping', 'Fully Productive')
+    }
+    for values in columns.values():
+        values.setflags(write=False)
+    return columns
+
+
+# Periods per year for the revenue breakdown, as reciprocals (260 business days)
+_BREAKDOWN_KEYS = ('annual', 'quarterly', 'monthly', 'weekly', 'daily')
+_BREAKDOWN_RECIP = np.array([1.0, 1.0 / 4.0, 1.0 / 12.0, 1.0 / 52.0, 1.0 / 260.0])
+
+
+@lru_cache(maxsize=256)
+def _calculate_revenue_breakdown_cached(annual_target: float) -> Dict[str, float]:
+    """Period breakdown (cached - callers must not mutate the result)"""
+    return dict(zip(_BREAKDOWN_KEYS, (annual_target * _BREAKDOWN_RECIP).tolist()))
+
 
 class EnhancedRevenueCalculator:
     """Enhanced revenue calculations with proper month 18 timing"""
@@ -20,67 +189,23 @@ class EnhancedRevenueCalculator:
                                  growth_rate: float = 0.0) -> pd.DataFrame:
         """
         Calculate revenue timeline with CORRECT month 18 deferred payments
-        """
-        # Calculate per-sale amounts
-        total_comp_per_sale = avg_premium * 300 * carrier_rate  # 300 months contract
-        immediate_per_sale = total_comp_per_sale * pct_immediate
-        deferred_per_sale = total_comp_per_sale * pct_deferred
-        
-        timeline = []
-        sales_history = {}  # Track sales for deferred calculation
-        
-        for month in range(1, num_months + 1):
-            # Current month sales (with growth)
-            current_sales = monthly_sales * ((1 + growth_rate) ** (month - 1))
-            sales_history[month] = current_sales
-            
-            # Immediate revenue from current month
-            immediate_revenue = current_sales * immediate_per_sale
-            
-            # Deferred revenue from month-18 (if applicable)
-            deferred_revenue = 0
-            if month > 18 and (month - 18) in sales_history:
-                deferred_revenue = sales_history[month - 18] * deferred_per_sale * persistency
-            
-            # Cash collected this month
-            cash_collected_today = immediate_revenue  # 70% from today's sales
-            cash_pending_month_18 = current_sales * deferred_per_sale  # Will arrive in month+18
-            
-            timeline.append({
-                'month': month,
-                'year': (month - 1) // 12 + 1,
-                'quarter': (month - 1) // 3 + 1,
-                'sales': current_sales,
-                'immediate_revenue': immediate_revenue,
-                'deferred_revenue': deferred_revenue,
-                'total_revenue': immediate_revenue + deferred_revenue,
-                'cash_collected_today': cash_collected_today,
-                'cash_pending_month_18': cash_pending_month_18,
-                'cumulative_immediate': 0,  # Will calculate after
-                'cumulative_total': 0  # Will calculate after
-            })
         
-        df = pd.DataFrame(timeline)
-        df['cumulative_immediate'] = df['immediate_revenue'].cumsum()
-        df['cumulative_total'] = df['total_revenue'].cumsum()
-        
-        # Add date columns for clarity
-        today = datetime.now()
-        df['date'] = pd.date_range(start=today, periods=len(df), freq='MS')
-        df['date_deferred_arrives'] = df['date'] + pd.DateOffset(months=18)
-        
-        return df
+        Results are memoized on the (rounded) inputs and today's date, so
+        repeated dashboard/sweep lookups skip the rebuild. On pandas 3 the
+        returned frame is a lazy Copy-on-Write view of the cached one (data is
+        only copied if the caller modifies it); on pandas 2 it is a deep copy.
+        """
+        df = _calculate_monthly_timeline_cached(
+            _round_key(monthly_sales), _round_key(avg_premium), int(num_months),
+            _round_key(carrier_rate), _round_key(pct_immediate), _round_key(pct_deferred),
+            _round_key(persistency), _round_key(growth_rate), date.today()
+        )
+        return df.copy(deep=not _PANDAS_ALWAYS_COW)
     
     @staticmethod
     def calculate_revenue_breakdown(annual_target: float) -> Dict[str, float]:
         """Break down annual revenue target into periods"""
-        return {
-            'annual': annual_target,
-            'quarterly': annual_target / 4,
-            'monthly': annual_target / 12,
-            'weekly': annual_target / 52,
-            'daily': annual_target / 260  # Business days
-        }
+        return dict(_calculate_revenue_breakdown_cached(_round_key(annual_target)))
 
 
 class TeamMetricsCalculator:
@@ -95,36 +220,36 @@ class TeamMetricsCalculator:
                              manager_ote: float = 120000,
                              base_pct: float = 0.4) -> Dict[str, Dict]:
         """Calculate OTE structure by role"""
+        # Per-role columns: closer, setter, manager
+        role_names = ('closer', 'setter', 'manager')
+        counts = np.array([num_closers, num_setters, num_managers])
+        otes = np.array([closer_ote, setter_ote, manager_ote], dtype=float)
+        base_pcts = np.array([base_pct, base_pct, 0.6])  # Managers typically higher base
+        bases = otes * base_pcts
+        variables = otes * (1 - base_pcts)
+        total_costs = counts * otes
+        
         roles = {
-            'closer': {
-                'count': num_closers,
-                'ote': closer_ote,
-                'base': closer_ote * base_pct,
-                'variable': closer_ote * (1 - base_pct),
-                'total_cost': num_closers * closer_ote
-            },
-            'setter': {
-                'count': num_setters,
-                'ote': setter_ote,
-                'base': setter_ote * base_pct,
-                'variable': setter_ote * (1 - base_pct),
-                'total_cost': num_setters * setter_ote
-            },
-            'manager': {
-                'count': num_managers,
-                'ote': manager_ote,
-                'base': manager_ote * 0.6,  # Managers typically higher base
-                'variable': manager_ote * 0.4,
-                'total_cost': num_managers * manager_ote
+            name: {
+                'count': count,
+                'ote': ote,
+                'base': base,
+                'variable': variable,
+                'total_cost': total_cost
             }
+            for name, count, ote, base, variable, total_cost in zip(
+                role_names, counts.tolist(), otes.tolist(), bases.tolist(),
+                variables.tolist(), total_costs.tolist()
+            )
         }
         
         # Calculate averages
         total_headcount = num_closers + num_setters + num_managers
+        total_cost = float(total_costs.sum())
         if total_headcount > 0:
-            avg_ote = sum(r['total_cost'] for r in roles.values()) / total_headcount
-            avg_base = sum(r['base'] * r['count'] for r in roles.values()) / total_headcount
-            avg_variable = sum(r['variable'] * r['count'] for r in roles.values()) / total_headcount
+            avg_ote = total_cost / total_headcount
+            avg_base = float(np.dot(bases, counts)) / total_headcount
+            avg_variable = float(np.dot(variables, counts)) / total_headcount
         else:
             avg_ote = avg_base = avg_variable = 0
         
@@ -133,7 +258,7 @@ class TeamMetricsCalculator:
             'ote': avg_ote,
             'base': avg_base,
             'variable': avg_variable,
-            'total_cost': sum(r['total_cost'] for r in roles.values())
+            'total_cost': total_cost
         }
         
         return roles
@@ -141,37 +266,74 @@ class TeamMetricsCalculator:
     @staticmethod
     def calculate_ramp_impact(new_hires: int,
                              ramp_months: int = 3,
-                             productivity_curve: Optional[List[float]] = None) -> pd.DataFrame:
-        """Calculate productivity ramp with financial impact"""
+                             productivity_curve: Optional[List[float]] = None,
+                             as_dataframe: bool = False):
+        """
+        Calculate productivity ramp with financial impact
+        
+        Returns a dict of NumPy columns (the frame is only a handful of rows,
+        so pandas construction would dominate); pass as_dataframe=True for a
+        DataFrame.
+        """
         if productivity_curve is None:
             # Default S-curve: 30%, 60%, 85%, 100%
             productivity_curve = [0.3, 0.6, 0.85, 1.0]
         
-        ramp_data = []
-        for month in range(1, ramp_months + 2):  # Include fully ramped month
-            if month <= len(productivity_curve):
-                productivity = productivity_curve[month - 1]
-            else:
-                productivity = 1.0
-            
-            effective_capacity = new_hires * productivity
-            cost_efficiency = productivity  # They cost 100% but produce X%
-            
-            ramp_data.append({
-                'month': month,
-                'new_hires': new_hires,
-                'productivity': productivity,
-                'effective_capacity': effective_capacity,
-                'cost_efficiency': cost_efficiency,
-                'status': 'Ramping' if productivity < 1.0 else 'Fully Productive'
-            })
-        
-        return pd.DataFrame(ramp_data)
+        columns = _calculate_ramp_impact_cached(
+            new_hires, int(ramp_months), tuple(_round_key(p) for p in productivity_curve)
+        )
+        if as_dataframe:
+            return pd.DataFrame(columns)
+        return dict(columns)
+
+
+# Bottleneck rules: (source, metric, comparison, threshold, type, issue, target, impact, action)
+_BOTTLENECK_RULES = (
+    # Funnel bottlenecks
+    ('funnel', 'contact_rate', operator.lt, 0.5, 'Funnel', 'Low Contact Rate', 0.6,
+     'Reducing lead efficiency', 'Improve lead quality or contact strategy'),
+    ('funnel', 'close_rate', operator.lt, 0.2, 'Funnel', 'Low Close Rate', 0.25,
+     'Need more meetings for same revenue', 'Sales training or lead qualification'),
+    # Capacity bottlenecks
+    ('team', 'closer_utilization', operator.gt, 0.9, 'Capacity', 'Closers Overloaded', 0.75,
+     'Quality degradation, burnout risk', 'Hire more closers or improve efficiency'),
+    # Financial bottlenecks
+    ('financial', 'ltv_cac_ratio', operator.lt, 3, 'Financial', 'Low LTV:CAC Ratio', 3.0,
+     'Unsustainable unit economics', 'Reduce CAC or increase LTV'),
+    ('financial', 'ebitda_margin', operator.lt, 0.2, 'Financial', 'Low EBITDA Margin', 0.25,
+     'Limited reinvestment capacity', 'Optimize costs or increase prices'),
+)
 
 
 class BottleneckAnalyzer:
     """Analyze bottlenecks and sensitivity"""
     
+    # KPI impact per unit change of each input (simplified - you'd implement full recalc)
+    IMPACT_COEFFS = {
+        'close_rate': {
+            'sales_impact': 1.0,
+            'revenue_impact': 1.0,
+            'ebitda_impact': 0.8,  # Less than proportional
+            'team_needed_impact': -0.5  # Need fewer people
+        },
+        'sales_cycle': {
+            'sales_impact': -0.3,  # Longer cycle = fewer sales
+            'revenue_impact': -0.3,
+            'pipeline_coverage_impact': 0.5,  # Need more coverage
+            'cash_flow_impact': -1.0  # Delayed cash
+        },
+        'avg_deal_size': {
+            'revenue_impact': 1.0,
+            'ebitda_impact': 0.9,
+            'ltv_impact': 1.0
+        },
+        'cost_per_lead': {
+            'cac_impact': 1.0,
+            'ebitda_impact': -0.2,
+            'ltv_cac_impact': -0.8
+        }
+    }
+    
     @staticmethod
     def analyze_sensitivity(base_metrics: Dict[str, float],
                           variable_changes: Dict[str, List[float]]) -> pd.DataFrame:
@@ -179,107 +341,134 @@ class BottleneckAnalyzer:
         Analyze what changes when you move X
         Returns impact on key KPIs
         """
-        sensitivity_results = []
+        return BottleneckAnalyzer.analyze_sensitivity_batch(base_metrics, variable_changes)
+    
+    @staticmethod
+    def analyze_sensitivity_batch(base_metrics: Dict[str, float],
+                                  variable_changes: Dict[str, object]) -> pd.DataFrame:
+        """
+        Sensitivity for every variable in one stacked frame
+        
+        Accepts a single change or a list of changes per variable, so callers
+        sweeping (variable, change) pairs can pass them all at once instead of
+        concatenating per-call results. Columns are assembled once over the
+        whole grid; KPIs a variable doesn't move are NaN.
+        """
+        blocks = [
+            (variable, np.atleast_1d(np.asarray(changes, dtype=float)))
+            for variable, changes in variable_changes.items()
+        ]
+        blocks = [(variable, change_pct) for variable, change_pct in blocks if change_pct.size]
+        if not blocks:
+            return pd.DataFrame()
+        
+        sizes = [change_pct.size for _, change_pct in blocks]
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+        change_pct = np.concatenate([changes for _, changes in blocks])
+        base_values = np.repeat([base_metrics.get(variable, 1) for variable, _ in blocks], sizes)
+        
+        columns = {
+            'variable': np.repeat([variable for variable, _ in blocks], sizes),
+            'change_pct': change_pct,
+            'new_value': base_values * (1 + change_pct)
+        }
         
-        for variable, changes in variable_changes.items():
-            for change_pct in changes:
-                # Calculate new value
-                new_value = base_metrics.get(variable, 1) * (1 + change_pct)
-                
-                # Calculate impacts (simplified - you'd implement full recalc)
-                impacts = {
-                    'variable': variable,
-                    'change_pct': change_pct,
-                    'new_value': new_value
-                }
-                
-                # Estimate impacts on KPIs based on variable
-                if variable == 'close_rate':
-                    impacts['sales_impact'] = change_pct
-                    impacts['revenue_impact'] = change_pct
-                    impacts['ebitda_impact'] = change_pct * 0.8  # Less than proportional
-                    impacts['team_needed_impact'] = -change_pct * 0.5  # Need fewer people
-                elif variable == 'sales_cycle':
-                    impacts['sales_impact'] = -change_pct * 0.3  # Longer cycle = fewer sales
-                    impacts['revenue_impact'] = -change_pct * 0.3
-                    impacts['pipeline_coverage_impact'] = change_pct * 0.5  # Need more coverage
-                    impacts['cash_flow_impact'] = -change_pct  # Delayed cash
-                elif variable == 'avg_deal_size':
-                    impacts['revenue_impact'] = change_pct
-                    impacts['ebitda_impact'] = change_pct * 0.9
-                    impacts['ltv_impact'] = change_pct
-                elif variable == 'cost_per_lead':
-                    impacts['cac_impact'] = change_pct
-                    impacts['ebitda_impact'] = -change_pct * 0.2
-                    impacts['ltv_cac_impact'] = -change_pct * 0.8
-                
-                sensitivity_results.append(impacts)
+        # Each variable fills its slice of the KPI columns it moves
+        for (variable, _), start, stop in zip(blocks, offsets[:-1], offsets[1:]):
+            for kpi, coeff in BottleneckAnalyzer.IMPACT_COEFFS.get(variable, {}).items():
+                if kpi not in columns:
+                    columns[kpi] = np.full(change_pct.size, np.nan)
+                columns[kpi][start:stop] = change_pct[start:stop] * coeff
         
-        return pd.DataFrame(sensitivity_results)
+        return pd.DataFrame(columns)
     
     @staticmethod
     def find_bottlenecks(funnel_metrics: Dict[str, float],
                         team_capacity: Dict[str, float],
                         financial_metrics: Dict[str, float]) -> List[Dict]:
         """Identify bottlenecks in the system"""
-        bottlenecks = []
-        
-        # Funnel bottlenecks
-        if 'contact_rate' in funnel_metrics and funnel_metrics['contact_rate'] < 0.5:
-            bottlenecks.append({
-                'type': 'Funnel',
-                'issue': 'Low Contact Rate',
-                'current': funnel_metrics['contact_rate'],
-                'target': 0.6,
-                'impact': 'Reducing lead efficiency',
-                'action': 'Improve lead quality or contact strategy'
-            })
-        
-        if 'close_rate' in funnel_metrics and funnel_metrics['close_rate'] < 0.2:
-            bottlenecks.append({
-                'type': 'Funnel',
-                'issue': 'Low Close Rate',
-                'current': funnel_metrics['close_rate'],
-                'target': 0.25,
-                'impact': 'Need more meetings for same revenue',
-                'action': 'Sales training or lead qualification'
-            })
-        
-        # Capacity bottlenecks
-        if 'closer_utilization' in team_capacity and team_capacity['closer_utilization'] > 0.9:
-            bottlenecks.append({
-                'type': 'Capacity',
-                'issue': 'Closers Overloaded',
-                'current': team_capacity['closer_utilization'],
-                'target': 0.75,
-                'impact': 'Quality degradation, burnout risk',
-                'action': 'Hire more closers or improve efficiency'
-            })
-        
-        # Financial bottlenecks
-        if 'ltv_cac_ratio' in financial_metrics and financial_metrics['ltv_cac_ratio'] < 3:
-            bottlenecks.append({
-                'type': 'Financial',
-                'issue': 'Low LTV:CAC Ratio',
-                'current': financial_metrics['ltv_cac_ratio'],
-                'target': 3.0,
-                'impact': 'Unsustainable unit economics',
-                'action': 'Reduce CAC or increase LTV'
-            })
+        sources = {
+            'funnel': funnel_metrics,
+            'team': team_capacity,
+            'financial': financial_metrics
+        }
         
-        if 'ebitda_margin' in financial_metrics and financial_metrics['ebitda_margin'] < 0.2:
-            bottlenecks.append({
-                'type': 'Financial',
-                'issue': 'Low EBITDA Margin',
-                'current': financial_metrics['ebitda_margin'],
-                'target': 0.25,
-                'impact': 'Limited reinvestment capacity',
-                'action': 'Optimize costs or increase prices'
-            })
+        bottlenecks = []
+        for source, metric, breached, threshold, kind, issue, target, impact, action in _BOTTLENECK_RULES:
+            current = sources[source].get(metric)
+            if current is not None and breached(current, threshold):
+                bottlenecks.append({
+                    'type': kind,
+                    'issue': issue,
+                    'current': current,
+                    'target': target,
+                    'impact': impact,
+                    'action': action
+                })
         
         return bottlenecks
 
 
+# Upper bound per health ratio - team ratios are left uncapped
+_HEALTH_SCORE_CAPS = np.array([100, 100, 100, np.inf, np.inf, np.inf, 100, 100, 100], dtype=float)
+_HEALTH_CAPPED = np.isfinite(_HEALTH_SCORE_CAPS)
+
+# Funnel / team / financial weights in the overall score
+_HEALTH_WEIGHTS = np.array([0.3, 0.3, 0.4])
+
+# Overall score bands: below 40, 40-60, 60-80, 80 and up
+_HEALTH_STATUS_THRESHOLDS = (40, 60, 80)
+_HEALTH_STATUS = (
+    ('🔴 Critical', 'red'),
+    ('🟠 Needs Attention', 'orange'),
+    ('🟡 Good', 'yellow'),
+    ('🟢 Excellent', 'green')
+)
+
+
+@lru_cache(maxsize=256)
+def _health_metrics_cached(funnel_items: Tuple, team_items: Tuple, financial_items: Tuple) -> Dict[str, any]:
+    """Health scores keyed on sorted (key, value) tuples (cached - don't mutate)"""
+    return _health_metrics(dict(funnel_items), dict(team_items), dict(financial_items))
+
+
+def _health_metrics(funnel_metrics: Dict,
+                    team_metrics: Dict,
+                    financial_metrics: Dict) -> Dict[str, any]:
+    """Calculate health score across dimensions"""
+    # Nine normalized ratios (x100): funnel, team, financial - three each
+    ratios = np.array([
+        funnel_metrics.get('contact_rate', 0) / 0.6,
+        funnel_metrics.get('meeting_rate', 0) / 0.35,
+        funnel_metrics.get('close_rate', 0) / 0.25,
+        1 - abs(team_metrics.get('utilization', 0.75) - 0.75) * 2,  # Optimal at 75%
+        team_metrics.get('ramp_efficiency', 0.7),
+        1 - team_metrics.get('attrition_rate', 0.15),
+        financial_metrics.get('ltv_cac_ratio', 0) / 5,  # 5:1 is excellent
+        financial_metrics.get('ebitda_margin', 0) / 0.3,
+        financial_metrics.get('growth_rate', 0) / 0.2
+    ], dtype=float) * 100
+    # fmin, like min(100, x), turns a NaN ratio into the cap
+    np.fmin(ratios, _HEALTH_SCORE_CAPS, out=ratios, where=_HEALTH_CAPPED)
+    
+    # Dimension scores (0-100) and weighted overall
+    dimensions = ratios.reshape(3, 3).mean(axis=1)
+    scores = {
+        'funnel_health': float(dimensions[0]),
+        'team_health': float(dimensions[1]),
+        'financial_health': float(dimensions[2]),
+        'overall_health': float(np.dot(dimensions, _HEALTH_WEIGHTS))
+    }
+    
+    # Status determination - bin the overall score against the thresholds;
+    # an undefined (NaN/inf) score falls through to Critical
+    overall = scores['overall_health']
+    band = int(np.searchsorted(_HEALTH_STATUS_THRESHOLDS, overall, side='right')) if np.isfinite(overall) else 0
+    scores['status'], scores['color'] = _HEALTH_STATUS[band]
+    
+    return scores
+
+
 class HealthScoreCalculator:
     """Calculate comprehensive health scores"""
     
@@ -287,49 +476,23 @@ class HealthScoreCalculator:
     def calculate_health_metrics(funnel_metrics: Dict,
                                 team_metrics: Dict,
                                 financial_metrics: Dict) -> Dict[str, any]:
-        """Calculate health score across dimensions"""
-        scores = {}
-        
-        # Funnel Health (0-100)
-        contact_score = min(100, (funnel_metrics.get('contact_rate', 0) / 0.6) * 100)
-        meeting_score = min(100, (funnel_metrics.get('meeting_rate', 0) / 0.35) * 100)
-        close_score = min(100, (funnel_metrics.get('close_rate', 0) / 0.25) * 100)
-        scores['funnel_health'] = (contact_score + meeting_score + close_score) / 3
-        
-        # Team Health (0-100)
-        utilization = team_metrics.get('utilization', 0.75)
-        util_score = 100 - abs(utilization - 0.75) * 200  # Optimal at 75%
-        ramp_score = team_metrics.get('ramp_efficiency', 0.7) * 100
-        retention_score = (1 - team_metrics.get('attrition_rate', 0.15)) * 100
-        scores['team_health'] = (util_score + ramp_score + retention_score) / 3
-        
-        # Financial Health (0-100)
-        ltv_cac = financial_metrics.get('ltv_cac_ratio', 0)
-        ltv_score = min(100, (ltv_cac / 5) * 100)  # 5:1 is excellent
-        margin_score = min(100, (financial_metrics.get('ebitda_margin', 0) / 0.3) * 100)
-        growth_score = min(100, (financial_metrics.get('growth_rate', 0) / 0.2) * 100)
-        scores['financial_health'] = (ltv_score + margin_score + growth_score) / 3
-        
-        # Overall Health
-        scores['overall_health'] = (
-            scores['funnel_health'] * 0.3 +
-            scores['team_health'] * 0.3 +
-            scores['financial_health'] * 0.4
-        )
-        
-        # Status determination
-        overall = scores['overall_health']
-        if overall >= 80:
-            scores['status'] = '🟢 Excellent'
-            scores['color'] = 'green'
-        elif overall >= 60:
-            scores['status'] = '🟡 Good'
-            scores['color'] = 'yellow'
-        elif overall >= 40:
-            scores['status'] = '🟠 Needs Attention'
-            scores['color'] = 'orange'
-        else:
-            scores['status'] = '🔴 Critical'
-            scores['color'] = 'red'
+        """
+        Calculate health score across dimensions
         
-        return scores
+        Memoized on the input values since it runs on every rerender.
+        """
+        try:
+            scores = _health_metrics_cached(
+                tuple(sorted(funnel_metrics.items())),
+                tuple(sorted(team_metrics.items())),
+                tuple(sorted(financial_metrics.items()))
+            )
+        except TypeError:
+            # Unhashable values in the inputs - compute directly
+            return _health_metrics(funnel_metrics, team_metrics, financial_metrics)
+        return dict(scores)
+    
+    @staticmethod
+    def clear_cache():
+        """Drop memoized scores (e.g. when switching scenarios)"""
+        _health_metrics_cached.cache_clear()
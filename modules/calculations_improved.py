@@ -3,86 +3,153 @@ Improved Calculations Module - Fixed math and better integration
 """
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from datetime import datetime, timedelta
-import streamlit as st
+from functools import lru_cache
+
+
+# Funnel stages priced by calculate_acquisition_costs, top to bottom
+_COST_STAGES = ('cost_per_lead', 'cost_per_contact', 'cost_per_meeting_scheduled',
+                'cost_per_meeting_held', 'cost_per_sale')
+
+# Stage each input type is quoted at (CPA = cost per scheduled appointment)
+_INPUT_START_STAGE = {'CPL': 0, 'CPA': 2, 'Total Budget': 0}
+
+
+def _stage_multipliers(start: int, rates: np.ndarray) -> np.ndarray:
+    """Cost of each funnel stage per unit of cost at the start stage"""
+    multipliers = np.ones(len(_COST_STAGES))
+    
+    # Later stages divide by the cumulative rates (a zero rate leaves them unpriced)
+    forward = np.cumprod(rates[start:])
+    np.divide(1.0, forward, out=multipliers[start + 1:], where=forward > 0)
+    multipliers[start + 1:][forward <= 0] = 0
+    
+    # Earlier stages multiply by the rates between them and the start stage
+    multipliers[:start] = np.cumprod(rates[:start][::-1])[::-1]
+    return multipliers
+
+
+@lru_cache(maxsize=512)
+def _acquisition_costs(input_type: str,
+                       input_value: float,
+                       contact_rate: float,
+                       meeting_rate: float,
+                       show_up_rate: float,
+                       close_rate: float,
+                       leads: float,
+                       avg_deal_value: float) -> Dict[str, float]:
+    """Cost per funnel stage for one input type (cached - don't mutate)"""
+    costs = {}
+    
+    # Price the stage the input type is quoted at, then walk the funnel:
+    # later stages divide by the conversion rates, earlier ones multiply
+    start = _INPUT_START_STAGE.get(input_type)
+    if start is not None:
+        if input_type == "Total Budget":
+            # Distribute budget across expected leads (zero if no leads)
+            start_cost = input_value / leads if leads > 0 else 0
+        else:
+            start_cost = input_value
+        
+        rates = np.array([contact_rate, meeting_rate, show_up_rate, close_rate], dtype=float)
+        stage_costs = start_cost * _stage_multipliers(start, rates)
+        
+        costs.update(zip(_COST_STAGES, stage_costs.tolist()))
+    
+    # Read each stage cost once (unpriced stages default to 0)
+    cost_per_lead = costs.get('cost_per_lead', 0)
+    cost_per_meeting_scheduled = costs.get('cost_per_meeting_scheduled', 0)
+    
+    # Calculate derived metrics
+    costs['marketing_cac'] = costs.get('cost_per_sale', 0)
+    costs['total_marketing_spend'] = cost_per_lead * leads
+    costs['cost_per_meeting'] = costs.get('cost_per_meeting_held', 0)  # For backward compatibility
+    
+    # Calculate efficiency metrics
+    if leads > 0 and cost_per_lead > 0:
+        expected_contacts = leads * contact_rate
+        expected_meetings_scheduled = expected_contacts * meeting_rate
+        expected_meetings_held = expected_meetings_scheduled * show_up_rate
+        expected_sales = expected_meetings_held * close_rate
+    
+        costs['expected_contacts'] = expected_contacts
+        costs['expected_meetings_scheduled'] = expected_meetings_scheduled
+        costs['expected_meetings_held'] = expected_meetings_held
+        costs['expected_sales'] = expected_sales
+        costs['total_expected_revenue'] = expected_sales * avg_deal_value
+    
+        # No-show cost (wasted meetings)
+        no_show_rate = 1 - show_up_rate
+        costs['no_show_cost'] = expected_meetings_scheduled * no_show_rate * cost_per_meeting_scheduled
+        costs['no_show_rate'] = no_show_rate
+    
+    return costs
+
 
 class ImprovedCostCalculator:
     """Improved cost calculations with flexibility"""
     
     @staticmethod
-    @st.cache_data(ttl=300)
     def calculate_acquisition_costs(input_type: str,
                                   input_value: float,
-                                  volume: Dict[str, float]) -> Dict[str, float]:
+                                  contact_rate: float = 0.6,
+                                  meeting_rate: float = 0.35,
+                                  show_up_rate: float = 0.75,
+                                  close_rate: float = 0.25,
+                                  leads: float = 0,
+                                  avg_deal_value: float = 20000) -> Dict[str, float]:
         """
         Mathematically accurate cost calculation based on input type
         Properly accounts for show-up rate and funnel math
-        """
-        costs = {}
-        
-        # Extract rates with proper defaults
-        contact_rate = volume.get('contact_rate', 0.6)
-        meeting_rate = volume.get('meeting_rate', 0.35)
-        show_up_rate = volume.get('show_up_rate', 0.75)
-        close_rate = volume.get('close_rate', 0.25)
-        leads = volume.get('leads', 0)
         
-        if input_type == "CPL":
-            # Start from CPL and work down the funnel
-            costs['cost_per_lead'] = input_value
-            costs['cost_per_contact'] = input_value / contact_rate if contact_rate > 0 else 0
-            costs['cost_per_meeting_scheduled'] = costs['cost_per_contact'] / meeting_rate if meeting_rate > 0 else 0
-            costs['cost_per_meeting_held'] = costs['cost_per_meeting_scheduled'] / show_up_rate if show_up_rate > 0 else 0
-            costs['cost_per_sale'] = costs['cost_per_meeting_held'] / close_rate if close_rate > 0 else 0
-            
-        elif input_type == "CPA":  # Cost per Appointment (scheduled meeting)
-            # Start from CPA and work backwards/forwards
-            costs['cost_per_meeting_scheduled'] = input_value
-            costs['cost_per_meeting_held'] = input_value / show_up_rate if show_up_rate > 0 else 0
-            costs['cost_per_sale'] = costs['cost_per_meeting_held'] / close_rate if close_rate > 0 else 0
-            
-            # Work backwards to leads
-            costs['cost_per_contact'] = input_value * meeting_rate
-            costs['cost_per_lead'] = costs['cost_per_contact'] * contact_rate
-            
-        elif input_type == "Total Budget":
-            # Distribute budget across expected leads
-            if leads > 0:
-                costs['cost_per_lead'] = input_value / leads
-                costs['cost_per_contact'] = costs['cost_per_lead'] / contact_rate if contact_rate > 0 else 0
-                costs['cost_per_meeting_scheduled'] = costs['cost_per_contact'] / meeting_rate if meeting_rate > 0 else 0
-                costs['cost_per_meeting_held'] = costs['cost_per_meeting_scheduled'] / show_up_rate if show_up_rate > 0 else 0
-                costs['cost_per_sale'] = costs['cost_per_meeting_held'] / close_rate if close_rate > 0 else 0
-            else:
-                # Default to zero if no leads
-                for key in ['cost_per_lead', 'cost_per_contact', 'cost_per_meeting_scheduled', 'cost_per_meeting_held', 'cost_per_sale']:
-                    costs[key] = 0
-        
-        # Calculate derived metrics
-        costs['marketing_cac'] = costs.get('cost_per_sale', 0)
-        costs['total_marketing_spend'] = costs.get('cost_per_lead', 0) * leads
-        costs['cost_per_meeting'] = costs.get('cost_per_meeting_held', 0)  # For backward compatibility
+        Memoized in-process on the scalar inputs, so unrelated volume keys
+        never enter the cache key. Use from_volume_dict to pass a volume dict.
+        """
+        return dict(_acquisition_costs(input_type, input_value, contact_rate, meeting_rate,
+                                       show_up_rate, close_rate, leads, avg_deal_value))
+    
+    @staticmethod
+    def from_volume_dict(input_type: str,
+                         input_value: float,
+                         volume: Dict[str, float]) -> Dict[str, float]:
+        """Acquisition costs from a volume dict (missing keys use the defaults)"""
+        return ImprovedCostCalculator.calculate_acquisition_costs(
+            input_type, input_value,
+            contact_rate=volume.get('contact_rate', 0.6),
+            meeting_rate=volume.get('meeting_rate', 0.35),
+            show_up_rate=volume.get('show_up_rate', 0.75),
+            close_rate=volume.get('close_rate', 0.25),
+            leads=volume.get('leads', 0),
+            avg_deal_value=volume.get('avg_deal_value', 20000)
+        )
+    
+    @staticmethod
+    def calculate_acquisition_costs_batch(input_type: str,
+                                          input_values: np.ndarray,
+                                          volume: Dict[str, float]) -> np.ndarray:
+        """
+        Stage costs for many input values at once (budget sweeps, scenarios)
         
-        # Calculate efficiency metrics
-        if leads > 0 and costs.get('cost_per_lead', 0) > 0:
-            expected_contacts = leads * contact_rate
-            expected_meetings_scheduled = expected_contacts * meeting_rate
-            expected_meetings_held = expected_meetings_scheduled * show_up_rate
-            expected_sales = expected_meetings_held * close_rate
-            
-            costs['expected_contacts'] = expected_contacts
-            costs['expected_meetings_scheduled'] = expected_meetings_scheduled
-            costs['expected_meetings_held'] = expected_meetings_held
-            costs['expected_sales'] = expected_sales
-            costs['total_expected_revenue'] = expected_sales * volume.get('avg_deal_value', 20000)
-            
-            # No-show cost (wasted meetings)
-            no_shows = expected_meetings_scheduled * (1 - show_up_rate)
-            costs['no_show_cost'] = no_shows * costs.get('cost_per_meeting_scheduled', 0)
-            costs['no_show_rate'] = 1 - show_up_rate
+        Returns an (N, 5) matrix with columns in funnel order: cost per lead,
+        contact, meeting scheduled, meeting held and sale - the same values
+        from_volume_dict gives for each input on its own.
+        """
+        input_values = np.asarray(input_values, dtype=float).reshape(-1)
+        start = _INPUT_START_STAGE.get(input_type)
+        if start is None:
+            # Unknown input type prices nothing
+            return np.zeros((len(input_values), len(_COST_STAGES)))
+        
+        if input_type == "Total Budget":
+            leads = volume.get('leads', 0)
+            start_costs = input_values / leads if leads > 0 else np.zeros_like(input_values)
+        else:
+            start_costs = input_values
         
-        return costs
+        rates = np.array([volume.get('contact_rate', 0.6), volume.get('meeting_rate', 0.35),
+                          volume.get('show_up_rate', 0.75), volume.get('close_rate', 0.25)], dtype=float)
+        return start_costs[:, None] * _stage_multipliers(start, rates)[None, :]
 
 
 class ImprovedCompensationCalculator:
@@ -108,6 +175,8 @@ class ImprovedCompensationCalculator:
             'annual_total': 0,
             'by_role': {}
         }
+        running_total_ote = 0
+        running_total_base = 0
         
         for role, data in roles.items():
             count = data.get('count', 0)
@@ -139,16 +208,16 @@ class ImprovedCompensationCalculator:
             total_compensation['monthly_base'] += role_comp['monthly_base']
             total_compensation['monthly_variable_target'] += role_comp['monthly_variable_target']
             total_compensation['monthly_total_target'] += role_comp['monthly_total']
+            running_total_ote += role_comp['total_ote']
+            running_total_base += role_comp['total_base']
         
         total_compensation['annual_base'] = total_compensation['monthly_base'] * 12
         total_compensation['annual_variable_target'] = total_compensation['monthly_variable_target'] * 12
         total_compensation['annual_total'] = total_compensation['monthly_total_target'] * 12
         
-        # Calculate weighted average base %
-        total_ote = sum(r['total_ote'] for r in total_compensation['by_role'].values())
-        if total_ote > 0:
-            weighted_base = sum(r['total_base'] for r in total_compensation['by_role'].values())
-            total_compensation['avg_base_pct'] = weighted_base / total_ote
+        # Calculate weighted average base % (totals accumulated in the role loop)
+        if running_total_ote > 0:
+            total_compensation['avg_base_pct'] = running_total_base / running_total_ote
             total_compensation['avg_variable_pct'] = 1 - total_compensation['avg_base_pct']
         else:
             total_compensation['avg_base_pct'] = 0.4
@@ -157,245 +226,191 @@ class ImprovedCompensationCalculator:
         return total_compensation
 
 
+# How total_projection is derived per line
+_PROJ_FLAT, _PROJ_SPLIT, _PROJ_GIVEN, _PROJ_NONE = 0, 1, 2, 3
+
+
+class _LineSpec(NamedTuple):
+    """Static layout of one P&L line (fixed_pct NaN = month-1 value over month-1 revenue)"""
+    category: str
+    subcategory: str
+    line_item: str
+    format: str
+    projection: int
+    fixed_pct: float
+
+
+# P&L layout - one entry per line item, in display order
+_NAN = float('nan')
+_PNL_LINES = (
+    _LineSpec('REVENUE', 'Sales', 'New Sales (Units)', 'units', _PROJ_FLAT, _NAN),
+    _LineSpec('REVENUE', 'Immediate Revenue', 'Immediate Collections (70%)', 'currency', _PROJ_FLAT, 0.7),
+    _LineSpec('REVENUE', 'Deferred Revenue', 'Deferred Collections (30%)', 'currency', _PROJ_SPLIT, 0.3),
+    _LineSpec('REVENUE', 'Total', 'GROSS REVENUE', 'currency_bold', _PROJ_GIVEN, 1.0),
+    _LineSpec('COGS', 'Direct Costs', 'Cost of Goods Sold', 'currency', _PROJ_FLAT, _NAN),
+    _LineSpec('GROSS PROFIT', '', 'GROSS PROFIT', 'currency_bold', _PROJ_SPLIT, _NAN),
+    _LineSpec('OPEX', 'Sales & Marketing', 'Lead Generation', 'currency', _PROJ_FLAT, _NAN),
+    _LineSpec('OPEX', 'Sales & Marketing', 'Sales Commissions', 'currency', _PROJ_FLAT, _NAN),
+    _LineSpec('OPEX', 'Sales & Marketing', 'Base Salaries - Sales', 'currency', _PROJ_FLAT, _NAN),
+    _LineSpec('OPEX', 'G&A', 'Office Rent', 'currency', _PROJ_FLAT, _NAN),
+    _LineSpec('OPEX', 'G&A', 'Software & Tools', 'currency', _PROJ_FLAT, _NAN),
+    _LineSpec('OPEX', 'G&A', 'Other OpEx', 'currency', _PROJ_FLAT, _NAN),
+    _LineSpec('OPEX', 'Total', 'TOTAL OPERATING EXPENSES', 'currency_bold', _PROJ_FLAT, _NAN),
+    _LineSpec('EBITDA', '', 'EBITDA (before fees)', 'currency_bold', _PROJ_SPLIT, _NAN),
+    _LineSpec('FEES', 'Government', 'Gov Fees ({:.0f}%)', 'currency', _PROJ_SPLIT, _NAN),
+    _LineSpec('NET INCOME', '', 'NET EBITDA', 'currency_bold', _PROJ_SPLIT, _NAN),
+    _LineSpec('MARGINS', '', 'EBITDA Margin %', 'percentage', _PROJ_NONE, _NAN),
+)
+
+# Column views of the layout, built once at import
+_PNL_CATEGORIES = np.array([line.category for line in _PNL_LINES], dtype=object)
+_PNL_SUBCATEGORIES = np.array([line.subcategory for line in _PNL_LINES], dtype=object)
+_PNL_LINE_ITEMS = np.array([line.line_item for line in _PNL_LINES], dtype=object)
+_PNL_FORMATS = np.array([line.format for line in _PNL_LINES], dtype=object)
+_PNL_PROJECTION = np.array([line.projection for line in _PNL_LINES])
+_PNL_FIXED_PCT = np.array([line.fixed_pct for line in _PNL_LINES])
+
+# Repeated label columns become Categoricals in DataFrame output (display order)
+_PNL_CATEGORICAL_DTYPES = {
+    column: pd.CategoricalDtype(list(dict.fromkeys(values)))
+    for column, values in (('category', _PNL_CATEGORIES),
+                           ('subcategory', _PNL_SUBCATEGORIES),
+                           ('format', _PNL_FORMATS))
+}
+_PNL_UNITS_LINE, _PNL_COGS_LINE, _PNL_GOV_FEES_LINE, _PNL_MARGIN_LINE = 0, 4, 14, 16
+
+# Months projected at the month-1 rate before deferred collections kick in
+_PRE_DEFERRAL_MONTHS = 17
+
+# Operating expense lines, in display order
+_OPEX_KEYS = ('marketing_costs', 'commissions', 'sales_base_salaries',
+              'office_rent', 'software', 'other_opex')
+
+
+def _detailed_pnl(revenue: Dict[str, float],
+                  costs: Dict[str, float],
+                  projection_months: int) -> Dict[str, np.ndarray]:
+    """
+    Detailed P&L columns (uncached)
+    
+    Line labels are static; only the numeric columns are computed per
+    call, as whole arrays.
+    """
+    monthly_sales = revenue.get('monthly_sales', 0)
+    immediate_revenue = revenue.get('immediate_revenue', 0)
+    deferred_revenue = revenue.get('deferred_revenue', 0)
+    cogs = costs.get('cogs', 0)
+    gov_fee_pct = costs.get('gov_fee_pct', 0.1)
+    (marketing_costs, commissions, sales_base_salaries,
+     office_rent, software, other_opex) = [costs.get(key, 0) for key in _OPEX_KEYS]
+    
+    # Month 1 has no deferred collections; they start at month 18
+    total_revenue_m1 = immediate_revenue
+    total_revenue_m18 = immediate_revenue + deferred_revenue
+    inv_rev_m1 = 1.0 / total_revenue_m1 if total_revenue_m1 > 0 else 0.0
+    inv_rev_m18 = 1.0 / total_revenue_m18 if total_revenue_m18 > 0 else 0.0
+    gross_profit_m1 = total_revenue_m1 - cogs
+    gross_profit_m18 = total_revenue_m18 - cogs
+    total_opex = (marketing_costs + commissions + sales_base_salaries
+                  + office_rent + software + other_opex)
+    ebitda_before_fees_m1 = gross_profit_m1 - total_opex
+    ebitda_before_fees_m18 = gross_profit_m18 - total_opex
+    gov_fees_m1 = total_revenue_m1 * gov_fee_pct
+    gov_fees_m18 = total_revenue_m18 * gov_fee_pct
+    net_ebitda_m1 = ebitda_before_fees_m1 - gov_fees_m1
+    net_ebitda_m18 = ebitda_before_fees_m18 - gov_fees_m18
+    
+    opex_lines = [-marketing_costs, -commissions, -sales_base_salaries,
+                  -office_rent, -software, -other_opex, -total_opex]
+    month_1 = np.array(
+        [monthly_sales, immediate_revenue, 0, total_revenue_m1, -cogs, gross_profit_m1,
+         *opex_lines, ebitda_before_fees_m1, -gov_fees_m1, net_ebitda_m1, net_ebitda_m1],
+        dtype=float
+    )
+    month_18 = np.array(
+        [monthly_sales, immediate_revenue, deferred_revenue, total_revenue_m18, -cogs, gross_profit_m18,
+         *opex_lines, ebitda_before_fees_m18, -gov_fees_m18, net_ebitda_m18, net_ebitda_m18],
+        dtype=float
+    )
+    
+    # Margin line is the net line over revenue (0 without revenue)
+    month_1[_PNL_MARGIN_LINE] = net_ebitda_m1 * inv_rev_m1
+    month_18[_PNL_MARGIN_LINE] = net_ebitda_m18 * inv_rev_m18
+    
+    # Flat lines repeat month 1; split lines run _PRE_DEFERRAL_MONTHS at the
+    # month-1 rate and the rest at the month-18 rate
+    flat = _PNL_PROJECTION == _PROJ_FLAT
+    deferred_months = max(0, projection_months - _PRE_DEFERRAL_MONTHS)
+    total_projection = (month_1 * np.where(flat, projection_months, _PRE_DEFERRAL_MONTHS)
+                        + month_18 * np.where(flat, 0, deferred_months))
+    total_projection[_PNL_PROJECTION == _PROJ_GIVEN] = revenue.get('total_projected', 0)
+    total_projection[_PNL_PROJECTION == _PROJ_NONE] = np.nan
+    
+    pct_of_revenue = np.where(np.isnan(_PNL_FIXED_PCT), month_1 * inv_rev_m1, _PNL_FIXED_PCT)
+    pct_of_revenue[_PNL_UNITS_LINE] = np.nan
+    pct_of_revenue[_PNL_GOV_FEES_LINE] = -gov_fee_pct
+    pct_of_revenue[_PNL_MARGIN_LINE] = month_1[_PNL_MARGIN_LINE]
+    
+    line_items = _PNL_LINE_ITEMS.copy()
+    line_items[_PNL_GOV_FEES_LINE] = line_items[_PNL_GOV_FEES_LINE].format(gov_fee_pct * 100)
+    
+    # COGS line only shows when there are direct costs
+    rows = np.ones(len(month_1), dtype=bool)
+    rows[_PNL_COGS_LINE] = cogs > 0
+    
+    # Monthly lines and ratios are stored as float32 (computed in float64,
+    # ~7 significant digits is plenty for display); multi-month totals can
+    # exceed float32's exact range, so total_projection stays float64
+    return {
+        'category': _PNL_CATEGORIES[rows],
+        'subcategory': _PNL_SUBCATEGORIES[rows],
+        'line_item': line_items[rows],
+        'month_1': month_1[rows].astype(np.float32),
+        'month_18': month_18[rows].astype(np.float32),
+        'total_projection': total_projection[rows],
+        'pct_of_revenue': pct_of_revenue[rows].astype(np.float32),
+        'format': _PNL_FORMATS[rows]
+    }
+
+
+@lru_cache(maxsize=256)
+def _detailed_pnl_cached(revenue_items: Tuple,
+                         cost_items: Tuple,
+                         projection_months: int) -> Dict[str, np.ndarray]:
+    """Detailed P&L keyed on frozen inputs (cached - read-only columns)"""
+    columns = _detailed_pnl(dict(revenue_items), dict(cost_items), projection_months)
+    for values in columns.values():
+        values.setflags(write=False)
+    return columns
+
+
 class ImprovedPnLCalculator:
     """Deep P&L analysis with proper categorization"""
     
     @staticmethod
-    @st.cache_data(ttl=300)
     def calculate_detailed_pnl(revenue: Dict[str, float],
                               costs: Dict[str, float],
-                              projection_months: int = 18) -> pd.DataFrame:
+                              projection_months: int = 18,
+                              as_dataframe: bool = False):
         """
         Create detailed P&L with proper categorization and projections
-        """
-        # Revenue section
-        pnl_items = []
-        
-        # Revenue breakdown
-        pnl_items.append({
-            'category': 'REVENUE',
-            'subcategory': 'Sales',
-            'line_item': 'New Sales (Units)',
-            'month_1': revenue.get('monthly_sales', 0),
-            'month_18': revenue.get('monthly_sales', 0),
-            'total_projection': revenue.get('monthly_sales', 0) * projection_months,
-            'pct_of_revenue': None,
-            'format': 'units'
-        })
-        
-        pnl_items.append({
-            'category': 'REVENUE',
-            'subcategory': 'Immediate Revenue',
-            'line_item': 'Immediate Collections (70%)',
-            'month_1': revenue.get('immediate_revenue', 0),
-            'month_18': revenue.get('immediate_revenue', 0),
-            'total_projection': revenue.get('immediate_revenue', 0) * projection_months,
-            'pct_of_revenue': 0.7,
-            'format': 'currency'
-        })
-        
-        pnl_items.append({
-            'category': 'REVENUE',
-            'subcategory': 'Deferred Revenue',
-            'line_item': 'Deferred Collections (30%)',
-            'month_1': 0,  # Nothing in month 1
-            'month_18': revenue.get('deferred_revenue', 0),  # Starts month 18
-            'total_projection': revenue.get('deferred_revenue', 0) * max(0, projection_months - 17),
-            'pct_of_revenue': 0.3,
-            'format': 'currency'
-        })
-        
-        total_revenue_m1 = revenue.get('immediate_revenue', 0)
-        total_revenue_m18 = revenue.get('immediate_revenue', 0) + revenue.get('deferred_revenue', 0)
         
-        pnl_items.append({
-            'category': 'REVENUE',
-            'subcategory': 'Total',
-            'line_item': 'GROSS REVENUE',
-            'month_1': total_revenue_m1,
-            'month_18': total_revenue_m18,
-            'total_projection': revenue.get('total_projected', 0),
-            'pct_of_revenue': 1.0,
-            'format': 'currency_bold'
-        })
-        
-        # COGS (if applicable)
-        cogs = costs.get('cogs', 0)
-        if cogs > 0:
-            pnl_items.append({
-                'category': 'COGS',
-                'subcategory': 'Direct Costs',
-                'line_item': 'Cost of Goods Sold',
-                'month_1': -cogs,
-                'month_18': -cogs,
-                'total_projection': -cogs * projection_months,
-                'pct_of_revenue': -cogs / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-                'format': 'currency'
-            })
-        
-        # Gross Profit
-        gross_profit_m1 = total_revenue_m1 - cogs
-        gross_profit_m18 = total_revenue_m18 - cogs
-        
-        pnl_items.append({
-            'category': 'GROSS PROFIT',
-            'subcategory': '',
-            'line_item': 'GROSS PROFIT',
-            'month_1': gross_profit_m1,
-            'month_18': gross_profit_m18,
-            'total_projection': (gross_profit_m1 * 17 + gross_profit_m18 * max(0, projection_months - 17)),
-            'pct_of_revenue': gross_profit_m1 / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency_bold'
-        })
-        
-        # Operating Expenses
-        # Sales & Marketing
-        pnl_items.append({
-            'category': 'OPEX',
-            'subcategory': 'Sales & Marketing',
-            'line_item': 'Lead Generation',
-            'month_1': -costs.get('marketing_costs', 0),
-            'month_18': -costs.get('marketing_costs', 0),
-            'total_projection': -costs.get('marketing_costs', 0) * projection_months,
-            'pct_of_revenue': -costs.get('marketing_costs', 0) / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency'
-        })
-        
-        pnl_items.append({
-            'category': 'OPEX',
-            'subcategory': 'Sales & Marketing',
-            'line_item': 'Sales Commissions',
-            'month_1': -costs.get('commissions', 0),
-            'month_18': -costs.get('commissions', 0),
-            'total_projection': -costs.get('commissions', 0) * projection_months,
-            'pct_of_revenue': -costs.get('commissions', 0) / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency'
-        })
-        
-        pnl_items.append({
-            'category': 'OPEX',
-            'subcategory': 'Sales & Marketing',
-            'line_item': 'Base Salaries - Sales',
-            'month_1': -costs.get('sales_base_salaries', 0),
-            'month_18': -costs.get('sales_base_salaries', 0),
-            'total_projection': -costs.get('sales_base_salaries', 0) * projection_months,
-            'pct_of_revenue': -costs.get('sales_base_salaries', 0) / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency'
-        })
-        
-        # G&A
-        pnl_items.append({
-            'category': 'OPEX',
-            'subcategory': 'G&A',
-            'line_item': 'Office Rent',
-            'month_1': -costs.get('office_rent', 0),
-            'month_18': -costs.get('office_rent', 0),
-            'total_projection': -costs.get('office_rent', 0) * projection_months,
-            'pct_of_revenue': -costs.get('office_rent', 0) / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency'
-        })
-        
-        pnl_items.append({
-            'category': 'OPEX',
-            'subcategory': 'G&A',
-            'line_item': 'Software & Tools',
-            'month_1': -costs.get('software', 0),
-            'month_18': -costs.get('software', 0),
-            'total_projection': -costs.get('software', 0) * projection_months,
-            'pct_of_revenue': -costs.get('software', 0) / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency'
-        })
-        
-        pnl_items.append({
-            'category': 'OPEX',
-            'subcategory': 'G&A',
-            'line_item': 'Other OpEx',
-            'month_1': -costs.get('other_opex', 0),
-            'month_18': -costs.get('other_opex', 0),
-            'total_projection': -costs.get('other_opex', 0) * projection_months,
-            'pct_of_revenue': -costs.get('other_opex', 0) / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency'
-        })
-        
-        # Total OpEx
-        total_opex = sum([
-            costs.get('marketing_costs', 0),
-            costs.get('commissions', 0),
-            costs.get('sales_base_salaries', 0),
-            costs.get('office_rent', 0),
-            costs.get('software', 0),
-            costs.get('other_opex', 0)
-        ])
-        
-        pnl_items.append({
-            'category': 'OPEX',
-            'subcategory': 'Total',
-            'line_item': 'TOTAL OPERATING EXPENSES',
-            'month_1': -total_opex,
-            'month_18': -total_opex,
-            'total_projection': -total_opex * projection_months,
-            'pct_of_revenue': -total_opex / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency_bold'
-        })
-        
-        # EBITDA before fees
-        ebitda_before_fees_m1 = gross_profit_m1 - total_opex
-        ebitda_before_fees_m18 = gross_profit_m18 - total_opex
-        
-        pnl_items.append({
-            'category': 'EBITDA',
-            'subcategory': '',
-            'line_item': 'EBITDA (before fees)',
-            'month_1': ebitda_before_fees_m1,
-            'month_18': ebitda_before_fees_m18,
-            'total_projection': ebitda_before_fees_m1 * 17 + ebitda_before_fees_m18 * max(0, projection_months - 17),
-            'pct_of_revenue': ebitda_before_fees_m1 / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency_bold'
-        })
-        
-        # Government Fees
-        gov_fees_m1 = total_revenue_m1 * costs.get('gov_fee_pct', 0.1)
-        gov_fees_m18 = total_revenue_m18 * costs.get('gov_fee_pct', 0.1)
-        
-        pnl_items.append({
-            'category': 'FEES',
-            'subcategory': 'Government',
-            'line_item': f"Gov Fees ({costs.get('gov_fee_pct', 0.1)*100:.0f}%)",
-            'month_1': -gov_fees_m1,
-            'month_18': -gov_fees_m18,
-            'total_projection': -(gov_fees_m1 * 17 + gov_fees_m18 * max(0, projection_months - 17)),
-            'pct_of_revenue': -costs.get('gov_fee_pct', 0.1),
-            'format': 'currency'
-        })
-        
-        # Net EBITDA
-        net_ebitda_m1 = ebitda_before_fees_m1 - gov_fees_m1
-        net_ebitda_m18 = ebitda_before_fees_m18 - gov_fees_m18
-        
-        pnl_items.append({
-            'category': 'NET INCOME',
-            'subcategory': '',
-            'line_item': 'NET EBITDA',
-            'month_1': net_ebitda_m1,
-            'month_18': net_ebitda_m18,
-            'total_projection': net_ebitda_m1 * 17 + net_ebitda_m18 * max(0, projection_months - 17),
-            'pct_of_revenue': net_ebitda_m1 / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'currency_bold'
-        })
-        
-        # Margin %
-        pnl_items.append({
-            'category': 'MARGINS',
-            'subcategory': '',
-            'line_item': 'EBITDA Margin %',
-            'month_1': net_ebitda_m1 / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'month_18': net_ebitda_m18 / total_revenue_m18 if total_revenue_m18 > 0 else 0,
-            'total_projection': None,
-            'pct_of_revenue': net_ebitda_m1 / total_revenue_m1 if total_revenue_m1 > 0 else 0,
-            'format': 'percentage'
-        })
-        
-        return pd.DataFrame(pnl_items)
+        Memoized in-process on the frozen revenue/cost items. Returns a dict
+        of NumPy columns (category, subcategory, line_item, month_1,
+        month_18, total_projection, pct_of_revenue, format) so totals and
+        charts can skip pandas; pass as_dataframe=True for a DataFrame with
+        category, subcategory and format as Categoricals.
+        """
+        try:
+            columns = _detailed_pnl_cached(
+                tuple(sorted(revenue.items())), tuple(sorted(costs.items())), projection_months
+            )
+        except TypeError:
+            # Unhashable inputs - compute directly
+            columns = _detailed_pnl(revenue, costs, projection_months)
+        if as_dataframe:
+            return pd.DataFrame(columns).astype(_PNL_CATEGORICAL_DTYPES)
+        return dict(columns)
 
 
 class ImprovedReverseEngineering:
@@ -435,9 +450,13 @@ class ImprovedReverseEngineering:
                 meeting_rate = current_metrics.get('meeting_rate', 0.35)
                 contact_rate = current_metrics.get('contact_rate', 0.6)
                 
+                # Cumulative rates back up the funnel, so each stage is one division
+                close_meeting_rate = close_rate * meeting_rate
+                funnel_rate = close_meeting_rate * contact_rate
+                
                 additional_meetings = additional_sales / close_rate
-                additional_contacts = additional_meetings / meeting_rate
-                additional_leads = additional_contacts / contact_rate
+                additional_contacts = additional_sales / close_meeting_rate
+                additional_leads = additional_sales / funnel_rate
                 
                 results['required_changes'] = {
                     'additional_sales': additional_sales,
@@ -2,69 +2,84 @@
 Capacity Validator - Single source of truth for GTM → Team workload validation
 Extracts and enhances existing Tab 2 logic (lines 1564-1600)
 """
-import math
+from functools import lru_cache
+import numpy as np
+from .jit import njit
 
-def validate_capacity(gtm_channels, num_setters, num_closers, working_days=20,
-                      calls_per_lead=3, avg_call_mins=8, max_hours_per_day=6):
-    """
-    Calculate team workload from GTM channels and validate capacity.
+def _ceil_int(x):
+    """Ceiling as an int via floor division (no math.ceil round-trip)"""
+    return int(-(-x // 1))
 
-    Args:
-        gtm_channels: List of GTM channel configs
-        num_setters: Number of setters
-        num_closers: Number of closers
-        working_days: Working days per month
-        calls_per_lead: Sales cadence (call attempts per lead)
-        avg_call_mins: Average call duration
-        max_hours_per_day: Productive hours available per day
 
-    Returns:
-        dict: Workload metrics, capacity status, warnings, and fix suggestions
-    """
+# Status codes returned by _capacity_math, and the utilization % each code
+# starts above (WARNING, CRITICAL)
+_STATUS_NAMES = ('HEALTHY', 'WARNING', 'CRITICAL')
+_SETTER_THRESHOLDS = np.array([85.0, 100.0])
+_CLOSER_THRESHOLDS = np.array([75.0, 90.0])
+
 
-    # 1. Calculate from GTM channels (existing Tab 2 logic)
-    total_leads, total_contacts, total_meetings = 0, 0, 0
-    for ch in gtm_channels:
-        if ch.get('enabled', True):
-            leads = ch.get('monthly_leads', 0)
-            contact_rate = ch.get('contact_rate', 0.6)
-            meeting_rate = ch.get('meeting_rate', 0.3)
-            contacts = leads * contact_rate
-            meetings = contacts * meeting_rate
-            total_leads += leads
-            total_contacts += contacts
-            total_meetings += meetings
+@njit(cache=True)
+def _capacity_math(total_leads, total_contacts, total_meetings, num_setters, num_closers,
+                   working_days, calls_per_lead, avg_call_mins, max_hours_per_day):
+    """
+    Scalar workload math for validate_capacity (Numba-compiled when available).
 
+    Returns per-setter/closer metrics plus status codes indexing _STATUS_NAMES.
+    """
     # 2. Daily per-setter metrics
-    daily_leads_per_setter = (total_leads / working_days / num_setters) if num_setters > 0 else 0
-    daily_contacts_per_setter = (total_contacts / working_days / num_setters) if num_setters > 0 else 0
-    daily_meetings_per_setter = (total_meetings / working_days / num_setters) if num_setters > 0 else 0
+    daily_leads_per_setter = (total_leads / working_days / num_setters) if num_setters > 0 else 0.0
+    daily_contacts_per_setter = (total_contacts / working_days / num_setters) if num_setters > 0 else 0.0
+    daily_meetings_per_setter = (total_meetings / working_days / num_setters) if num_setters > 0 else 0.0
 
     # 3. Call volume with cadence
     daily_calls_per_setter = daily_leads_per_setter * calls_per_lead
     daily_call_hours_per_setter = (daily_calls_per_setter * avg_call_mins) / 60
 
     # 4. Setter capacity validation
-    setter_capacity_pct = (daily_call_hours_per_setter / max_hours_per_day) * 100 if max_hours_per_day > 0 else 0
+    setter_capacity_pct = (daily_call_hours_per_setter / max_hours_per_day) * 100 if max_hours_per_day > 0 else 0.0
 
-    if setter_capacity_pct > 100:
-        setter_status = 'CRITICAL'
-    elif setter_capacity_pct > 85:
-        setter_status = 'WARNING'
-    else:
-        setter_status = 'HEALTHY'
+    # side='left' keeps the bands strict: exactly 100% is still WARNING
+    setter_code = np.searchsorted(_SETTER_THRESHOLDS, setter_capacity_pct, side='left')
 
     # 5. Closer capacity validation
-    daily_meetings_per_closer = (total_meetings / working_days / num_closers) if num_closers > 0 else 0
+    daily_meetings_per_closer = (total_meetings / working_days / num_closers) if num_closers > 0 else 0.0
     closer_capacity = num_closers * 3 * working_days  # 3 meetings/day capacity
-    closer_utilization_pct = (total_meetings / closer_capacity * 100) if closer_capacity > 0 else 0
-
-    if closer_utilization_pct > 90:
-        closer_status = 'CRITICAL'
-    elif closer_utilization_pct > 75:
-        closer_status = 'WARNING'
-    else:
-        closer_status = 'HEALTHY'
+    closer_utilization_pct = (total_meetings / closer_capacity * 100) if closer_capacity > 0 else 0.0
+
+    closer_code = np.searchsorted(_CLOSER_THRESHOLDS, closer_utilization_pct, side='left')
+
+    return (daily_leads_per_setter, daily_contacts_per_setter, daily_meetings_per_setter,
+            daily_calls_per_setter, daily_call_hours_per_setter, setter_capacity_pct, setter_code,
+            daily_meetings_per_closer, closer_utilization_pct, closer_code)
+
+
+def _validate_capacity(gtm_channels, num_setters, num_closers, working_days,
+                       calls_per_lead, avg_call_mins, max_hours_per_day):
+    """Workload and capacity report for validate_capacity (uncached)"""
+
+    # 1. Calculate from GTM channels (existing Tab 2 logic), one column per field
+    channels = np.array([
+        (ch.get('monthly_leads', 0), ch.get('contact_rate', 0.6), ch.get('meeting_rate', 0.3),
+         ch.get('enabled', True), ch.get('cpl', 50))
+        for ch in gtm_channels
+    ], dtype=np.float64).reshape(-1, 5)
+    enabled = channels[:, 3].astype(bool)
+    leads = channels[:, 0] * enabled
+    contacts = leads * channels[:, 1]
+    meetings = contacts * channels[:, 2]
+    total_leads = float(leads.sum())
+    total_contacts = float(contacts.sum())
+    total_meetings = float(meetings.sum())
+
+    # 2-5. Per-seat workload and capacity status (numeric kernel)
+    (daily_leads_per_setter, daily_contacts_per_setter, daily_meetings_per_setter,
+     daily_calls_per_setter, daily_call_hours_per_setter, setter_capacity_pct, setter_code,
+     daily_meetings_per_closer, closer_utilization_pct, closer_code) = _capacity_math(
+        total_leads, total_contacts, total_meetings, float(num_setters), float(num_closers),
+        float(working_days), float(calls_per_lead), float(avg_call_mins), float(max_hours_per_day)
+    )
+    setter_status = _STATUS_NAMES[int(setter_code)]
+    closer_status = _STATUS_NAMES[int(closer_code)]
 
     # 6. Generate warnings and suggestions
     warnings = []
@@ -75,13 +90,13 @@ def validate_capacity(gtm_channels, num_setters, num_closers, working_days=20,
         warnings.append(f"🚨 Setters at {setter_capacity_pct:.0f}% capacity ({shortfall_pct:.0f}% over limit)")
 
         # Calculate fixes
-        setters_needed = math.ceil(num_setters * (setter_capacity_pct / 85))
+        setters_needed = _ceil_int(num_setters * (setter_capacity_pct / 85))
         additional_setters = setters_needed - num_setters
 
         # Marketing reduction option
         sustainable_leads = (total_leads / setter_capacity_pct) * 85
         leads_to_cut = total_leads - sustainable_leads
-        avg_cpl = sum(ch.get('cpl', 50) for ch in gtm_channels if ch.get('enabled', True)) / max(len([ch for ch in gtm_channels if ch.get('enabled', True)]), 1)
+        avg_cpl = float(channels[enabled, 4].mean()) if enabled.any() else 0
         marketing_reduction = leads_to_cut * avg_cpl
 
         suggestions.append(f"Hire {additional_setters} setter(s) - adds {additional_setters * max_hours_per_day * working_days:.0f}h/mo capacity")
@@ -90,7 +105,7 @@ def validate_capacity(gtm_channels, num_setters, num_closers, working_days=20,
 
     if closer_status == 'CRITICAL':
         warnings.append(f"🚨 Closers at {closer_utilization_pct:.0f}% capacity")
-        closers_needed = math.ceil(num_closers * (closer_utilization_pct / 75))
+        closers_needed = _ceil_int(num_closers * (closer_utilization_pct / 75))
         suggestions.append(f"Hire {closers_needed - num_closers} closer(s)")
 
     # Check for underutilization
@@ -98,7 +113,7 @@ def validate_capacity(gtm_channels, num_setters, num_closers, working_days=20,
         warnings.append(f"💡 Setters underutilized at {setter_capacity_pct:.0f}% - can handle {100/setter_capacity_pct:.1f}x current volume")
 
     if closer_utilization_pct < 50:
-        warnings.append(f"💡 Closers underutilized at {closer_utilization_pct:.0f}% - reduce to {math.ceil(num_closers * closer_utilization_pct / 65)} or increase marketing")
+        warnings.append(f"💡 Closers underutilized at {closer_utilization_pct:.0f}% - reduce to {_ceil_int(num_closers * closer_utilization_pct / 65)} or increase marketing")
 
     return {
         # Per-setter metrics
@@ -127,3 +142,47 @@ def validate_capacity(gtm_channels, num_setters, num_closers, working_days=20,
         'total_meetings_monthly': total_meetings,
         'total_calls_monthly': daily_calls_per_setter * num_setters * working_days,
     }
+
+
+@lru_cache(maxsize=256)
+def _validate_capacity_cached(channels_key, num_setters, num_closers, working_days,
+                              calls_per_lead, avg_call_mins, max_hours_per_day):
+    """Capacity report keyed on frozen channel items (cached - don't mutate)"""
+    return _validate_capacity([dict(items) for items in channels_key], num_setters, num_closers,
+                              working_days, calls_per_lead, avg_call_mins, max_hours_per_day)
+
+
+def validate_capacity(gtm_channels, num_setters, num_closers, working_days=20,
+                      calls_per_lead=3, avg_call_mins=8, max_hours_per_day=6):
+    """
+    Calculate team workload from GTM channels and validate capacity.
+
+    Args:
+        gtm_channels: List of GTM channel configs
+        num_setters: Number of setters
+        num_closers: Number of closers
+        working_days: Working days per month
+        calls_per_lead: Sales cadence (call attempts per lead)
+        avg_call_mins: Average call duration
+        max_hours_per_day: Productive hours available per day
+
+    Returns:
+        dict: Workload metrics, capacity status, warnings, and fix suggestions
+
+    Memoized in-process on the frozen channel configs and team inputs, so
+    Streamlit reruns that don't touch them skip the recomputation.
+    """
+    try:
+        channels_key = tuple(tuple(sorted(ch.items())) for ch in gtm_channels)
+        capacity = _validate_capacity_cached(channels_key, num_setters, num_closers, working_days,
+                                             calls_per_lead, avg_call_mins, max_hours_per_day)
+    except TypeError:
+        # Unhashable channel values - compute directly
+        return _validate_capacity(gtm_channels, num_setters, num_closers, working_days,
+                                  calls_per_lead, avg_call_mins, max_hours_per_day)
+
+    # Fresh alert lists so callers can't mutate the cached report
+    result = dict(capacity)
+    result['warnings'] = list(capacity['warnings'])
+    result['suggestions'] = list(capacity['suggestions'])
+    return result
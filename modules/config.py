@@ -1,86 +1,147 @@
 """
 Configuration module - Centralizes all default values and constants
 """
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, ClassVar, Final, Mapping
 
+import numpy as np
+
+# Model constants live at module scope (`from modules.config import CARRIER_RATE`);
+# ModelConfig re-exposes them as class attributes for existing callers
+
+# Compensation model defaults
+CARRIER_RATE: Final[float] = 0.027  # 2.7% carrier rate
+CONTRACT_MONTHS: Final[int] = 300    # 25 years
+PCT_IMMEDIATE: Final[float] = 0.7    # 70% paid immediately
+PCT_DEFERRED: Final[float] = 0.3     # 30% paid at month 18
+DEFERRED_MONTH: Final[int] = 18      # When deferred payment arrives
+DEFAULT_PERSISTENCY: Final[float] = 0.9  # 90% persistency rate
+
+# Team structure defaults
+DEFAULT_CLOSER_BASE: Final[int] = 5000
+DEFAULT_SETTER_BASE: Final[int] = 3000
+DEFAULT_BENCH_BASE: Final[int] = 3000
+DEFAULT_MANAGER_BASE: Final[int] = 15000
+
+# Performance defaults
+DEFAULT_MEETINGS_PER_CLOSER: Final[int] = 15  # Monthly
+DEFAULT_CONTACTS_PER_SETTER: Final[int] = 30  # Daily
+DEFAULT_RAMP_TIME_MONTHS: Final[int] = 3      # Time to full productivity
+
+# Commission structure
+DEFAULT_CLOSER_COMM_PCT: Final[float] = 0.20  # 20% to closers pool
+DEFAULT_SETTER_OF_CLOSER: Final[float] = 0.15  # 15% of closer commission
+DEFAULT_SPEED_BONUS: Final[float] = 0.10      # 10% for speed
+DEFAULT_FOLLOWUP_BONUS: Final[float] = 0.05   # 5% for followup
+
+# Funnel benchmarks
+CONTACT_RATE_MIN: Final[float] = 0.40
+CONTACT_RATE_MAX: Final[float] = 0.80
+MEETING_RATE_MIN: Final[float] = 0.20
+MEETING_RATE_MAX: Final[float] = 0.50
+CLOSE_RATE_MIN: Final[float] = 0.15
+CLOSE_RATE_MAX: Final[float] = 0.35
+
+# Financial health metrics
+MIN_LTV_CAC_RATIO: Final[float] = 3.0
+TARGET_LTV_CAC_RATIO: Final[float] = 5.0
+MIN_GROSS_MARGIN: Final[float] = 0.70
+TARGET_EBITDA_MARGIN: Final[float] = 0.25
+
+# Pipeline coverage ratios
+CONSERVATIVE_PIPELINE_COVERAGE: Final[float] = 3.0
+STANDARD_PIPELINE_COVERAGE: Final[float] = 4.0
+AGGRESSIVE_PIPELINE_COVERAGE: Final[float] = 5.0
+
+# Attainment tiers: (min, max, multiplier, name), contiguous and sorted
+_ATTAINMENT_TIERS = (
+    (0.0, 0.40, 0.6, 'Below Threshold'),
+    (0.40, 0.70, 0.8, 'Developing'),
+    (0.70, 1.00, 1.0, 'At Target'),
+    (1.00, 1.50, 1.2, 'Exceeding'),
+    (1.50, 10.0, 1.6, 'Overachieving'),
+)
+
+# Tier bounds for bisect; attainment outside every tier gets 1.0
+_TIER_BOUNDS = (_ATTAINMENT_TIERS[0][0],) + tuple(tier[1] for tier in _ATTAINMENT_TIERS)
+_TIER_MULTIPLIERS = (1.0,) + tuple(tier[2] for tier in _ATTAINMENT_TIERS) + (1.0,)
+
+# Sales cycle stages (in days)
+_SALES_CYCLE_STAGES = (
+    ('discovery', 2),
+    ('qualification', 3),
+    ('evaluation', 7),
+    ('negotiation', 5),
+    ('closing', 3),
+)
+_SALES_CYCLE_DAYS = sum(days for _, days in _SALES_CYCLE_STAGES)
+
+
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Core model configuration with defaults"""
     
     # Compensation model defaults
-    CARRIER_RATE: float = 0.027  # 2.7% carrier rate
-    CONTRACT_MONTHS: int = 300    # 25 years
-    PCT_IMMEDIATE: float = 0.7    # 70% paid immediately
-    PCT_DEFERRED: float = 0.3     # 30% paid at month 18
-    DEFERRED_MONTH: int = 18      # When deferred payment arrives
-    DEFAULT_PERSISTENCY: float = 0.9  # 90% persistency rate
+    CARRIER_RATE: ClassVar[float] = CARRIER_RATE
+    CONTRACT_MONTHS: ClassVar[int] = CONTRACT_MONTHS
+    PCT_IMMEDIATE: ClassVar[float] = PCT_IMMEDIATE
+    PCT_DEFERRED: ClassVar[float] = PCT_DEFERRED
+    DEFERRED_MONTH: ClassVar[int] = DEFERRED_MONTH
+    DEFAULT_PERSISTENCY: ClassVar[float] = DEFAULT_PERSISTENCY
     
     # Team structure defaults
-    DEFAULT_CLOSER_BASE: int = 5000
-    DEFAULT_SETTER_BASE: int = 3000
-    DEFAULT_BENCH_BASE: int = 3000
-    DEFAULT_MANAGER_BASE: int = 15000
+    DEFAULT_CLOSER_BASE: ClassVar[int] = DEFAULT_CLOSER_BASE
+    DEFAULT_SETTER_BASE: ClassVar[int] = DEFAULT_SETTER_BASE
+    DEFAULT_BENCH_BASE: ClassVar[int] = DEFAULT_BENCH_BASE
+    DEFAULT_MANAGER_BASE: ClassVar[int] = DEFAULT_MANAGER_BASE
     
     # Performance defaults
-    DEFAULT_MEETINGS_PER_CLOSER: int = 15  # Monthly
-    DEFAULT_CONTACTS_PER_SETTER: int = 30  # Daily
-    DEFAULT_RAMP_TIME_MONTHS: int = 3      # Time to full productivity
+    DEFAULT_MEETINGS_PER_CLOSER: ClassVar[int] = DEFAULT_MEETINGS_PER_CLOSER
+    DEFAULT_CONTACTS_PER_SETTER: ClassVar[int] = DEFAULT_CONTACTS_PER_SETTER
+    DEFAULT_RAMP_TIME_MONTHS: ClassVar[int] = DEFAULT_RAMP_TIME_MONTHS
     
     # Commission structure
-    DEFAULT_CLOSER_COMM_PCT: float = 0.20  # 20% to closers pool
-    DEFAULT_SETTER_OF_CLOSER: float = 0.15  # 15% of closer commission
-    DEFAULT_SPEED_BONUS: float = 0.10      # 10% for speed
-    DEFAULT_FOLLOWUP_BONUS: float = 0.05   # 5% for followup
+    DEFAULT_CLOSER_COMM_PCT: ClassVar[float] = DEFAULT_CLOSER_COMM_PCT
+    DEFAULT_SETTER_OF_CLOSER: ClassVar[float] = DEFAULT_SETTER_OF_CLOSER
+    DEFAULT_SPEED_BONUS: ClassVar[float] = DEFAULT_SPEED_BONUS
+    DEFAULT_FOLLOWUP_BONUS: ClassVar[float] = DEFAULT_FOLLOWUP_BONUS
     
     # Funnel benchmarks
-    CONTACT_RATE_MIN: float = 0.40
-    CONTACT_RATE_MAX: float = 0.80
-    MEETING_RATE_MIN: float = 0.20
-    MEETING_RATE_MAX: float = 0.50
-    CLOSE_RATE_MIN: float = 0.15
-    CLOSE_RATE_MAX: float = 0.35
+    CONTACT_RATE_MIN: ClassVar[float] = CONTACT_RATE_MIN
+    CONTACT_RATE_MAX: ClassVar[float] = CONTACT_RATE_MAX
+    MEETING_RATE_MIN: ClassVar[float] = MEETING_RATE_MIN
+    MEETING_RATE_MAX: ClassVar[float] = MEETING_RATE_MAX
+    CLOSE_RATE_MIN: ClassVar[float] = CLOSE_RATE_MIN
+    CLOSE_RATE_MAX: ClassVar[float] = CLOSE_RATE_MAX
     
     # Financial health metrics
-    MIN_LTV_CAC_RATIO: float = 3.0
-    TARGET_LTV_CAC_RATIO: float = 5.0
-    MIN_GROSS_MARGIN: float = 0.70
-    TARGET_EBITDA_MARGIN: float = 0.25
+    MIN_LTV_CAC_RATIO: ClassVar[float] = MIN_LTV_CAC_RATIO
+    TARGET_LTV_CAC_RATIO: ClassVar[float] = TARGET_LTV_CAC_RATIO
+    MIN_GROSS_MARGIN: ClassVar[float] = MIN_GROSS_MARGIN
+    TARGET_EBITDA_MARGIN: ClassVar[float] = TARGET_EBITDA_MARGIN
     
     # Pipeline coverage ratios
-    CONSERVATIVE_PIPELINE_COVERAGE: float = 3.0
-    STANDARD_PIPELINE_COVERAGE: float = 4.0
-    AGGRESSIVE_PIPELINE_COVERAGE: float = 5.0
+    CONSERVATIVE_PIPELINE_COVERAGE: ClassVar[float] = CONSERVATIVE_PIPELINE_COVERAGE
+    STANDARD_PIPELINE_COVERAGE: ClassVar[float] = STANDARD_PIPELINE_COVERAGE
+    AGGRESSIVE_PIPELINE_COVERAGE: ClassVar[float] = AGGRESSIVE_PIPELINE_COVERAGE
     
-    def __init__(self):
-        # Attainment tiers
-        self.ATTAINMENT_TIERS = {
-            'tier_1': {'min': 0.0, 'max': 0.40, 'multiplier': 0.6, 'name': 'Below Threshold'},
-            'tier_2': {'min': 0.40, 'max': 0.70, 'multiplier': 0.8, 'name': 'Developing'},
-            'tier_3': {'min': 0.70, 'max': 1.00, 'multiplier': 1.0, 'name': 'At Target'},
-            'tier_4': {'min': 1.00, 'max': 1.50, 'multiplier': 1.2, 'name': 'Exceeding'},
-            'tier_5': {'min': 1.50, 'max': 10.0, 'multiplier': 1.6, 'name': 'Overachieving'}
-        }
-        
-        # Sales cycle stages (in days)
-        self.SALES_CYCLE_STAGES = {
-            'discovery': 2,
-            'qualification': 3,
-            'evaluation': 7,
-            'negotiation': 5,
-            'closing': 3
-        }
+    # Read-only views of the module-level tier and stage tables
+    ATTAINMENT_TIERS: ClassVar[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+        f'tier_{i}': MappingProxyType({'min': lo, 'max': hi, 'multiplier': mult, 'name': name})
+        for i, (lo, hi, mult, name) in enumerate(_ATTAINMENT_TIERS, start=1)
+    })
+    SALES_CYCLE_STAGES: ClassVar[Mapping[str, int]] = MappingProxyType(dict(_SALES_CYCLE_STAGES))
     
     @property
     def default_sales_cycle_days(self) -> int:
         """Total default sales cycle in days"""
-        return sum(self.SALES_CYCLE_STAGES.values())
+        return _SALES_CYCLE_DAYS
     
     def get_attainment_multiplier(self, attainment_pct: float) -> float:
         """Get multiplier based on attainment percentage"""
-        for tier in self.ATTAINMENT_TIERS.values():
-            if tier['min'] <= attainment_pct < tier['max']:
-                return tier['multiplier']
-        return 1.0
+        return _TIER_MULTIPLIERS[bisect_right(_TIER_BOUNDS, attainment_pct)]
     
     def get_ote_health(self, base: float, variable: float) -> Dict[str, Any]:
         """Calculate OTE health metrics"""
@@ -101,6 +162,30 @@ class ModelConfig:
             'health_score': health_score,
             'is_healthy': is_healthy
         }
+    
+    def get_ote_health_array(self, base: np.ndarray, variable: np.ndarray) -> Dict[str, np.ndarray]:
+        """Vectorized get_ote_health over arrays of (base, variable) pairs"""
+        base = np.asarray(base, dtype=float)
+        variable = np.asarray(variable, dtype=float)
+        total_ote = base + variable
+        
+        # One reciprocal per pair instead of two divisions; zero OTE gives 0%
+        positive = total_ote > 0
+        inv_total = np.divide(1.0, total_ote, out=np.zeros_like(total_ote), where=positive)
+        base_pct = base * inv_total
+        variable_pct = variable * inv_total
+        
+        is_healthy = (base_pct >= 0.3) & (base_pct <= 0.5)
+        
+        return {
+            'total_ote': total_ote,
+            'base': base,
+            'variable': variable,
+            'base_pct': base_pct,
+            'variable_pct': variable_pct,
+            'health_score': np.where(is_healthy, 'Healthy', 'Review Needed'),
+            'is_healthy': is_healthy
+        }
 
 # Singleton instance
 config = ModelConfig()
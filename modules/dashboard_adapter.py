@@ -4,18 +4,148 @@ Provides backward compatibility while using the new architecture
 """
 
 import streamlit as st
-from typing import Dict, List, Tuple
+import numpy as np
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
 from modules.models import (
     Channel, DealEconomics, TeamStructure, OperatingCosts,
-    RoleCompensation, CostMethod, Segment, CommissionPolicy
+    RoleCompensation, CostMethod, Segment, CommissionPolicy, PerPersonEarnings
 )
 from modules.engine import compute_gtm_aggregate
 from modules.engine_pnl import (
     calculate_unit_economics, calculate_commission_pools,
     calculate_pnl, calculate_per_person_earnings
 )
-from modules.state import hash_key
-import json
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# Every session key compute_business_metrics reads: deal, team counts/comp,
+# opex and working days. The cache never expires, so a key missing here
+# means edits to it never reach the dashboard.
+_SESSION_KEY_FIELDS = (
+    'avg_deal_value', 'upfront_payment_pct', 'grr_rate', 'government_cost_pct', 'commission_policy',
+    'contract_length_months', 'deferred_timing_months',
+    'num_closers_main', 'num_setters_main', 'num_managers_main', 'num_benchs_main',
+    'closer_base', 'closer_variable', 'closer_commission_pct',
+    'setter_base', 'setter_variable', 'setter_commission_pct',
+    'manager_base', 'manager_variable', 'manager_commission_pct',
+    'bench_base', 'bench_variable',
+    'office_rent', 'software_costs', 'other_opex',
+    'working_days'
+)
+
+# Channel fields the metrics read (including the breakdown labels), with their defaults
+_CHANNEL_KEY_FIELDS = (
+    ('id', None), ('name', None), ('segment', None),
+    ('enabled', True), ('monthly_leads', None), ('cpl', None),
+    ('cost_per_contact', None), ('cost_per_meeting', None), ('cost_per_sale', None),
+    ('monthly_budget', None), ('cost_method', None), ('contact_rate', None),
+    ('meeting_rate', None), ('show_up_rate', None), ('close_rate', None)
+)
+
+# Enum lookups by value - a dict miss is much cheaper than Enum's ValueError
+_COST_METHODS = {method.value: method for method in CostMethod}
+_SEGMENTS = {segment.value: segment for segment in Segment}
+
+# ============= METRICS BUNDLES =============
+# Results come back as NamedTuples: cheap to build, read by attribute.
+# _KeyAccess keeps metrics['ltv'] / .get() / dict(...) working while the
+# dashboard still indexes by string.
+
+class _KeyAccess:
+    """Read-only dict-style access by field name for NamedTuple bundles"""
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self._fields else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+    
+    def values(self) -> Tuple:
+        return tuple(self)
+    
+    def items(self):
+        return zip(self._fields, self)
+
+
+class _UnitEconomicsFields(NamedTuple):
+    ltv: float
+    cac: float
+    ltv_cac: float
+    payback_months: float
+    upfront_cash: float
+    deferred_cash: float
+
+
+class _CommissionsFields(NamedTuple):
+    closer_pool: float
+    setter_pool: float
+    manager_pool: float
+    total_commission: float
+    commission_base: float
+
+
+class _PnlFields(NamedTuple):
+    gross_revenue: float
+    gov_fees: float
+    net_revenue: float
+    team_base: float
+    commissions: float
+    cogs: float
+    gross_profit: float
+    gross_margin: float
+    marketing: float
+    opex: float
+    total_opex: float
+    ebitda: float
+    ebitda_margin: float
+
+
+class _MetricsFields(NamedTuple):
+    monthly_leads: float
+    monthly_contacts: float
+    monthly_meetings_scheduled: float
+    monthly_meetings_held: float
+    monthly_sales: float
+    monthly_revenue_immediate: float
+    total_marketing_spend: float
+    cost_per_sale: float
+    blended_close_rate: float
+    channels_breakdown: Mapping
+    unit_economics: 'UnitEconomicsBundle'
+    commissions: 'CommissionsBundle'
+    pnl: 'PnlBundle'
+    per_person: PerPersonEarnings
+    models: Optional[Mapping] = None
+
+
+class UnitEconomicsBundle(_KeyAccess, _UnitEconomicsFields):
+    __slots__ = ()
+
+
+class CommissionsBundle(_KeyAccess, _CommissionsFields):
+    __slots__ = ()
+
+
+class PnlBundle(_KeyAccess, _PnlFields):
+    __slots__ = ()
+
+
+class MetricsBundle(_KeyAccess, _MetricsFields):
+    """All business metrics for one session state"""
+    __slots__ = ()
 
 
 class DashboardAdapter:
@@ -40,44 +170,27 @@ class DashboardAdapter:
     @staticmethod
     def session_to_channels() -> List[Channel]:
         """Convert session state channels to Channel models"""
-        channels = []
-        
-        for ch_data in st.session_state.get('gtm_channels', []):
-            # Map cost method string to enum
-            cost_method_str = ch_data.get('cost_method', 'Cost per Lead')
-            try:
-                cost_method = CostMethod(cost_method_str)
-            except ValueError:
-                cost_method = CostMethod.CPL
-            
-            # Map segment
-            segment_str = ch_data.get('segment', 'SMB')
-            try:
-                segment = Segment(segment_str)
-            except ValueError:
-                segment = Segment.SMB
-            
-            channel = Channel(
+        # Unknown cost methods / segments fall back to CPL / SMB
+        return [
+            Channel(
                 id=ch_data.get('id', 'channel_1'),
                 name=ch_data.get('name', 'Channel'),
-                segment=segment,
+                segment=_SEGMENTS.get(ch_data.get('segment', 'SMB'), Segment.SMB),
                 enabled=ch_data.get('enabled', True),
                 monthly_leads=ch_data.get('monthly_leads', 0),
                 contact_rate=ch_data.get('contact_rate', 0.6),
                 meeting_rate=ch_data.get('meeting_rate', 0.3),
                 show_up_rate=ch_data.get('show_up_rate', 0.7),
                 close_rate=ch_data.get('close_rate', 0.25),
-                cost_method=cost_method,
+                cost_method=_COST_METHODS.get(ch_data.get('cost_method', 'Cost per Lead'), CostMethod.CPL),
                 cpl=ch_data.get('cpl'),
                 cost_per_contact=ch_data.get('cost_per_contact'),
                 cost_per_meeting=ch_data.get('cost_per_meeting'),
                 cost_per_sale=ch_data.get('cost_per_sale'),
                 monthly_budget=ch_data.get('monthly_budget')
             )
-            
-            channels.append(channel)
-        
-        return channels
+            for ch_data in st.session_state.get('gtm_channels', [])
+        ]
     
     @staticmethod
     def session_to_team_structure() -> TeamStructure:
@@ -119,13 +232,19 @@ class DashboardAdapter:
         )
     
     @staticmethod
-    @st.cache_data(ttl=300, show_spinner=False)
-    def compute_business_metrics(_cache_key: str) -> Dict:
+    @lru_cache(maxsize=32)
+    def compute_business_metrics(cache_key: Tuple, include_models: bool = False) -> 'MetricsBundle':
         """
         Compute all business metrics using the new engine.
-        Cached based on business state hash.
+        Cached in-process on the business state key - results are shared by
+        reference across every session, so no pickling on cache hits. The
+        breakdown and models come back as read-only mappings of tuples and
+        read-only arrays; the model instances themselves are shared too, so
+        model_copy() them before editing.
         
-        Returns dict with all calculated metrics for backward compatibility.
+        Returns a MetricsBundle; string indexing still works for backward
+        compatibility. The engine model instances are only attached when
+        include_models is set (see get_models).
         """
         # Convert session state to models
         deal = DashboardAdapter.session_to_deal_economics()
@@ -165,149 +284,111 @@ class DashboardAdapter:
             st.session_state.get('working_days', 20)
         )
         
-        # Build channels breakdown
-        channels_breakdown = []
-        for i, m in enumerate(per_channel):
-            channels_breakdown.append({
-                'name': channels[i].name,
-                'segment': channels[i].segment.value,
-                'leads': m.leads,
-                'sales': m.sales,
-                'revenue': m.revenue_upfront,
-                'spend': m.spend,
-                'cpa': m.cost_per_sale,
-                'roas': m.roas,
-                'close_rate': channels[i].close_rate
-            })
+        # Build channels breakdown as parallel columns (one array per field)
+        n = len(per_channel)
+        channels_breakdown = MappingProxyType({
+            'name': tuple(c.name for c in channels),
+            'segment': tuple(c.segment.value for c in channels),
+            'leads': np.fromiter((m.leads for m in per_channel), dtype=np.float64, count=n),
+            'sales': np.fromiter((m.sales for m in per_channel), dtype=np.float64, count=n),
+            'revenue': np.fromiter((m.revenue_upfront for m in per_channel), dtype=np.float64, count=n),
+            'spend': np.fromiter((m.spend for m in per_channel), dtype=np.float64, count=n),
+            'cpa': np.fromiter((m.cost_per_sale for m in per_channel), dtype=np.float64, count=n),
+            'roas': np.fromiter((m.roas for m in per_channel), dtype=np.float64, count=n),
+            'close_rate': np.fromiter((c.close_rate for c in channels), dtype=np.float64, count=n)
+        })
+        for column in channels_breakdown.values():
+            if isinstance(column, np.ndarray):
+                column.flags.writeable = False
         
-        # Return backward-compatible dict
-        return {
+        return MetricsBundle(
             # GTM metrics (flattened for compatibility)
-            'monthly_leads': gtm_total.leads,
-            'monthly_contacts': gtm_total.contacts,
-            'monthly_meetings_scheduled': gtm_total.meetings_scheduled,
-            'monthly_meetings_held': gtm_total.meetings_held,
-            'monthly_sales': gtm_total.sales,
-            'monthly_revenue_immediate': gtm_total.revenue_upfront,
-            'total_marketing_spend': gtm_total.spend,
-            'cost_per_sale': gtm_total.cost_per_sale,
-            'blended_close_rate': gtm_total.blended_close_rate,
+            monthly_leads=gtm_total.leads,
+            monthly_contacts=gtm_total.contacts,
+            monthly_meetings_scheduled=gtm_total.meetings_scheduled,
+            monthly_meetings_held=gtm_total.meetings_held,
+            monthly_sales=gtm_total.sales,
+            monthly_revenue_immediate=gtm_total.revenue_upfront,
+            total_marketing_spend=gtm_total.spend,
+            cost_per_sale=gtm_total.cost_per_sale,
+            blended_close_rate=gtm_total.blended_close_rate,
             
             # Per-channel breakdown
-            'channels_breakdown': channels_breakdown,
+            channels_breakdown=channels_breakdown,
             
-            # Unit economics
-            'unit_economics': {
-                'ltv': unit_econ.ltv,
-                'cac': unit_econ.cac,
-                'ltv_cac': unit_econ.ltv_cac_ratio,
-                'payback_months': unit_econ.payback_months,
-                'upfront_cash': unit_econ.upfront_cash,
-                'deferred_cash': unit_econ.deferred_cash
-            },
+            unit_economics=UnitEconomicsBundle(
+                ltv=unit_econ.ltv,
+                cac=unit_econ.cac,
+                ltv_cac=unit_econ.ltv_cac_ratio,
+                payback_months=unit_econ.payback_months,
+                upfront_cash=unit_econ.upfront_cash,
+                deferred_cash=unit_econ.deferred_cash
+            ),
             
-            # Commissions
-            'commissions': {
-                'closer_pool': commissions.closer_pool,
-                'setter_pool': commissions.setter_pool,
-                'manager_pool': commissions.manager_pool,
-                'total_commission': commissions.total_commission,
-                'commission_base': commissions.commission_base
-            },
+            commissions=CommissionsBundle(
+                closer_pool=commissions.closer_pool,
+                setter_pool=commissions.setter_pool,
+                manager_pool=commissions.manager_pool,
+                total_commission=commissions.total_commission,
+                commission_base=commissions.commission_base
+            ),
             
-            # P&L
-            'pnl': {
-                'gross_revenue': pnl.gross_revenue,
-                'gov_fees': pnl.gov_fees,
-                'net_revenue': pnl.net_revenue,
-                'team_base': pnl.team_base,
-                'commissions': pnl.commissions,
-                'cogs': pnl.cogs,
-                'gross_profit': pnl.gross_profit,
-                'gross_margin': pnl.gross_margin,
-                'marketing': pnl.marketing,
-                'opex': pnl.opex,
-                'total_opex': pnl.total_opex,
-                'ebitda': pnl.ebitda,
-                'ebitda_margin': pnl.ebitda_margin
-            },
+            pnl=PnlBundle(
+                gross_revenue=pnl.gross_revenue,
+                gov_fees=pnl.gov_fees,
+                net_revenue=pnl.net_revenue,
+                team_base=pnl.team_base,
+                commissions=pnl.commissions,
+                cogs=pnl.cogs,
+                gross_profit=pnl.gross_profit,
+                gross_margin=pnl.gross_margin,
+                marketing=pnl.marketing,
+                opex=pnl.opex,
+                total_opex=pnl.total_opex,
+                ebitda=pnl.ebitda,
+                ebitda_margin=pnl.ebitda_margin
+            ),
             
             # Per-person earnings
-            'per_person': per_person,
+            per_person=per_person,
             
             # Original models (for advanced usage)
-            '_models': {
+            models=MappingProxyType({
                 'deal': deal,
-                'channels': channels,
+                'channels': tuple(channels),
                 'team': team,
                 'opex': opex,
                 'gtm_total': gtm_total,
-                'per_channel': per_channel
-            }
-        }
+                'per_channel': tuple(per_channel)
+            }) if include_models else None
+        )
+    
+    @staticmethod
+    def clear_cache():
+        """Drop cached metrics so the next access recomputes"""
+        global _last_sections
+        DashboardAdapter.compute_business_metrics.cache_clear()
+        _last_sections = (None, {})
     
     @staticmethod
-    def get_cache_key() -> str:
+    def get_cache_key() -> Tuple:
         """
         Generate cache key from current session state.
         Key changes when any relevant input changes, invalidating cache.
-        """
-        # For channels, extract only the fields that affect calculations
-        # This ensures changes are properly detected
-        channels_for_hash = []
-        for ch in st.session_state.get('gtm_channels', []):
-            channels_for_hash.append({
-                'id': ch.get('id'),
-                'enabled': ch.get('enabled', True),
-                'monthly_leads': ch.get('monthly_leads'),
-                'cpl': ch.get('cpl'),
-                'cost_per_contact': ch.get('cost_per_contact'),
-                'cost_per_meeting': ch.get('cost_per_meeting'),
-                'cost_per_sale': ch.get('cost_per_sale'),
-                'monthly_budget': ch.get('monthly_budget'),
-                'cost_method': ch.get('cost_method'),
-                'contact_rate': ch.get('contact_rate'),
-                'meeting_rate': ch.get('meeting_rate'),
-                'show_up_rate': ch.get('show_up_rate'),
-                'close_rate': ch.get('close_rate'),
-            })
         
-        relevant_state = {
-            'deal': {
-                'avg_deal_value': st.session_state.get('avg_deal_value'),
-                'upfront_pct': st.session_state.get('upfront_payment_pct'),
-                'grr': st.session_state.get('grr_rate'),
-                'gov_pct': st.session_state.get('government_cost_pct'),
-                'policy': st.session_state.get('commission_policy')
-            },
-            'channels': channels_for_hash,  # Use extracted fields
-            'team': {
-                'counts': [
-                    st.session_state.get('num_closers_main'),
-                    st.session_state.get('num_setters_main'),
-                    st.session_state.get('num_managers_main'),
-                    st.session_state.get('num_benchs_main')
-                ],
-                'comp': [
-                    st.session_state.get('closer_base'),
-                    st.session_state.get('closer_commission_pct'),
-                    st.session_state.get('setter_base'),
-                    st.session_state.get('setter_commission_pct'),
-                    st.session_state.get('manager_base'),
-                    st.session_state.get('manager_commission_pct')
-                ]
-            },
-            'opex': [
-                st.session_state.get('office_rent'),
-                st.session_state.get('software_costs'),
-                st.session_state.get('other_opex')
-            ]
-        }
-        
-        return hash_key(relevant_state)
+        The key is a flat tuple of the relevant values in a fixed order -
+        lru_cache hashes and compares it natively, no digest needed.
+        """
+        state = st.session_state
+        # For channels, only the fields that affect calculations
+        channels = tuple(
+            tuple([ch.get(key, default) for key, default in _CHANNEL_KEY_FIELDS])
+            for ch in state.get('gtm_channels', [])
+        )
+        return (tuple([state.get(key) for key in _SESSION_KEY_FIELDS]), channels)
     
     @staticmethod
-    def get_metrics() -> Dict:
+    def get_metrics() -> MetricsBundle:
         """
         Main entry point: Get all business metrics with caching.
         
@@ -318,40 +399,72 @@ class DashboardAdapter:
         """
         cache_key = DashboardAdapter.get_cache_key()
         return DashboardAdapter.compute_business_metrics(cache_key)
+    
+    @staticmethod
+    def get_models() -> Mapping:
+        """
+        Engine model instances behind the current metrics (advanced usage).
+        
+        Returns a read-only mapping with deal, channels, team, opex, gtm_total
+        and per_channel (tuples for the last two). Cached separately from
+        get_metrics so the common path doesn't carry the models around; the
+        instances are shared, so copy before editing.
+        """
+        cache_key = DashboardAdapter.get_cache_key()
+        return DashboardAdapter.compute_business_metrics(cache_key, include_models=True).models
 
 
 # Convenience functions for common operations
 
+_GTM_KEYS = (
+    'monthly_leads', 'monthly_contacts', 'monthly_meetings_scheduled', 'monthly_meetings_held',
+    'monthly_sales', 'monthly_revenue_immediate', 'total_marketing_spend', 'cost_per_sale',
+    'blended_close_rate', 'channels_breakdown'
+)
+
+# (cache key, sections) from the last metrics fetch - one tuple so
+# concurrent reruns never see a key paired with another key's sections
+_last_sections: Tuple = (None, {})
+
+
+def _metrics_section(section: str) -> Dict:
+    """
+    One section of the business metrics, sliced once per cache key.
+    
+    Pages that call several convenience functions fetch and slice the
+    metrics once instead of once per function.
+    """
+    global _last_sections
+    cache_key = DashboardAdapter.get_cache_key()
+    last_key, sections = _last_sections
+    if cache_key != last_key:
+        metrics = DashboardAdapter.compute_business_metrics(cache_key)
+        sections = {
+            'gtm': {key: metrics[key] for key in _GTM_KEYS},
+            'unit_economics': metrics['unit_economics'],
+            'pnl': metrics['pnl'],
+            'commissions': metrics['commissions']
+        }
+        _last_sections = (cache_key, sections)
+    # Shallow copy so callers can't overwrite the shared section
+    return dict(sections[section])
+
+
 def get_gtm_metrics() -> Dict:
     """Get GTM metrics only"""
-    metrics = DashboardAdapter.get_metrics()
-    return {
-        'monthly_leads': metrics['monthly_leads'],
-        'monthly_contacts': metrics['monthly_contacts'],
-        'monthly_meetings_scheduled': metrics['monthly_meetings_scheduled'],
-        'monthly_meetings_held': metrics['monthly_meetings_held'],
-        'monthly_sales': metrics['monthly_sales'],
-        'monthly_revenue_immediate': metrics['monthly_revenue_immediate'],
-        'total_marketing_spend': metrics['total_marketing_spend'],
-        'cost_per_sale': metrics['cost_per_sale'],
-        'blended_close_rate': metrics['blended_close_rate'],
-        'channels_breakdown': metrics['channels_breakdown']
-    }
+    return _metrics_section('gtm')
 
 
 def get_unit_economics() -> Dict:
     """Get unit economics only"""
-    metrics = DashboardAdapter.get_metrics()
-    return metrics['unit_economics']
+    return _metrics_section('unit_economics')
 
 
 def get_pnl() -> Dict:
     """Get P&L only"""
-    metrics = DashboardAdapter.get_metrics()
-    return metrics['pnl']
+    return _metrics_section('pnl')
 
 
 def get_commissions() -> Dict:
     """Get commissions only"""
-    metrics = DashboardAdapter.get_metrics()
-    return metrics['commissions']
+    return _metrics_section('commissions')
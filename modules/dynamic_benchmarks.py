@@ -1,188 +1,290 @@
 """
 Dynamic Benchmarks System - Industry standards that adapt to context
 """
-import pandas as pd
+import numpy as np
 from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from .jit import njit, NUMBA_AVAILABLE
+
+
+# Benchmark levels for higher-is-better metrics
+_RATIO_LEVELS = ('min', 'good', 'excellent')
+
+
+def _metric_multipliers(metrics: Tuple[str, ...],
+                        table: Dict[str, Dict[str, float]]) -> Dict[str, np.ndarray]:
+    """Per-context multiplier vectors aligned to metrics (missing metric = 1.0)"""
+    return {
+        context: np.array([mults.get(metric, 1.0) for metric in metrics])
+        for context, mults in table.items()
+    }
+
+
+# Funnel benchmarks: one row per metric, columns (min, good, excellent)
+_FUNNEL_METRICS = ('contact_rate', 'meeting_rate', 'show_up_rate', 'close_rate', 'onboard_rate')
+_FUNNEL_BASE = np.array([
+    [0.45, 0.60, 0.75],
+    [0.25, 0.35, 0.50],
+    [0.65, 0.75, 0.85],
+    [0.15, 0.25, 0.35],
+    [0.85, 0.95, 0.98]
+])
+_FUNNEL_CAPS = np.array([0.95, 0.98, 0.99])
+_FUNNEL_ONES = np.ones(len(_FUNNEL_METRICS))
+
+# Industry adjustments
+_FUNNEL_INDUSTRY_MULT = _metric_multipliers(_FUNNEL_METRICS, {
+    'insurance': {'contact_rate': 0.9, 'meeting_rate': 0.8, 'close_rate': 1.2},
+    'saas': {'contact_rate': 1.1, 'meeting_rate': 1.2, 'close_rate': 0.8},
+    'financial_services': {'contact_rate': 0.8, 'meeting_rate': 0.9, 'close_rate': 1.1},
+    'real_estate': {'contact_rate': 1.2, 'meeting_rate': 1.1, 'close_rate': 0.9}
+})
+
+# Company size adjustments
+_FUNNEL_SIZE_MULT = _metric_multipliers(_FUNNEL_METRICS, {
+    'startup': {'contact_rate': 1.1, 'meeting_rate': 1.1, 'close_rate': 0.9},
+    'small': {'contact_rate': 1.05, 'meeting_rate': 1.05, 'close_rate': 0.95},
+    'medium': {'contact_rate': 1.0, 'meeting_rate': 1.0, 'close_rate': 1.0},
+    'large': {'contact_rate': 0.95, 'meeting_rate': 0.95, 'close_rate': 1.05}
+})
+
+# Market maturity adjustments
+_FUNNEL_MATURITY_MULT = _metric_multipliers(_FUNNEL_METRICS, {
+    'new_market': {'contact_rate': 0.8, 'meeting_rate': 0.9, 'close_rate': 0.7},
+    'growing': {'contact_rate': 0.9, 'meeting_rate': 0.95, 'close_rate': 0.85},
+    'established': {'contact_rate': 1.0, 'meeting_rate': 1.0, 'close_rate': 1.0},
+    'saturated': {'contact_rate': 1.1, 'meeting_rate': 1.05, 'close_rate': 1.2}
+})
+
+# Cost benchmarks: one row per metric, columns (min, good, max)
+_COST_METRICS = ('cpl', 'cpc', 'cpm', 'cac')
+_COST_BASE = np.array([
+    [50, 150, 300],
+    [100, 250, 500],
+    [300, 600, 1200],
+    [1000, 3000, 6000]
+], dtype=float)
+_COST_LEVELS = ('min', 'good', 'max')
+_COST_ONES = np.ones(len(_COST_METRICS))
+
+# Industry cost adjustments (Mexico market)
+_COST_INDUSTRY_MULT = _metric_multipliers(_COST_METRICS, {
+    'insurance': {'cpl': 1.2, 'cac': 1.5},  # Higher regulation, longer cycles
+    'saas': {'cpl': 0.8, 'cac': 0.7},       # Digital-first, shorter cycles
+    'financial_services': {'cpl': 1.4, 'cac': 1.8},  # High regulation
+    'real_estate': {'cpl': 1.0, 'cac': 1.2}
+})
+
+# Lead source adjustments
+_COST_SOURCE_MULT = _metric_multipliers(_COST_METRICS, {
+    'digital': {'cpl': 1.0, 'cac': 1.0},
+    'referral': {'cpl': 0.3, 'cac': 0.5},   # Much cheaper
+    'cold_outbound': {'cpl': 1.5, 'cac': 1.8},  # More expensive
+    'events': {'cpl': 2.0, 'cac': 1.2}      # High CPL, better conversion
+})
+
+# Geography adjustments (relative to Mexico City), same for every metric
+_COST_GEO_MULT = {
+    'mexico': 1.0,
+    'usa': 3.5,
+    'colombia': 0.7,
+    'argentina': 0.8
+}
+
+# Financial benchmarks: one row per metric, columns (min, good, excellent)
+_FINANCIAL_METRICS = ('ltv_cac_ratio', 'ebitda_margin', 'gross_margin', 'payback_months')
+_FINANCIAL_BASE = np.array([
+    [3.0, 5.0, 8.0],
+    [0.15, 0.25, 0.40],
+    [0.60, 0.75, 0.85],
+    [18, 12, 6]  # Payback: lower is better, so 'min' is the longest acceptable
+])
+_FINANCIAL_ONES = np.ones(len(_FINANCIAL_METRICS))
+
+# Industry adjustments
+_FINANCIAL_INDUSTRY_MULT = _metric_multipliers(_FINANCIAL_METRICS, {
+    'insurance': {
+        'ltv_cac_ratio': 1.2,  # Higher LTV due to long contracts
+        'ebitda_margin': 0.9,  # Lower due to regulation
+        'payback_months': 1.5  # Longer due to deferred payments
+    },
+    'saas': {
+        'ltv_cac_ratio': 1.0,
+        'ebitda_margin': 1.1,
+        'payback_months': 0.8
+    }
+})
+
+# Business model adjustments
+_FINANCIAL_MODEL_MULT = _metric_multipliers(_FINANCIAL_METRICS, {
+    'recurring': {
+        'ltv_cac_ratio': 1.3,  # Higher LTV
+        'payback_months': 1.2  # Longer payback acceptable
+    },
+    'transactional': {
+        'ltv_cac_ratio': 0.7,
+        'payback_months': 0.6
+    }
+})
+
+
+def _benchmark_dict(metrics: Tuple[str, ...],
+                    levels: Tuple[str, ...],
+                    values: np.ndarray,
+                    context: str) -> Dict[str, Dict]:
+    """Nest a (metric x level) benchmark matrix back into per-metric dicts"""
+    return {
+        metric: {**dict(zip(levels, row)), 'context': context}
+        for metric, row in zip(metrics, values.tolist())
+    }
+
+
+@njit(cache=True, fastmath=True)
+def _funnel_mults_core(base, ind, size, mat, caps):
+    """Compiled kernel: scale each metric row by its multipliers, cap per level"""
+    out = np.empty_like(base)
+    for i in range(base.shape[0]):
+        mult = ind[i] * size[i] * mat[i]
+        for j in range(base.shape[1]):
+            out[i, j] = min(base[i, j] * mult, caps[j])
+    return out
+
+
+def _apply_funnel_mults(ind: np.ndarray, size: np.ndarray, mat: np.ndarray) -> np.ndarray:
+    """Funnel benchmark matrix scaled by the combined multipliers and capped"""
+    if NUMBA_AVAILABLE:
+        return _funnel_mults_core(_FUNNEL_BASE, ind, size, mat, _FUNNEL_CAPS)
+    
+    # Combined multiplier per metric, applied to every level and capped
+    return np.minimum(_FUNNEL_BASE * (ind * size * mat)[:, None], _FUNNEL_CAPS)
+
+
+@lru_cache(maxsize=64)
+def _funnel_benchmarks(industry: str, company_size: str, market_maturity: str) -> Dict[str, Dict]:
+    """Funnel benchmarks for one context (cached - don't mutate)"""
+    adjusted = _apply_funnel_mults(_FUNNEL_INDUSTRY_MULT.get(industry, _FUNNEL_ONES),
+                                   _FUNNEL_SIZE_MULT.get(company_size, _FUNNEL_ONES),
+                                   _FUNNEL_MATURITY_MULT.get(market_maturity, _FUNNEL_ONES))
+    
+    context = f"{industry.title()} | {company_size.title()} | {market_maturity.title()}"
+    return _benchmark_dict(_FUNNEL_METRICS, _RATIO_LEVELS, adjusted, context)
+
+
+@lru_cache(maxsize=64)
+def _cost_benchmarks(industry: str, lead_source: str, geography: str) -> Dict[str, Dict]:
+    """Cost benchmarks for one context (cached - don't mutate)"""
+    total_mult = (_COST_INDUSTRY_MULT.get(industry, _COST_ONES)
+                  * _COST_SOURCE_MULT.get(lead_source, _COST_ONES)
+                  * _COST_GEO_MULT.get(geography, 1.0))
+    adjusted = _COST_BASE * total_mult[:, None]
+    
+    context = f"{industry.title()} | {lead_source.title()} | {geography.title()}"
+    return _benchmark_dict(_COST_METRICS, _COST_LEVELS, adjusted, context)
+
+
+@lru_cache(maxsize=64)
+def _financial_benchmarks(industry: str, business_model: str) -> Dict[str, Dict]:
+    """Financial benchmarks for one context (cached - don't mutate)"""
+    # Payback scales the same way: a higher multiplier means a longer
+    # acceptable payback
+    adjusted = (_FINANCIAL_BASE
+                * _FINANCIAL_INDUSTRY_MULT.get(industry, _FINANCIAL_ONES)[:, None]
+                * _FINANCIAL_MODEL_MULT.get(business_model, _FINANCIAL_ONES)[:, None])
+    
+    context = f"{industry.title()} | {business_model.title()}"
+    return _benchmark_dict(_FINANCIAL_METRICS, _RATIO_LEVELS, adjusted, context)
+
+
+# Status tables indexed by classification: 0 = below standard .. 3 = excellent
+_STATUS_LABELS = np.array(["Below Standard", "Acceptable", "Good", "Excellent"])
+_STATUS_COLORS = np.array(["#F44336", "#FF9800", "#8BC34A", "#4CAF50"])
+_STATUS_EMOJIS = np.array(["🔴", "🟠", "🟡", "🟢"])
+
+
+def _classify(values: np.ndarray, levels: np.ndarray, higher_is_better: bool) -> np.ndarray:
+    """
+    Status index per value against (min, good, top) levels, without branching
+    
+    levels is (3,) or (N, 3). The first level that is met wins, checking from
+    the top down - the same ladder as the scalar comparisons, so reversed
+    scales (e.g. payback) classify as before.
+    """
+    values = np.asarray(values, dtype=float)
+    levels = np.asarray(levels, dtype=float)
+    min_level, good_level, top_level = levels[..., 0], levels[..., 1], levels[..., 2]
+    
+    if higher_is_better:
+        return np.where(values >= top_level, 3,
+                        np.where(values >= good_level, 2,
+                                 np.where(values >= min_level, 1, 0)))
+    return np.where(values <= min_level, 3,
+                    np.where(values <= good_level, 2,
+                             np.where(values <= top_level, 1, 0)))
+
+
+@lru_cache(maxsize=256)
+def _performance_status(actual_value: float,
+                        higher_is_better: bool,
+                        min_value: float,
+                        good_value: float,
+                        top_value: float) -> Tuple[str, str, str]:
+    """
+    Status, color and emoji keyed on scalar thresholds (cached)
+    
+    top_value is 'excellent' for ratio benchmarks and 'max' for cost ones.
+    """
+    idx = int(_classify(actual_value, (min_value, good_value, top_value), higher_is_better))
+    return str(_STATUS_LABELS[idx]), str(_STATUS_COLORS[idx]), str(_STATUS_EMOJIS[idx])
+
+
+def _copy_benchmarks(benchmarks: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Per-metric copies so callers can't mutate a cached table"""
+    return {metric: dict(levels) for metric, levels in benchmarks.items()}
+
 
 class DynamicBenchmarks:
     """Dynamic benchmarking system that adapts to industry, company size, and market conditions"""
     
+    # Lookup tables for classify_many() indices
+    STATUSES = _STATUS_LABELS
+    COLORS = _STATUS_COLORS
+    EMOJIS = _STATUS_EMOJIS
+    
     @staticmethod
     def get_funnel_benchmarks(industry: str = "insurance", 
                             company_size: str = "medium",
                             market_maturity: str = "established") -> Dict[str, Dict]:
         """
         Get dynamic funnel benchmarks based on context
-        """
-        base_benchmarks = {
-            'contact_rate': {'min': 0.45, 'good': 0.60, 'excellent': 0.75},
-            'meeting_rate': {'min': 0.25, 'good': 0.35, 'excellent': 0.50},
-            'show_up_rate': {'min': 0.65, 'good': 0.75, 'excellent': 0.85},
-            'close_rate': {'min': 0.15, 'good': 0.25, 'excellent': 0.35},
-            'onboard_rate': {'min': 0.85, 'good': 0.95, 'excellent': 0.98}
-        }
-        
-        # Industry adjustments
-        industry_multipliers = {
-            'insurance': {'contact_rate': 0.9, 'meeting_rate': 0.8, 'close_rate': 1.2},
-            'saas': {'contact_rate': 1.1, 'meeting_rate': 1.2, 'close_rate': 0.8},
-            'financial_services': {'contact_rate': 0.8, 'meeting_rate': 0.9, 'close_rate': 1.1},
-            'real_estate': {'contact_rate': 1.2, 'meeting_rate': 1.1, 'close_rate': 0.9}
-        }
-        
-        # Company size adjustments
-        size_multipliers = {
-            'startup': {'contact_rate': 1.1, 'meeting_rate': 1.1, 'close_rate': 0.9},
-            'small': {'contact_rate': 1.05, 'meeting_rate': 1.05, 'close_rate': 0.95},
-            'medium': {'contact_rate': 1.0, 'meeting_rate': 1.0, 'close_rate': 1.0},
-            'large': {'contact_rate': 0.95, 'meeting_rate': 0.95, 'close_rate': 1.05}
-        }
-        
-        # Market maturity adjustments
-        maturity_multipliers = {
-            'new_market': {'contact_rate': 0.8, 'meeting_rate': 0.9, 'close_rate': 0.7},
-            'growing': {'contact_rate': 0.9, 'meeting_rate': 0.95, 'close_rate': 0.85},
-            'established': {'contact_rate': 1.0, 'meeting_rate': 1.0, 'close_rate': 1.0},
-            'saturated': {'contact_rate': 1.1, 'meeting_rate': 1.05, 'close_rate': 1.2}
-        }
-        
-        # Apply adjustments
-        adjusted_benchmarks = {}
-        for metric, values in base_benchmarks.items():
-            industry_mult = industry_multipliers.get(industry, {}).get(metric, 1.0)
-            size_mult = size_multipliers.get(company_size, {}).get(metric, 1.0)
-            maturity_mult = maturity_multipliers.get(market_maturity, {}).get(metric, 1.0)
-            
-            total_mult = industry_mult * size_mult * maturity_mult
-            
-            adjusted_benchmarks[metric] = {
-                'min': min(values['min'] * total_mult, 0.95),
-                'good': min(values['good'] * total_mult, 0.98),
-                'excellent': min(values['excellent'] * total_mult, 0.99),
-                'context': f"{industry.title()} | {company_size.title()} | {market_maturity.title()}"
-            }
         
-        return adjusted_benchmarks
+        Memoized per context - the tables are pure functions of the three keys.
+        """
+        return _copy_benchmarks(_funnel_benchmarks(industry, company_size, market_maturity))
     
     @staticmethod
     def get_cost_benchmarks(industry: str = "insurance",
                           lead_source: str = "digital",
                           geography: str = "mexico") -> Dict[str, Dict]:
         """
-        Get dynamic cost benchmarks
+        Get dynamic cost benchmarks (memoized per context)
         """
-        base_costs = {
-            'cpl': {'min': 50, 'good': 150, 'max': 300},
-            'cpc': {'min': 100, 'good': 250, 'max': 500},
-            'cpm': {'min': 300, 'good': 600, 'max': 1200},
-            'cac': {'min': 1000, 'good': 3000, 'max': 6000}
-        }
-        
-        # Industry cost adjustments (Mexico market)
-        industry_multipliers = {
-            'insurance': {'cpl': 1.2, 'cac': 1.5},  # Higher regulation, longer cycles
-            'saas': {'cpl': 0.8, 'cac': 0.7},       # Digital-first, shorter cycles
-            'financial_services': {'cpl': 1.4, 'cac': 1.8},  # High regulation
-            'real_estate': {'cpl': 1.0, 'cac': 1.2}
-        }
-        
-        # Lead source adjustments
-        source_multipliers = {
-            'digital': {'cpl': 1.0, 'cac': 1.0},
-            'referral': {'cpl': 0.3, 'cac': 0.5},   # Much cheaper
-            'cold_outbound': {'cpl': 1.5, 'cac': 1.8},  # More expensive
-            'events': {'cpl': 2.0, 'cac': 1.2}      # High CPL, better conversion
-        }
-        
-        # Geography adjustments (relative to Mexico City)
-        geo_multipliers = {
-            'mexico': 1.0,
-            'usa': 3.5,
-            'colombia': 0.7,
-            'argentina': 0.8
-        }
-        
-        # Apply adjustments
-        adjusted_costs = {}
-        for metric, values in base_costs.items():
-            industry_mult = industry_multipliers.get(industry, {}).get(metric, 1.0)
-            source_mult = source_multipliers.get(lead_source, {}).get(metric, 1.0)
-            geo_mult = geo_multipliers.get(geography, 1.0)
-            
-            total_mult = industry_mult * source_mult * geo_mult
-            
-            adjusted_costs[metric] = {
-                'min': values['min'] * total_mult,
-                'good': values['good'] * total_mult,
-                'max': values['max'] * total_mult,
-                'context': f"{industry.title()} | {lead_source.title()} | {geography.title()}"
-            }
-        
-        return adjusted_costs
+        return _copy_benchmarks(_cost_benchmarks(industry, lead_source, geography))
     
     @staticmethod
     def get_financial_benchmarks(industry: str = "insurance",
                                business_model: str = "recurring") -> Dict[str, Dict]:
         """
-        Get dynamic financial benchmarks
+        Get dynamic financial benchmarks (memoized per context)
         """
-        base_metrics = {
-            'ltv_cac_ratio': {'min': 3.0, 'good': 5.0, 'excellent': 8.0},
-            'ebitda_margin': {'min': 0.15, 'good': 0.25, 'excellent': 0.40},
-            'gross_margin': {'min': 0.60, 'good': 0.75, 'excellent': 0.85},
-            'payback_months': {'min': 18, 'good': 12, 'excellent': 6}
-        }
-        
-        # Industry adjustments
-        industry_adjustments = {
-            'insurance': {
-                'ltv_cac_ratio': 1.2,  # Higher LTV due to long contracts
-                'ebitda_margin': 0.9,  # Lower due to regulation
-                'payback_months': 1.5  # Longer due to deferred payments
-            },
-            'saas': {
-                'ltv_cac_ratio': 1.0,
-                'ebitda_margin': 1.1,
-                'payback_months': 0.8
-            }
-        }
-        
-        # Business model adjustments
-        model_adjustments = {
-            'recurring': {
-                'ltv_cac_ratio': 1.3,  # Higher LTV
-                'payback_months': 1.2  # Longer payback acceptable
-            },
-            'transactional': {
-                'ltv_cac_ratio': 0.7,
-                'payback_months': 0.6
-            }
-        }
-        
-        # Apply adjustments
-        adjusted_metrics = {}
-        for metric, values in base_metrics.items():
-            industry_mult = industry_adjustments.get(industry, {}).get(metric, 1.0)
-            model_mult = model_adjustments.get(business_model, {}).get(metric, 1.0)
-            
-            if metric == 'payback_months':
-                # For payback, higher multiplier means longer acceptable time
-                adjusted_metrics[metric] = {
-                    'excellent': values['excellent'] * industry_mult * model_mult,
-                    'good': values['good'] * industry_mult * model_mult,
-                    'min': values['min'] * industry_mult * model_mult,
-                    'context': f"{industry.title()} | {business_model.title()}"
-                }
-            else:
-                # For ratios and margins, apply normally
-                adjusted_metrics[metric] = {
-                    'min': values['min'] * industry_mult * model_mult,
-                    'good': values['good'] * industry_mult * model_mult,
-                    'excellent': values['excellent'] * industry_mult * model_mult,
-                    'context': f"{industry.title()} | {business_model.title()}"
-                }
-        
-        return adjusted_metrics
+        return _copy_benchmarks(_financial_benchmarks(industry, business_model))
+    
+    @staticmethod
+    def clear_cache():
+        """Drop memoized benchmark tables and status lookups"""
+        _funnel_benchmarks.cache_clear()
+        _cost_benchmarks.cache_clear()
+        _financial_benchmarks.cache_clear()
+        _performance_status.cache_clear()
     
     @staticmethod
     def get_performance_status(actual_value: float, 
@@ -192,25 +294,24 @@ class DynamicBenchmarks:
         """
         # Handle both cost benchmarks (lower is better) and ratio benchmarks (higher is better)
         if 'excellent' in benchmark:
-            # For financial benchmarks (higher is better)
-            if actual_value >= benchmark['excellent']:
-                return "Excellent", "#4CAF50", "🟢"
-            elif actual_value >= benchmark['good']:
-                return "Good", "#8BC34A", "🟡"
-            elif actual_value >= benchmark['min']:
-                return "Acceptable", "#FF9800", "🟠"
-            else:
-                return "Below Standard", "#F44336", "🔴"
-        else:
-            # For cost benchmarks (lower is better)
-            if actual_value <= benchmark['min']:
-                return "Excellent", "#4CAF50", "🟢"
-            elif actual_value <= benchmark['good']:
-                return "Good", "#8BC34A", "🟡"
-            elif actual_value <= benchmark.get('max', benchmark['good'] * 2):
-                return "Acceptable", "#FF9800", "🟠"
-            else:
-                return "Below Standard", "#F44336", "🔴"
+            return _performance_status(actual_value, True, benchmark['min'],
+                                       benchmark['good'], benchmark['excellent'])
+        return _performance_status(actual_value, False, benchmark['min'], benchmark['good'],
+                                   benchmark.get('max', benchmark['good'] * 2))
+    
+    @staticmethod
+    def classify_many(values: np.ndarray,
+                      benchmarks: np.ndarray,
+                      higher_is_better: bool = True) -> np.ndarray:
+        """
+        Vectorized performance classification
+        
+        benchmarks holds (min, good, excellent) - or (min, good, max) for
+        costs with higher_is_better=False - either once for all values or as
+        one row per value. Returns status indices 0..3 into STATUSES /
+        COLORS / EMOJIS (0 = Below Standard, 3 = Excellent).
+        """
+        return _classify(values, benchmarks, higher_is_better)
     
     @staticmethod
     def calculate_benchmark_gaps(current_metrics: Dict[str, float],
@@ -218,43 +319,45 @@ class DynamicBenchmarks:
         """
         Calculate gaps between current performance and benchmarks
         """
-        gaps = {}
+        metrics = [metric for metric in current_metrics if metric in benchmarks]
+        if not metrics:
+            return {}
+        
+        # One row per metric: columns (min, good, excellent)
+        levels = np.array([[benchmarks[metric][level] for level in _RATIO_LEVELS]
+                           for metric in metrics], dtype=float)
+        currents = np.array([current_metrics[metric] for metric in metrics], dtype=float)
+        
+        # Calculate gaps to each benchmark level
+        level_gaps = levels - currents[:, None]
         
-        for metric, current_value in current_metrics.items():
-            if metric in benchmarks:
-                benchmark = benchmarks[metric]
-                
-                # Calculate gaps to each benchmark level
-                gap_to_min = benchmark['min'] - current_value
-                gap_to_good = benchmark['good'] - current_value
-                gap_to_excellent = benchmark['excellent'] - current_value
-                
-                # Determine next target
-                if current_value < benchmark['min']:
-                    next_target = 'min'
-                    gap_to_next = gap_to_min
-                elif current_value < benchmark['good']:
-                    next_target = 'good'
-                    gap_to_next = gap_to_good
-                else:
-                    next_target = 'excellent'
-                    gap_to_next = gap_to_excellent
-                
-                status, color, emoji = DynamicBenchmarks.get_performance_status(
-                    current_value, benchmark
-                )
-                
-                gaps[metric] = {
-                    'current': current_value,
-                    'status': status,
-                    'color': color,
-                    'emoji': emoji,
-                    'next_target': next_target,
-                    'gap_to_next': gap_to_next,
-                    'gap_to_min': gap_to_min,
-                    'gap_to_good': gap_to_good,
-                    'gap_to_excellent': gap_to_excellent,
-                    'benchmark': benchmark
-                }
+        # Next target: the first level the current value is still below
+        # (same ladder as before, so reversed scales like payback work too)
+        next_idx = np.where(currents < levels[:, 0], 0, np.where(currents < levels[:, 1], 1, 2))
+        gap_to_next = level_gaps[np.arange(len(metrics)), next_idx]
+        
+        # Status for every metric in one pass
+        status_idx = _classify(currents, levels, True)
+        statuses = _STATUS_LABELS[status_idx].tolist()
+        colors = _STATUS_COLORS[status_idx].tolist()
+        emojis = _STATUS_EMOJIS[status_idx].tolist()
+        
+        gaps = {}
+        for i, (metric, row_gaps, idx, next_gap) in enumerate(zip(metrics, level_gaps.tolist(),
+                                                                  next_idx.tolist(), gap_to_next.tolist())):
+            benchmark = benchmarks[metric]
+            
+            gaps[metric] = {
+                'current': current_metrics[metric],
+                'status': statuses[i],
+                'color': colors[i],
+                'emoji': emojis[i],
+                'next_target': _RATIO_LEVELS[idx],
+                'gap_to_next': next_gap,
+                'gap_to_min': row_gaps[0],
+                'gap_to_good': row_gaps[1],
+                'gap_to_excellent': row_gaps[2],
+                'benchmark': benchmark
+            }
         
         return gaps
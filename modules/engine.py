@@ -3,8 +3,34 @@ GTM Engine: Single source of truth for all funnel and marketing calculations
 Pure functions - no Streamlit dependencies
 """
 
-from typing import List, Tuple
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 from modules.models import Channel, DealEconomics, GTMMetrics, CostMethod
+from modules.jit import njit, NUMBA_AVAILABLE
+
+# Integer codes for the cost methods, in funnel order (lead → sale, then budget)
+_COST_METHOD_CODES = {
+    CostMethod.CPL: 0,
+    CostMethod.CPC: 1,
+    CostMethod.CPM: 2,
+    CostMethod.CPA: 3,
+    CostMethod.BUDGET: 4,
+}
+_COST_METHOD_CODE_LIST = np.arange(len(_COST_METHOD_CODES))
+
+# Price field for each cost method, indexed by its code
+_COST_RATE_GETTERS = tuple(attrgetter(field) for field in (
+    'cpl', 'cost_per_contact', 'cost_per_meeting', 'cost_per_sale', 'monthly_budget'
+))
+
+# Per-channel outputs, in GTMMetrics field order
+_GTM_FIELDS = (
+    'leads', 'contacts', 'meetings_scheduled', 'meetings_held', 'sales',
+    'revenue_upfront', 'spend', 'cost_per_sale', 'blended_close_rate'
+)
 
 
 def calculate_channel_spend(
@@ -17,22 +43,10 @@ def calculate_channel_spend(
     Calculate marketing spend for a channel using convergent cost model.
     Only ONE funnel stage is paid - the method's target stage blocks all upstream costs.
     """
-    method = ch.cost_method
-    
-    if method == CostMethod.CPA:  # Cost per Sale
-        return sales * float(ch.cost_per_sale or 0)
-    
-    elif method == CostMethod.CPM:  # Cost per Meeting
-        return meetings_held * float(ch.cost_per_meeting or 0)
-    
-    elif method == CostMethod.CPC:  # Cost per Contact
-        return contacts * float(ch.cost_per_contact or 0)
-    
-    elif method == CostMethod.BUDGET:  # Total Budget
-        return float(ch.monthly_budget or 0)
-    
-    else:  # CPL - Cost per Lead (default)
-        return ch.monthly_leads * float(ch.cpl or 0)
+    # Paid stage volume × that stage's price; budget is a flat amount (volume 1)
+    code = _COST_METHOD_CODES.get(ch.cost_method, 0)
+    rate = float(_COST_RATE_GETTERS[code](ch) or 0)
+    return (ch.monthly_leads, contacts, meetings_held, sales, 1.0)[code] * rate
 
 
 def compute_channel_metrics(ch: Channel, deal: DealEconomics) -> GTMMetrics:
@@ -78,6 +92,157 @@ def compute_channel_metrics(ch: Channel, deal: DealEconomics) -> GTMMetrics:
     )
 
 
+def _channels_to_arrays(channels: List[Channel]) -> Dict[str, np.ndarray]:
+    """
+    Pull the fields the funnel needs out of the channel models, once.
+    
+    Returns parallel float64 arrays (missing costs become 0), a boolean
+    enabled mask and an int8 cost method code per channel.
+    """
+    n = len(channels)
+    
+    def column(get) -> np.ndarray:
+        return np.fromiter((get(ch) for ch in channels), dtype=np.float64, count=n)
+    
+    return {
+        'leads': column(lambda ch: ch.monthly_leads),
+        'contact_rate': column(lambda ch: ch.contact_rate),
+        'meeting_rate': column(lambda ch: ch.meeting_rate),
+        'show_up_rate': column(lambda ch: ch.show_up_rate),
+        'close_rate': column(lambda ch: ch.close_rate),
+        'cpl': column(lambda ch: ch.cpl or 0),
+        'cpc': column(lambda ch: ch.cost_per_contact or 0),
+        'cpm': column(lambda ch: ch.cost_per_meeting or 0),
+        'cpa': column(lambda ch: ch.cost_per_sale or 0),
+        'budget': column(lambda ch: ch.monthly_budget or 0),
+        'enabled': np.fromiter((ch.enabled for ch in channels), dtype=bool, count=n),
+        'method_code': np.fromiter((_COST_METHOD_CODES[ch.cost_method] for ch in channels),
+                                   dtype=np.int8, count=n),
+    }
+
+
+@njit(cache=True, fastmath=True)
+def _funnel_core(leads_in, contact_rate, meeting_rate, show_up_rate, close_rate,
+                 enabled, method_code, cpl, cpc, cpm, cpa, budget, upfront_cash):
+    """Compiled kernel: funnel cascade + spend per channel, rows in _GTM_FIELDS order"""
+    n = leads_in.shape[0]
+    out = np.zeros((9, n))
+    for i in range(n):
+        if not enabled[i]:
+            continue
+        leads = leads_in[i]
+        contacts = leads * contact_rate[i]
+        meetings_scheduled = contacts * meeting_rate[i]
+        meetings_held = meetings_scheduled * show_up_rate[i]
+        sales = meetings_held * close_rate[i]
+        
+        code = method_code[i]
+        if code == 1:
+            spend = contacts * cpc[i]
+        elif code == 2:
+            spend = meetings_held * cpm[i]
+        elif code == 3:
+            spend = sales * cpa[i]
+        elif code == 4:
+            spend = budget[i]
+        else:
+            spend = leads * cpl[i]
+        
+        out[0, i] = leads
+        out[1, i] = contacts
+        out[2, i] = meetings_scheduled
+        out[3, i] = meetings_held
+        out[4, i] = sales
+        out[5, i] = sales * upfront_cash
+        out[6, i] = spend
+        out[7, i] = spend / sales if sales > 0 else 0.0
+        out[8, i] = sales / meetings_held if meetings_held > 0 else 0.0
+    return out
+
+
+def _funnel_arrays(arrays: Dict[str, np.ndarray], upfront_cash: float) -> Dict[str, np.ndarray]:
+    """
+    Funnel cascade and spend for every channel at once.
+    
+    Same math as compute_channel_metrics; disabled channels come out as zeros.
+    """
+    if NUMBA_AVAILABLE:
+        rows = _funnel_core(
+            arrays['leads'], arrays['contact_rate'], arrays['meeting_rate'],
+            arrays['show_up_rate'], arrays['close_rate'], arrays['enabled'],
+            arrays['method_code'], arrays['cpl'], arrays['cpc'], arrays['cpm'],
+            arrays['cpa'], arrays['budget'], float(upfront_cash)
+        )
+        return dict(zip(_GTM_FIELDS, rows))
+    return _funnel_numpy(arrays, upfront_cash)
+
+
+def _funnel_numpy(arrays: Dict[str, np.ndarray], upfront_cash: float) -> Dict[str, np.ndarray]:
+    """
+    NumPy funnel over channel arrays - channels on the last axis, so
+    (scenarios, channels) inputs broadcast too.
+    """
+    enabled = arrays['enabled']
+    
+    # Funnel cascade (bowtie model)
+    leads = np.where(enabled, arrays['leads'], 0.0)
+    contacts = leads * arrays['contact_rate']
+    meetings_scheduled = contacts * arrays['meeting_rate']
+    meetings_held = meetings_scheduled * arrays['show_up_rate']
+    sales = meetings_held * arrays['close_rate']
+    
+    revenue_upfront = sales * upfront_cash
+    
+    # Spend (convergent cost model) - pick the paid stage per channel
+    method_code = arrays['method_code']
+    spend = np.select(
+        [method_code == code for code in _COST_METHOD_CODE_LIST],
+        [leads * arrays['cpl'], contacts * arrays['cpc'], meetings_held * arrays['cpm'],
+         sales * arrays['cpa'], arrays['budget']],
+        default=leads * arrays['cpl']
+    )
+    spend = np.where(enabled, spend, 0.0)
+    
+    # Derived metrics
+    has_sales = sales > 0
+    has_meetings = meetings_held > 0
+    cost_per_sale = np.divide(spend, sales, out=np.zeros_like(spend), where=has_sales)
+    blended_close_rate = np.divide(sales, meetings_held, out=np.zeros_like(sales), where=has_meetings)
+    
+    return {
+        'leads': leads,
+        'contacts': contacts,
+        'meetings_scheduled': meetings_scheduled,
+        'meetings_held': meetings_held,
+        'sales': sales,
+        'revenue_upfront': revenue_upfront,
+        'spend': spend,
+        'cost_per_sale': cost_per_sale,
+        'blended_close_rate': blended_close_rate,
+    }
+
+
+def _aggregate_metrics(funnel: Dict[str, np.ndarray]) -> GTMMetrics:
+    """Sum per-channel funnel arrays into one GTMMetrics with blended ratios"""
+    totals = {field: float(funnel[field].sum()) for field in _GTM_FIELDS[:7]}
+    
+    # Blended metrics
+    total_sales = totals['sales']
+    total_meetings_held = totals['meetings_held']
+    totals['cost_per_sale'] = (totals['spend'] / total_sales) if total_sales > 0 else 0
+    totals['blended_close_rate'] = (total_sales / total_meetings_held) if total_meetings_held > 0 else 0
+    
+    return GTMMetrics(**totals)
+
+
+def compute_gtm_aggregate_fast(channels: List[Channel], deal: DealEconomics) -> GTMMetrics:
+    """
+    Aggregate GTM metrics only - skips building a GTMMetrics per channel.
+    """
+    funnel = _funnel_arrays(_channels_to_arrays(channels), deal.upfront_cash)
+    return _aggregate_metrics(funnel)
+
+
 def compute_gtm_aggregate(
     channels: List[Channel],
     deal: DealEconomics
@@ -85,41 +250,87 @@ def compute_gtm_aggregate(
     """
     Compute GTM metrics for all channels and aggregate totals.
     
+    The funnel runs over parallel arrays (one entry per channel); the
+    per-channel GTMMetrics are built from the array rows.
+    
     Returns:
         (per_channel_metrics, aggregate_totals)
     """
-    # Calculate metrics for each channel
-    per_channel = [compute_channel_metrics(ch, deal) for ch in channels]
+    funnel = _funnel_arrays(_channels_to_arrays(channels), deal.upfront_cash)
     
-    # Aggregate totals (simple summation)
-    def sum_attr(attr: str) -> float:
-        return sum(getattr(m, attr) for m in per_channel)
+    columns = [funnel[field].tolist() for field in _GTM_FIELDS]
+    per_channel = [GTMMetrics(**dict(zip(_GTM_FIELDS, row))) for row in zip(*columns)]
     
-    total_leads = sum_attr("leads")
-    total_contacts = sum_attr("contacts")
-    total_meetings_scheduled = sum_attr("meetings_scheduled")
-    total_meetings_held = sum_attr("meetings_held")
-    total_sales = sum_attr("sales")
-    total_revenue = sum_attr("revenue_upfront")
-    total_spend = sum_attr("spend")
+    return per_channel, _aggregate_metrics(funnel)
+
+
+def compute_gtm_aggregate_batch(
+    channels: List[Channel],
+    deal: DealEconomics,
+    delta_matrix: Dict[str, np.ndarray]
+) -> Dict[str, np.ndarray]:
+    """
+    Aggregate GTM metrics for S scenarios over the same C channels at once.
     
-    # Blended metrics
-    total_cost_per_sale = (total_spend / total_sales) if total_sales > 0 else 0
-    blended_close_rate = (total_sales / total_meetings_held) if total_meetings_held > 0 else 0
-    
-    aggregate = GTMMetrics(
-        leads=total_leads,
-        contacts=total_contacts,
-        meetings_scheduled=total_meetings_scheduled,
-        meetings_held=total_meetings_held,
-        sales=total_sales,
-        revenue_upfront=total_revenue,
-        spend=total_spend,
-        cost_per_sale=total_cost_per_sale,
-        blended_close_rate=blended_close_rate
-    )
+    Args:
+        channels: Baseline channels
+        deal: Deal economics (shared by every scenario)
+        delta_matrix: Additive deltas per channel field, each shaped (S, C) -
+            keys are funnel/cost fields such as 'leads', 'close_rate', 'cpl'
+    
+    Returns:
+        Dict of (S,) arrays keyed like GTMMetrics fields
+    """
+    arrays = _channels_to_arrays(channels)
+    for field, delta in delta_matrix.items():
+        arrays[field] = arrays[field] + np.asarray(delta, dtype=np.float64)
     
-    return per_channel, aggregate
+    shape = np.broadcast_shapes((1, len(channels)), *(np.shape(d) for d in delta_matrix.values()))
+    funnel = _funnel_numpy(arrays, deal.upfront_cash)
+    
+    # Stages without deltas stay (C,) - broadcast before reducing over channels
+    totals = {field: np.broadcast_to(funnel[field], shape).sum(axis=-1)
+              for field in _GTM_FIELDS[:7]}
+    
+    # Blended metrics
+    totals['cost_per_sale'] = np.divide(totals['spend'], totals['sales'],
+                                        out=np.zeros(shape[0]), where=totals['sales'] > 0)
+    totals['blended_close_rate'] = np.divide(totals['sales'], totals['meetings_held'],
+                                             out=np.zeros(shape[0]), where=totals['meetings_held'] > 0)
+    return totals
+
+
+def _stage_conversions(
+    contact_rate: float,
+    meeting_rate: float,
+    show_up_rate: float,
+    close_rate: float
+) -> Tuple[float, float, float]:
+    """Lead → contact, → meeting held, → sale; same partials as Channel.cascade_partials"""
+    to_meeting = contact_rate * meeting_rate * show_up_rate
+    return contact_rate, to_meeting, to_meeting * close_rate
+
+
+# Which partial each target stage divides by (cost methods use code - 1)
+_STAGE_PARTIAL = {"contacts": 0, "meetings": 1, "sales": 2}
+
+
+def _leads_for(target_value: float, target_stage: str, partials: Tuple[float, float, float]) -> float:
+    index = _STAGE_PARTIAL.get(target_stage)
+    if index is None:  # leads
+        return target_value
+    conversion = partials[index]
+    return target_value / conversion if conversion > 0 else 0
+
+
+def _cpl_for(cost_method: CostMethod, cost_value: float, partials: Tuple[float, float, float]) -> float:
+    code = _COST_METHOD_CODES.get(cost_method)
+    if code == 0:  # CPL
+        return cost_value
+    if code is None or code > 3:
+        return 0  # Budget method doesn't have a fixed CPL
+    conversion = partials[code - 1]
+    return cost_value / conversion if conversion > 0 else 0
 
 
 def reverse_engineer_leads(
@@ -141,20 +352,13 @@ def reverse_engineer_leads(
     Returns:
         Number of leads required
     """
-    if target_stage == "sales":
-        conversion = contact_rate * meeting_rate * show_up_rate * close_rate
-        return target_value / conversion if conversion > 0 else 0
-    
-    elif target_stage == "meetings":
-        conversion = contact_rate * meeting_rate * show_up_rate
-        return target_value / conversion if conversion > 0 else 0
-    
-    elif target_stage == "contacts":
-        conversion = contact_rate
-        return target_value / conversion if conversion > 0 else 0
-    
-    else:  # leads
-        return target_value
+    partials = _stage_conversions(contact_rate, meeting_rate, show_up_rate, close_rate)
+    return _leads_for(target_value, target_stage, partials)
+
+
+def reverse_engineer_channel_leads(ch: Channel, target_value: float, target_stage: str) -> float:
+    """reverse_engineer_leads using the channel's cached cascade partials"""
+    return _leads_for(target_value, target_stage, ch.cascade_partials)
 
 
 def calculate_effective_cpl(
@@ -169,21 +373,27 @@ def calculate_effective_cpl(
     Calculate effective CPL for any cost method.
     Useful for displaying "what you're really paying per lead" regardless of input method.
     """
-    if cost_method == CostMethod.CPL:
+    if _COST_METHOD_CODES.get(cost_method) == 0:  # CPL
         return cost_value
-    
-    elif cost_method == CostMethod.CPC:
-        return cost_value / contact_rate if contact_rate > 0 else 0
-    
-    elif cost_method == CostMethod.CPM:
-        conversion_to_meeting = contact_rate * meeting_rate * show_up_rate
-        return cost_value / conversion_to_meeting if conversion_to_meeting > 0 else 0
-    
-    elif cost_method == CostMethod.CPA:
-        full_conversion = contact_rate * meeting_rate * show_up_rate * close_rate
-        return cost_value / full_conversion if full_conversion > 0 else 0
-    
-    return 0  # Budget method doesn't have a fixed CPL
+    partials = _stage_conversions(contact_rate, meeting_rate, show_up_rate, close_rate)
+    return _cpl_for(cost_method, cost_value, partials)
+
+
+def calculate_channel_effective_cpl(
+    ch: Channel,
+    cost_method: Optional[CostMethod] = None,
+    cost_value: Optional[float] = None
+) -> float:
+    """
+    Effective CPL for a channel from its cached cascade partials.
+    Override cost_method/cost_value to price the same funnel under another
+    method (cost-method sweeps) without re-multiplying the rates.
+    """
+    if cost_method is None:
+        cost_method = ch.cost_method
+    if cost_value is None:
+        cost_value = ch.get_cost_value()
+    return _cpl_for(cost_method, cost_value, ch.cascade_partials)
 
 
 def validate_channel(ch: Channel) -> List[str]:
@@ -220,3 +430,49 @@ def validate_channel(ch: Channel) -> List[str]:
         issues.append("Monthly leads must be > 0")
     
     return issues
+
+
+# Rate fields checked by validate_channel, with their message labels
+_RATE_CHECKS = (
+    ('contact_rate', "Contact rate"),
+    ('meeting_rate', "Meeting rate"),
+    ('show_up_rate', "Show-up rate"),
+    ('close_rate', "Close rate"),
+)
+
+# Cost array (from _channels_to_arrays) and message per cost method code
+_COST_CHECKS = (
+    ('cpl', "CPL method requires valid 'cpl' value"),
+    ('cpc', "CPC method requires valid 'cost_per_contact' value"),
+    ('cpm', "CPM method requires valid 'cost_per_meeting' value"),
+    ('cpa', "CPA method requires valid 'cost_per_sale' value"),
+    ('budget', "Budget method requires valid 'monthly_budget' value"),
+)
+
+
+def validate_channels_bulk(channels: List[Channel]) -> List[List[str]]:
+    """
+    validate_channel for many channels (e.g. a CSV import) in one array pass.
+    Returns one issue list per channel, with the same messages.
+    """
+    arrays = _channels_to_arrays(channels)
+    rates = np.stack([arrays[field] for field, _ in _RATE_CHECKS], axis=1)
+    bad_rate = (rates < 0) | (rates > 1)
+    
+    costs = np.stack([arrays[field] for field, _ in _COST_CHECKS], axis=1)
+    active_cost = costs[np.arange(len(channels)), arrays['method_code']]
+    bad_cost = active_cost <= 0
+    bad_leads = arrays['leads'] <= 0
+    
+    issues = [[] for _ in channels]
+    for i in np.flatnonzero(bad_rate.any(axis=1) | bad_cost | bad_leads):
+        ch = channels[i]
+        row = issues[i]
+        for j in np.flatnonzero(bad_rate[i]):
+            field, label = _RATE_CHECKS[j]
+            row.append(f"{label} must be 0-1, got {getattr(ch, field)}")
+        if bad_cost[i]:
+            row.append(_COST_CHECKS[arrays['method_code'][i]][1])
+        if bad_leads[i]:
+            row.append("Monthly leads must be > 0")
+    return issues
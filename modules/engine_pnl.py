@@ -3,9 +3,15 @@ P&L Engine: Unit economics, commissions, and financial calculations
 Single source of truth for all financial math
 """
 
+from functools import lru_cache
+from typing import Callable, Dict, List
+
+import numpy as np
+
 from modules.models import (
     DealEconomics, UnitEconomics, CommissionBreakdown,
-    PnLStatement, TeamStructure, OperatingCosts, RoleCompensation
+    PnLStatement, TeamStructure, OperatingCosts, RoleCompensation,
+    RoleEarnings, PerPersonEarnings
 )
 
 
@@ -50,11 +56,8 @@ def calculate_commission_pools(
     Calculate commission pools based on policy.
     Single source of truth for commission math.
     """
-    # Determine commission base (what we calculate commissions on)
-    if deal.commission_policy.value == "upfront":
-        commission_base = deal.upfront_cash
-    else:  # full
-        commission_base = deal.avg_deal_value
+    # Commission base (what we calculate commissions on), cached per deal by policy
+    commission_base = deal.commission_base
     
     # Monthly revenue this applies to
     total_commission_base = sales_count * commission_base
@@ -75,6 +78,63 @@ def calculate_commission_pools(
     )
 
 
+@lru_cache(maxsize=64)
+def make_pnl_kernel(
+    gov_cost_pct: float,
+    operating_costs_total: float,
+    team_base_annual: float
+) -> Callable[[float, float, float], PnLStatement]:
+    """
+    P&L function specialized for fixed gov fees, OpEx and team base.
+    
+    In a sweep these stay put while revenue, commissions and marketing move,
+    so the fee factor and monthly team base are worked out once here.
+    
+    Returns:
+        pnl(gross_revenue, commissions, marketing_spend) -> PnLStatement
+    """
+    gov_factor = gov_cost_pct / 100
+    team_base_monthly = team_base_annual / 12
+    opex = operating_costs_total
+    
+    def pnl(gross_revenue: float, commissions: float, marketing_spend: float) -> PnLStatement:
+        # Revenue
+        gov_fees = gross_revenue * gov_factor
+        net_revenue = gross_revenue - gov_fees
+        
+        # COGS (Cost of Goods Sold) - team compensation
+        cogs = team_base_monthly + commissions
+        
+        # Gross Profit
+        gross_profit = net_revenue - cogs
+        gross_margin = (gross_profit / net_revenue * 100) if net_revenue > 0 else 0
+        
+        # Operating Expenses
+        total_opex = marketing_spend + opex
+        
+        # EBITDA
+        ebitda = gross_profit - total_opex
+        ebitda_margin = (ebitda / net_revenue * 100) if net_revenue > 0 else 0
+        
+        return PnLStatement(
+            gross_revenue=gross_revenue,
+            gov_fees=gov_fees,
+            net_revenue=net_revenue,
+            team_base=team_base_monthly,
+            commissions=commissions,
+            cogs=cogs,
+            gross_profit=gross_profit,
+            gross_margin=gross_margin,
+            marketing=marketing_spend,
+            opex=opex,
+            total_opex=total_opex,
+            ebitda=ebitda,
+            ebitda_margin=ebitda_margin
+        )
+    
+    return pnl
+
+
 def calculate_pnl(
     gross_revenue: float,
     team_base_annual: float,
@@ -95,100 +155,115 @@ def calculate_pnl(
         operating_costs: Monthly operating expenses
         gov_cost_pct: Government fees as % of gross revenue (0-100)
     """
+    pnl = make_pnl_kernel(gov_cost_pct, operating_costs.total, team_base_annual)
+    return pnl(gross_revenue, commissions, marketing_spend)
+
+
+def calculate_pnl_batch(
+    gross_revenue: np.ndarray,
+    team_base_annual: float,
+    commissions: np.ndarray,
+    marketing_spend: np.ndarray,
+    operating_costs: OperatingCosts,
+    gov_cost_pct: float
+) -> Dict[str, np.ndarray]:
+    """
+    Array version of calculate_pnl for a scenario sweep.
+    
+    Revenue, commissions and marketing are (S,) arrays; the rest is shared.
+    Returns a dict of (S,) arrays keyed like PnLStatement fields.
+    """
+    gross_revenue = np.asarray(gross_revenue, dtype=np.float64)
+    commissions = np.asarray(commissions, dtype=np.float64)
+    marketing_spend = np.asarray(marketing_spend, dtype=np.float64)
+    
     # Revenue
     gov_fees = gross_revenue * (gov_cost_pct / 100)
     net_revenue = gross_revenue - gov_fees
     
-    # COGS (Cost of Goods Sold) - team compensation
-    team_base_monthly = team_base_annual / 12
-    cogs = team_base_monthly + commissions
-    
-    # Gross Profit
+    # COGS and gross profit
+    team_base = np.full_like(net_revenue, team_base_annual / 12)
+    cogs = team_base + commissions
     gross_profit = net_revenue - cogs
-    gross_margin = (gross_profit / net_revenue * 100) if net_revenue > 0 else 0
     
-    # Operating Expenses
-    marketing = marketing_spend
-    opex = operating_costs.total
-    total_opex = marketing + opex
-    
-    # EBITDA
+    # Operating expenses and EBITDA
+    opex = np.full_like(net_revenue, operating_costs.total)
+    total_opex = marketing_spend + opex
     ebitda = gross_profit - total_opex
-    ebitda_margin = (ebitda / net_revenue * 100) if net_revenue > 0 else 0
-    
-    return PnLStatement(
-        gross_revenue=gross_revenue,
-        gov_fees=gov_fees,
-        net_revenue=net_revenue,
-        team_base=team_base_monthly,
-        commissions=commissions,
-        cogs=cogs,
-        gross_profit=gross_profit,
-        gross_margin=gross_margin,
-        marketing=marketing,
-        opex=opex,
-        total_opex=total_opex,
-        ebitda=ebitda,
-        ebitda_margin=ebitda_margin
-    )
+    
+    has_revenue = net_revenue > 0
+    return {
+        'gross_revenue': gross_revenue,
+        'gov_fees': gov_fees,
+        'net_revenue': net_revenue,
+        'team_base': team_base,
+        'commissions': commissions,
+        'cogs': cogs,
+        'gross_profit': gross_profit,
+        'gross_margin': np.divide(gross_profit * 100, net_revenue,
+                                  out=np.zeros_like(net_revenue), where=has_revenue),
+        'marketing': marketing_spend,
+        'opex': opex,
+        'total_opex': total_opex,
+        'ebitda': ebitda,
+        'ebitda_margin': np.divide(ebitda * 100, net_revenue,
+                                   out=np.zeros_like(net_revenue), where=has_revenue),
+    }
 
 
 def calculate_per_person_earnings(
     commissions: CommissionBreakdown,
     team: TeamStructure,
     working_days: int = 20
-) -> dict:
+) -> PerPersonEarnings:
     """
     Calculate per-person earnings across different time periods.
     
-    Returns dict with structure:
-    {
-        'closer': {'monthly_comm': X, 'daily_comm': Y, 'annual_comm': Z, 'ote_attainment': %},
-        'setter': {...},
-        'manager': {...}
-    }
+    Returns PerPersonEarnings with a RoleEarnings for closer, setter,
+    manager and bench (use .to_dict() for the old nested-dict shape).
     """
-    def calc_role(pool: float, count: int, role_comp: RoleCompensation):
+    def calc_role(pool: float, count: int, role_comp: RoleCompensation) -> RoleEarnings:
+        monthly_base = role_comp.base / 12
         if count == 0:
-            return {
-                'monthly_comm': 0, 'daily_comm': 0, 'annual_comm': 0,
-                'monthly_total': role_comp.base / 12, 'ote_attainment': 0
-            }
+            return RoleEarnings(
+                monthly_comm=0, daily_comm=0, annual_comm=0, monthly_base=monthly_base,
+                monthly_total=monthly_base, ote=role_comp.ote, ote_attainment=0
+            )
         
         monthly_comm = pool / count
         daily_comm = monthly_comm / working_days
         annual_comm = monthly_comm * 12
         
-        monthly_base = role_comp.base / 12
         monthly_total = monthly_base + monthly_comm
         
         # OTE attainment = actual commission / target variable
         ote_attainment = (annual_comm / role_comp.variable * 100) if role_comp.variable > 0 else 0
         
-        return {
-            'monthly_comm': monthly_comm,
-            'daily_comm': daily_comm,
-            'annual_comm': annual_comm,
-            'monthly_base': monthly_base,
-            'monthly_total': monthly_total,
-            'ote': role_comp.ote,
-            'ote_attainment': ote_attainment
-        }
+        return RoleEarnings(
+            monthly_comm=monthly_comm,
+            daily_comm=daily_comm,
+            annual_comm=annual_comm,
+            monthly_base=monthly_base,
+            monthly_total=monthly_total,
+            ote=role_comp.ote,
+            ote_attainment=ote_attainment
+        )
     
-    return {
-        'closer': calc_role(commissions.closer_pool, team.num_closers, team.closer),
-        'setter': calc_role(commissions.setter_pool, team.num_setters, team.setter),
-        'manager': calc_role(commissions.manager_pool, team.num_managers, team.manager),
-        'bench': {
-            'monthly_comm': 0,
-            'daily_comm': 0,
-            'annual_comm': 0,
-            'monthly_base': team.bench.base / 12 if team.num_bench > 0 else 0,
-            'monthly_total': team.bench.base / 12 if team.num_bench > 0 else 0,
-            'ote': team.bench.ote,
-            'ote_attainment': 0
-        }
-    }
+    bench_base = team.bench.base / 12 if team.num_bench > 0 else 0
+    return PerPersonEarnings(
+        closer=calc_role(commissions.closer_pool, team.num_closers, team.closer),
+        setter=calc_role(commissions.setter_pool, team.num_setters, team.setter),
+        manager=calc_role(commissions.manager_pool, team.num_managers, team.manager),
+        bench=RoleEarnings(
+            monthly_comm=0,
+            daily_comm=0,
+            annual_comm=0,
+            monthly_base=bench_base,
+            monthly_total=bench_base,
+            ote=team.bench.ote,
+            ote_attainment=0
+        )
+    )
 
 
 def calculate_ote_requirements(
@@ -222,6 +297,19 @@ def calculate_ote_requirements(
     }
 
 
+# Annual projection fields: (output name, PnLStatement attribute)
+_PROJECTION_FIELDS = (
+    ('annual_revenue', 'gross_revenue'),
+    ('annual_net_revenue', 'net_revenue'),
+    ('annual_cogs', 'cogs'),
+    ('annual_opex', 'total_opex'),
+    ('annual_ebitda', 'ebitda'),
+    ('annual_commissions', 'commissions'),
+    ('annual_marketing', 'marketing'),
+)
+_PROJECTION_DTYPE = np.dtype([(name, 'f8') for name, _ in _PROJECTION_FIELDS])
+
+
 def project_financials(
     monthly_pnl: PnLStatement,
     months: int = 12
@@ -231,12 +319,24 @@ def project_financials(
     
     Returns dict with annual projections.
     """
-    return {
-        'annual_revenue': monthly_pnl.gross_revenue * months,
-        'annual_net_revenue': monthly_pnl.net_revenue * months,
-        'annual_cogs': monthly_pnl.cogs * months,
-        'annual_opex': monthly_pnl.total_opex * months,
-        'annual_ebitda': monthly_pnl.ebitda * months,
-        'annual_commissions': monthly_pnl.commissions * months,
-        'annual_marketing': monthly_pnl.marketing * months,
-    }
+    return {name: getattr(monthly_pnl, attr) * months for name, attr in _PROJECTION_FIELDS}
+
+
+def project_financials_batch(
+    monthly_pnls: List[PnLStatement],
+    months: int = 12
+) -> np.ndarray:
+    """
+    Project many monthly P&Ls at once (e.g. a scenario sweep).
+    
+    Returns a structured array, one record per statement, with the same
+    field names as project_financials.
+    """
+    n = len(monthly_pnls)
+    k = len(_PROJECTION_FIELDS)
+    values = np.fromiter(
+        (getattr(pnl, attr) for pnl in monthly_pnls for _, attr in _PROJECTION_FIELDS),
+        dtype=np.float64, count=n * k
+    ).reshape(n, k)
+    values *= months
+    return values.view(_PROJECTION_DTYPE).reshape(n)
@@ -0,0 +1,46 @@
+"""
+Snapshot Engine: Recompute every calculated metric on a BusinessSnapshot in one call
+Pure functions - no Streamlit dependencies
+"""
+
+from modules.models import BusinessSnapshot
+from modules.engine import compute_gtm_aggregate
+from modules.engine_pnl import calculate_unit_economics, calculate_commission_pools, calculate_pnl
+
+
+def recompute(snapshot: BusinessSnapshot) -> BusinessSnapshot:
+    """
+    Fill gtm_total, gtm_per_channel, unit_economics, commissions and pnl.
+    
+    Runs the channel funnel once and derives everything downstream from its
+    totals; the inputs are shared with the given snapshot, not copied.
+    
+    Returns:
+        New snapshot with all calculated fields set
+    """
+    deal = snapshot.deal_economics
+    team = snapshot.team
+    
+    # One funnel pass over all channels
+    per_channel, gtm_total = compute_gtm_aggregate(snapshot.channels, deal)
+    
+    unit_economics = calculate_unit_economics(deal, gtm_total.cost_per_sale)
+    commissions = calculate_commission_pools(
+        gtm_total.sales, team.closer, team.setter, team.manager, deal
+    )
+    pnl = calculate_pnl(
+        gross_revenue=gtm_total.revenue_upfront,
+        team_base_annual=team.total_base,
+        commissions=commissions.total_commission,
+        marketing_spend=gtm_total.spend,
+        operating_costs=snapshot.operating_costs,
+        gov_cost_pct=deal.government_cost_pct
+    )
+    
+    return snapshot.model_copy(update={
+        'gtm_total': gtm_total,
+        'gtm_per_channel': per_channel,
+        'unit_economics': unit_economics,
+        'commissions': commissions,
+        'pnl': pnl
+    })
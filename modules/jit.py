@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT support
+
+Numba is not a hard dependency. When it is installed, `njit` compiles the
+decorated numeric kernel; otherwise it hands the function back unchanged so
+callers can pick a NumPy path via NUMBA_AVAILABLE.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """
+    Drop-in for numba.njit that degrades to a no-op without Numba.
+    
+    Supports both bare `@njit` and `@njit(cache=True, ...)` forms.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _numba_njit(args[0]) if NUMBA_AVAILABLE else args[0]
+    
+    def decorator(func):
+        return _numba_njit(*args, **kwargs)(func) if NUMBA_AVAILABLE else func
+    
+    return decorator
@@ -3,8 +3,11 @@ Business domain models for Sales Compensation Dashboard
 Single source of truth for all data structures
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Literal, Optional, List
+import re
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, ClassVar, Dict, Literal, Optional, List, Tuple
 from enum import Enum
 
 
@@ -41,15 +44,51 @@ class DealEconomics(BaseModel):
     grr: float = Field(ge=0, le=1, default=0.90, description="Gross Revenue Retention")
     government_cost_pct: float = Field(ge=0, le=100, default=10.0)
     
-    @property
+    @cached_property
     def upfront_cash(self) -> float:
-        """Cash received upfront per deal"""
+        """Cash received upfront per deal (computed once per instance)"""
         return self.avg_deal_value * (self.upfront_pct / 100)
     
-    @property
+    @cached_property
     def deferred_cash(self) -> float:
-        """Cash deferred per deal"""
+        """Cash deferred per deal (computed once per instance)"""
         return self.avg_deal_value * ((100 - self.upfront_pct) / 100)
+    
+    @cached_property
+    def commission_base(self) -> float:
+        """Per-deal amount commissions are paid on, resolved from the policy once"""
+        if self.commission_policy is CommissionPolicy.UPFRONT:
+            return self.upfront_cash
+        return self.avg_deal_value
+    
+    def _drop_cached_cash(self) -> None:
+        """Forget the cached cash split so it can't drift from its inputs"""
+        self.__dict__.pop('upfront_cash', None)
+        self.__dict__.pop('deferred_cash', None)
+        self.__dict__.pop('commission_base', None)
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ('avg_deal_value', 'upfront_pct', 'commission_policy'):
+            self._drop_cached_cash()
+    
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._drop_cached_cash()
+        return copied
+
+
+# Cost field backing each cost method
+_COST_FIELDS = {
+    CostMethod.CPL: 'cpl',
+    CostMethod.CPC: 'cost_per_contact',
+    CostMethod.CPM: 'cost_per_meeting',
+    CostMethod.CPA: 'cost_per_sale',
+    CostMethod.BUDGET: 'monthly_budget',
+}
+
+_CASCADE_RATES = frozenset({'contact_rate', 'meeting_rate', 'show_up_rate', 'close_rate'})
 
 
 class Channel(BaseModel):
@@ -74,33 +113,60 @@ class Channel(BaseModel):
     cost_per_sale: Optional[float] = Field(None, ge=0)
     monthly_budget: Optional[float] = Field(None, ge=0)
     
-    @validator('cost_method', always=True)
-    def validate_cost_inputs(cls, v, values):
-        """Ensure the right cost field is set for the chosen method"""
-        # This runs after other fields are set
-        return v
+    @cached_property
+    def cascade_partials(self) -> Tuple[float, float, float]:
+        """
+        Lead → stage conversion, computed once per instance:
+        (to contact, to meeting held, to sale)
+        """
+        to_contact = self.contact_rate
+        to_meeting = to_contact * self.meeting_rate * self.show_up_rate
+        return to_contact, to_meeting, to_meeting * self.close_rate
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _CASCADE_RATES:
+            self.__dict__.pop('cascade_partials', None)
+    
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop('cascade_partials', None)
+        return copied
     
     def get_cost_value(self) -> float:
         """Get the cost value for the active method"""
-        if self.cost_method == CostMethod.CPL:
-            return self.cpl or 0
-        elif self.cost_method == CostMethod.CPC:
-            return self.cost_per_contact or 0
-        elif self.cost_method == CostMethod.CPM:
-            return self.cost_per_meeting or 0
-        elif self.cost_method == CostMethod.CPA:
-            return self.cost_per_sale or 0
-        elif self.cost_method == CostMethod.BUDGET:
-            return self.monthly_budget or 0
-        return 0
+        field = _COST_FIELDS.get(self.cost_method)
+        return (getattr(self, field) or 0) if field else 0
     
     def is_complete(self) -> bool:
         """Check if channel has valid cost configuration"""
         return self.get_cost_value() > 0
 
 
+class _FrozenTotalsModel(BaseModel):
+    """
+    Frozen input model whose derived totals are cached_property values.
+    
+    Freezing keeps the cache valid; model_copy(update=...) returns a fresh
+    instance that recomputes them lazily.
+    """
+    model_config = ConfigDict(frozen=True)
+    
+    _cached_totals: ClassVar[Tuple[str, ...]] = ()
+    
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in self._cached_totals:
+                copied.__dict__.pop(name, None)
+        return copied
+
+
 class RoleCompensation(BaseModel):
     """Compensation structure for a role"""
+    model_config = ConfigDict(frozen=True)
+    
     base: float = Field(ge=0, description="Annual base salary")
     variable: float = Field(ge=0, description="Annual variable/OTE")
     commission_pct: float = Field(ge=0, le=100, description="Commission % of deal")
@@ -111,8 +177,10 @@ class RoleCompensation(BaseModel):
         return self.base + self.variable
 
 
-class TeamStructure(BaseModel):
+class TeamStructure(_FrozenTotalsModel):
     """Team composition and compensation"""
+    _cached_totals: ClassVar[Tuple[str, ...]] = ('total_base',)
+    
     # Counts
     num_closers: int = Field(ge=0, default=8)
     num_setters: int = Field(ge=0, default=4)
@@ -125,7 +193,7 @@ class TeamStructure(BaseModel):
     manager: RoleCompensation
     bench: RoleCompensation
     
-    @property
+    @cached_property
     def total_base(self) -> float:
         """Total annual base salaries"""
         return (
@@ -141,19 +209,25 @@ class TeamStructure(BaseModel):
         return self.num_closers + self.num_setters + self.num_managers + self.num_bench
 
 
-class OperatingCosts(BaseModel):
+class OperatingCosts(_FrozenTotalsModel):
     """Monthly operating expenses"""
+    _cached_totals: ClassVar[Tuple[str, ...]] = ('total',)
+    
     office_rent: float = Field(ge=0, default=20000)
     software_costs: float = Field(ge=0, default=10000)
     other_opex: float = Field(ge=0, default=5000)
     
-    @property
+    @cached_property
     def total(self) -> float:
         """Total monthly OpEx"""
         return self.office_rent + self.software_costs + self.other_opex
 
 
-class GTMMetrics(BaseModel):
+# Plain slotted dataclasses - built on every recompute, so no per-field
+# validation; the Pydantic models above cover user input.
+
+@dataclass(frozen=True, slots=True)
+class GTMMetrics:
     """Calculated GTM funnel metrics for a channel or aggregate"""
     leads: float
     contacts: float
@@ -176,7 +250,8 @@ class GTMMetrics(BaseModel):
         return self.sales / self.leads if self.leads > 0 else 0
 
 
-class UnitEconomics(BaseModel):
+@dataclass(frozen=True, slots=True)
+class UnitEconomics:
     """Unit economics metrics"""
     ltv: float
     cac: float
@@ -190,7 +265,8 @@ class UnitEconomics(BaseModel):
         return self.ltv / self.cac if self.cac > 0 else 0
 
 
-class CommissionBreakdown(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CommissionBreakdown:
     """Commission pool breakdown"""
     closer_pool: float
     setter_pool: float
@@ -199,7 +275,33 @@ class CommissionBreakdown(BaseModel):
     commission_base: float  # What commissions are calculated on
 
 
-class PnLStatement(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RoleEarnings:
+    """Monthly/daily/annual earnings for one person in a role"""
+    monthly_comm: float
+    daily_comm: float
+    annual_comm: float
+    monthly_base: float
+    monthly_total: float
+    ote: float
+    ote_attainment: float  # %
+
+
+@dataclass(frozen=True, slots=True)
+class PerPersonEarnings:
+    """Per-person earnings for each role"""
+    closer: RoleEarnings
+    setter: RoleEarnings
+    manager: RoleEarnings
+    bench: RoleEarnings
+    
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Nested {role: {field: value}} dicts for callers that still expect them"""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class PnLStatement:
     """Comprehensive P&L"""
     # Revenue
     gross_revenue: float
@@ -238,21 +340,78 @@ class BusinessSnapshot(BaseModel):
     pnl: Optional[PnLStatement] = None
 
 
+_PATH_SEGMENT = re.compile(r'(\w+)(?:\[(\d+)\])?')
+_SNAPSHOT_RESULTS = ('gtm_total', 'gtm_per_channel', 'unit_economics', 'commissions', 'pnl')
+
+
+def _parse_delta_path(key: str) -> Tuple:
+    """'channels[2].close_rate' -> ('channels', 2, 'close_rate')"""
+    path = []
+    for segment in key.split('.'):
+        match = _PATH_SEGMENT.fullmatch(segment)
+        if match is None:
+            raise ValueError(f"Invalid delta path: {key!r}")
+        path.append(match.group(1))
+        if match.group(2) is not None:
+            path.append(int(match.group(2)))
+    return tuple(path)
+
+
+def _apply_delta_tree(node: Any, tree: Any) -> Any:
+    """
+    Rebuild only the parts of node that tree touches.
+    
+    tree is a nested dict of path segments ending in numeric deltas; an
+    unset (None) leaf counts as 0. Each rebuilt model is re-validated, so a
+    delta that breaks a field constraint raises ValidationError. Untouched
+    sub-models and list items are shared, not copied.
+    """
+    if not isinstance(tree, dict):
+        return (node or 0) + tree
+    if isinstance(node, list):
+        items = list(node)
+        for index, subtree in tree.items():
+            items[index] = _apply_delta_tree(node[index], subtree)
+        return items
+    fields = {field: getattr(node, field) for field in type(node).model_fields}
+    for field, subtree in tree.items():
+        if field not in fields:
+            raise ValueError(f"Unknown delta field {field!r} on {type(node).__name__}")
+        fields[field] = _apply_delta_tree(fields[field], subtree)
+    return type(node).model_validate(fields)
+
+
 class Scenario(BaseModel):
     """Named what-if scenario as deltas from baseline"""
     name: str
     description: str
-    deltas: dict  # {"close_rate": 0.03, "cost_per_meeting": -50}
+    deltas: dict  # {"close_rate": 0.03, "channels[0].cost_per_meeting": -50}
     
     def apply_to(self, snapshot: BusinessSnapshot) -> BusinessSnapshot:
-        """Apply deltas to a snapshot (returns new instance)"""
-        # Deep copy and apply deltas
-        import copy
-        new_snap = copy.deepcopy(snapshot)
+        """
+        Apply deltas to a snapshot (returns new instance)
+        
+        Keys are attribute paths from the snapshot ("channels[2].close_rate",
+        "team.closer.base"); a bare Channel field applies to every channel.
+        Only the models along each path are copied - everything else is
+        shared with the original. Calculated metrics are cleared since they
+        no longer match the inputs.
+        """
+        if not self.deltas:
+            return snapshot.model_copy()
         
+        # Merge all deltas into one tree so each sub-model is copied once
+        tree: Dict = {}
         for key, delta in self.deltas.items():
-            # Apply delta based on key path (e.g., "channels[0].close_rate")
-            # This is a simplified version; production would need proper path parsing
-            pass
+            if key in Channel.model_fields:
+                paths = [('channels', i, key) for i in range(len(snapshot.channels))]
+            else:
+                paths = [_parse_delta_path(key)]
+            for path in paths:
+                node = tree
+                for segment in path[:-1]:
+                    node = node.setdefault(segment, {})
+                node[path[-1]] = node.get(path[-1], 0) + delta
         
-        return new_snap
+        new_snap = _apply_delta_tree(snapshot, tree)
+        return new_snap.model_copy(update=dict.fromkeys(_SNAPSHOT_RESULTS))
@@ -7,7 +7,48 @@ Supports multi-channel GTM motions
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+from modules.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _project_kernel(current_mrr, churn, expansion, out_grr, out_nrr, out_churn_cum, out_exp_cum):
+    """Compiled month loop: one row per scenario, written into preallocated (S, n+1) buffers"""
+    for s in range(out_grr.shape[0]):
+        grr_factor = 1 - churn[s]
+        nrr_factor = 1 - churn[s] + expansion[s]
+        out_grr[s, 0] = current_mrr[s]
+        out_nrr[s, 0] = current_mrr[s]
+        out_churn_cum[s, 0] = 0.0
+        out_exp_cum[s, 0] = 0.0
+        for m in range(1, out_grr.shape[1]):
+            prev_nrr = out_nrr[s, m - 1]
+            out_grr[s, m] = out_grr[s, m - 1] * grr_factor
+            out_nrr[s, m] = prev_nrr * nrr_factor
+            out_churn_cum[s, m] = out_churn_cum[s, m - 1] + prev_nrr * churn[s]
+            out_exp_cum[s, m] = out_exp_cum[s, m - 1] + prev_nrr * expansion[s]
+
+
+def _project_numpy(current_mrr, churn, expansion, months_forward):
+    """NumPy fallback: cumprod/cumsum along months, same multiply/add order as the loop"""
+    n = months_forward + 1
+    grr_steps = np.repeat((1 - churn)[:, None], n, axis=1)
+    nrr_steps = np.repeat((1 - churn + expansion)[:, None], n, axis=1)
+    grr_steps[:, 0] = nrr_steps[:, 0] = current_mrr
+    grr_mrr = np.cumprod(grr_steps, axis=1)
+    nrr_mrr = np.cumprod(nrr_steps, axis=1)
+    
+    # Each month's churn/expansion is charged on the previous month's NRR MRR
+    churn_cum = np.zeros((len(current_mrr), n))
+    exp_cum = np.zeros((len(current_mrr), n))
+    np.cumsum(nrr_mrr[:, :-1] * churn[:, None], axis=1, out=churn_cum[:, 1:])
+    np.cumsum(nrr_mrr[:, :-1] * expansion[:, None], axis=1, out=exp_cum[:, 1:])
+    return grr_mrr, nrr_mrr, churn_cum, exp_cum
+
 
 class RevenueRetentionCalculator:
     """Calculate GRR, NRR, and expansion metrics"""
@@ -68,29 +109,42 @@ class RevenueRetentionCalculator:
         """
         Calculate retention by cohort over time
         """
-        retention_data = []
+        n_months = current_month + 1
+        total = len(cohorts) * n_months
         
-        for cohort_month, cohort_data in cohorts.items():
-            initial_customers = cohort_data.get('initial_customers', 0)
-            initial_mrr = cohort_data.get('initial_mrr', 0)
-            
-            for month in range(current_month + 1):
-                retained_customers = cohort_data.get(f'month_{month}_customers', initial_customers)
-                retained_mrr = cohort_data.get(f'month_{month}_mrr', initial_mrr)
-                
-                retention_rate = (retained_customers / initial_customers * 100) if initial_customers > 0 else 0
-                revenue_retention = (retained_mrr / initial_mrr * 100) if initial_mrr > 0 else 0
-                
-                retention_data.append({
-                    'Cohort': cohort_month,
-                    'Month': month,
-                    'Customer_Retention': retention_rate,
-                    'Revenue_Retention': revenue_retention,
-                    'Retained_Customers': retained_customers,
-                    'Retained_MRR': retained_mrr
-                })
+        # One column per field, filled a cohort (block of n_months rows) at a time
+        retained_customers = np.empty(total)
+        retained_mrr = np.empty(total)
+        initial_customers = np.empty(total)
+        initial_mrr = np.empty(total)
+        
+        for i, cohort_data in enumerate(cohorts.values()):
+            rows = slice(i * n_months, (i + 1) * n_months)
+            start_customers = cohort_data.get('initial_customers', 0)
+            start_mrr = cohort_data.get('initial_mrr', 0)
+            initial_customers[rows] = start_customers
+            initial_mrr[rows] = start_mrr
+            retained_customers[rows] = [
+                cohort_data.get(f'month_{month}_customers', start_customers) for month in range(n_months)
+            ]
+            retained_mrr[rows] = [
+                cohort_data.get(f'month_{month}_mrr', start_mrr) for month in range(n_months)
+            ]
+        
+        customer_retention = np.divide(retained_customers, initial_customers,
+                                       out=np.zeros(total), where=initial_customers > 0) * 100
+        revenue_retention = np.divide(retained_mrr, initial_mrr,
+                                      out=np.zeros(total), where=initial_mrr > 0) * 100
         
-        return pd.DataFrame(retention_data)
+        return pd.DataFrame({
+            'Cohort': pd.Categorical(np.repeat(np.array(list(cohorts), dtype=object), n_months),
+                                     categories=list(cohorts)),
+            'Month': np.tile(np.arange(n_months), len(cohorts)),
+            'Customer_Retention': customer_retention,
+            'Revenue_Retention': revenue_retention,
+            'Retained_Customers': retained_customers,
+            'Retained_MRR': retained_mrr
+        })
     
     @staticmethod
     def project_retention_impact(
@@ -102,36 +156,66 @@ class RevenueRetentionCalculator:
         """
         Project future MRR based on retention metrics
         """
+        grr_mrr, nrr_mrr, churned_cumulative, expanded_cumulative = (
+            row[0] for row in RevenueRetentionCalculator._project(
+                [current_mrr], [monthly_churn_rate], [monthly_expansion_rate], months_forward
+            )
+        )
+        
         projections = {
             'month': list(range(months_forward + 1)),
             'mrr': [current_mrr],
-            'grr_mrr': [current_mrr],
-            'nrr_mrr': [current_mrr],
-            'churned_cumulative': [0],
-            'expanded_cumulative': [0]
+            'grr_mrr': grr_mrr.tolist(),
+            'nrr_mrr': nrr_mrr.tolist(),
+            'churned_cumulative': [0] + churned_cumulative[1:].tolist(),
+            'expanded_cumulative': [0] + expanded_cumulative[1:].tolist()
         }
         
-        for month in range(1, months_forward + 1):
-            # GRR projection (only churn)
-            grr_mrr = projections['grr_mrr'][-1] * (1 - monthly_churn_rate)
-            projections['grr_mrr'].append(grr_mrr)
-            
-            # NRR projection (churn + expansion)
-            nrr_mrr = projections['nrr_mrr'][-1] * (1 - monthly_churn_rate + monthly_expansion_rate)
-            projections['nrr_mrr'].append(nrr_mrr)
-            
-            # Track cumulative impact
-            churned = projections['nrr_mrr'][-2] * monthly_churn_rate
-            expanded = projections['nrr_mrr'][-2] * monthly_expansion_rate
-            
-            projections['churned_cumulative'].append(
-                projections['churned_cumulative'][-1] + churned
-            )
-            projections['expanded_cumulative'].append(
-                projections['expanded_cumulative'][-1] + expanded
-            )
-        
         return projections
+    
+    @staticmethod
+    def project_retention_batch(
+        current_mrr: np.ndarray,
+        monthly_churn_rate: np.ndarray,
+        monthly_expansion_rate: np.ndarray,
+        months_forward: int = 12
+    ) -> Dict[str, np.ndarray]:
+        """
+        project_retention_impact for many scenarios at once (Monte Carlo, sweeps).
+        
+        Inputs broadcast to S scenarios; returns (S, months_forward + 1) arrays
+        for grr_mrr, nrr_mrr, churned_cumulative and expanded_cumulative.
+        """
+        grr_mrr, nrr_mrr, churned, expanded = RevenueRetentionCalculator._project(
+            current_mrr, monthly_churn_rate, monthly_expansion_rate, months_forward
+        )
+        return {
+            'month': np.arange(months_forward + 1),
+            'grr_mrr': grr_mrr,
+            'nrr_mrr': nrr_mrr,
+            'churned_cumulative': churned,
+            'expanded_cumulative': expanded
+        }
+    
+    @staticmethod
+    def _project(current_mrr, churn, expansion, months_forward):
+        """Month loop kernel when Numba is installed, NumPy otherwise"""
+        current_mrr, churn, expansion = (
+            np.ascontiguousarray(a, dtype=np.float64)
+            for a in np.broadcast_arrays(np.atleast_1d(current_mrr), churn, expansion)
+        )
+        if NUMBA_AVAILABLE:
+            shape = (len(current_mrr), months_forward + 1)
+            out = [np.empty(shape) for _ in range(4)]
+            _project_kernel(current_mrr, churn, expansion, *out)
+            return tuple(out)
+        return _project_numpy(current_mrr, churn, expansion, months_forward)
+
+
+# Channel dict fields summed by MultiChannelGTM.aggregate_channels
+_AGGREGATE_FIELDS = (
+    'monthly_leads', 'contacts', 'meetings_scheduled', 'meetings_held', 'sales', 'revenue'
+)
 
 
 class MultiChannelGTM:
@@ -187,13 +271,12 @@ class MultiChannelGTM:
         if not channels:
             return {}
         
-        total_leads = sum(ch['monthly_leads'] for ch in channels)
-        total_contacts = sum(ch['contacts'] for ch in channels)
-        total_meetings_scheduled = sum(ch['meetings_scheduled'] for ch in channels)
-        total_meetings_held = sum(ch['meetings_held'] for ch in channels)
-        total_sales = sum(ch['sales'] for ch in channels)
-        total_revenue = sum(ch['revenue'] for ch in channels)
-        total_cost = sum(ch['monthly_leads'] * ch['cpl'] for ch in channels)
+        # One (channels x fields) matrix, reduced over channels in a single pass
+        values = np.array([[ch[field] for field in _AGGREGATE_FIELDS] for ch in channels], dtype=np.float64)
+        spend = values[:, 0] * np.array([ch['cpl'] for ch in channels], dtype=np.float64)
+        (total_leads, total_contacts, total_meetings_scheduled, total_meetings_held,
+         total_sales, total_revenue) = values.sum(axis=0).tolist()
+        total_cost = spend.sum().item()
         
         # Calculate blended rates
         blended_contact_rate = total_contacts / total_leads if total_leads > 0 else 0
@@ -226,60 +309,86 @@ class MultiChannelGTM:
         """
         Get default channel configurations for SMB, MID, ENT
         """
-        smb_channel = MultiChannelGTM.define_channel(
-            name="SMB Channel",
-            lead_source="Inbound Marketing",
-            segment="SMB",
-            monthly_leads=1000,
-            contact_rate=0.65,
-            meeting_rate=0.40,
-            show_up_rate=0.70,
-            close_rate=0.30,
-            avg_deal_value=15000,
-            cpl=50,
-            sales_cycle_days=21
-        )
-        
-        mid_channel = MultiChannelGTM.define_channel(
-            name="MID Channel",
-            lead_source="Outbound SDR",
-            segment="MID",
-            monthly_leads=300,
-            contact_rate=0.55,
-            meeting_rate=0.35,
-            show_up_rate=0.75,
-            close_rate=0.25,
-            avg_deal_value=50000,
-            cpl=200,
-            sales_cycle_days=45
-        )
-        
-        ent_channel = MultiChannelGTM.define_channel(
-            name="ENT Channel",
-            lead_source="Account-Based Marketing",
-            segment="ENT",
-            monthly_leads=50,
-            contact_rate=0.45,
-            meeting_rate=0.30,
-            show_up_rate=0.85,
-            close_rate=0.20,
-            avg_deal_value=250000,
-            cpl=1000,
-            sales_cycle_days=90
-        )
-        
-        return [smb_channel, mid_channel, ent_channel]
+        return [dict(ch) for ch in _default_channels()]
     
     @staticmethod
-    def calculate_channel_efficiency(channel: Dict) -> Dict[str, float]:
+    def calculate_channel_efficiency(channel: Dict) -> 'ChannelEfficiency':
         """
         Calculate efficiency metrics for a channel
         """
-        return {
-            'lead_to_sale': channel['sales'] / channel['monthly_leads'] if channel['monthly_leads'] > 0 else 0,
-            'cost_per_meeting': channel['cpl'] / (channel['contact_rate'] * channel['meeting_rate'] * channel['show_up_rate']) if channel['show_up_rate'] > 0 else 0,
-            'meeting_to_sale': channel['close_rate'],
-            'revenue_per_lead': channel['revenue'] / channel['monthly_leads'] if channel['monthly_leads'] > 0 else 0,
-            'ltv_cac_ratio': (channel['avg_deal_value'] * 0.8) / channel['cac'] if channel['cac'] > 0 else 0,  # Assuming 80% gross margin
-            'payback_months': channel['cac'] / (channel['avg_deal_value'] * 0.08) if channel['avg_deal_value'] > 0 else 0  # Assuming 8% monthly retention
-        }
+        leads = channel['monthly_leads']
+        avg_deal_value = channel['avg_deal_value']
+        cac = channel['cac']
+        to_meeting = channel['contact_rate'] * channel['meeting_rate'] * channel['show_up_rate']
+        
+        return ChannelEfficiency(
+            lead_to_sale=channel['sales'] / leads if leads > 0 else 0,
+            cost_per_meeting=channel['cpl'] / to_meeting if to_meeting > 0 else 0,
+            meeting_to_sale=channel['close_rate'],
+            revenue_per_lead=channel['revenue'] / leads if leads > 0 else 0,
+            ltv_cac_ratio=(avg_deal_value * 0.8) / cac if cac > 0 else 0,  # Assuming 80% gross margin
+            payback_months=cac / (avg_deal_value * 0.08) if avg_deal_value > 0 else 0  # Assuming 8% monthly retention
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelEfficiency:
+    """Efficiency metrics for one GTM channel"""
+    lead_to_sale: float
+    cost_per_meeting: float
+    meeting_to_sale: float
+    revenue_per_lead: float
+    ltv_cac_ratio: float
+    payback_months: float
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Plain dict for callers that still expect the old shape"""
+        return asdict(self)
+
+
+@lru_cache(maxsize=1)
+def _default_channels() -> Tuple[MappingProxyType, ...]:
+    """Default SMB/MID/ENT channels, built once; read-only so the cache can't be edited"""
+    smb_channel = MultiChannelGTM.define_channel(
+        name="SMB Channel",
+        lead_source="Inbound Marketing",
+        segment="SMB",
+        monthly_leads=1000,
+        contact_rate=0.65,
+        meeting_rate=0.40,
+        show_up_rate=0.70,
+        close_rate=0.30,
+        avg_deal_value=15000,
+        cpl=50,
+        sales_cycle_days=21
+    )
+    
+    mid_channel = MultiChannelGTM.define_channel(
+        name="MID Channel",
+        lead_source="Outbound SDR",
+        segment="MID",
+        monthly_leads=300,
+        contact_rate=0.55,
+        meeting_rate=0.35,
+        show_up_rate=0.75,
+        close_rate=0.25,
+        avg_deal_value=50000,
+        cpl=200,
+        sales_cycle_days=45
+    )
+    
+    ent_channel = MultiChannelGTM.define_channel(
+        name="ENT Channel",
+        lead_source="Account-Based Marketing",
+        segment="ENT",
+        monthly_leads=50,
+        contact_rate=0.45,
+        meeting_rate=0.30,
+        show_up_rate=0.85,
+        close_rate=0.20,
+        avg_deal_value=250000,
+        cpl=1000,
+        sales_cycle_days=90
+    )
+    
+    return tuple(MappingProxyType(ch) for ch in (smb_channel, mid_channel, ent_channel))
@@ -2,15 +2,21 @@
 Scenario Engine: Sensitivity analysis and what-if modeling
 """
 
-from typing import Dict, Callable, Any, List, Tuple
-import copy
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 
 def calculate_sensitivity(
     baseline_fn: Callable[[Dict], float],
     inputs: Dict[str, float],
     bump_pct: float = 0.01,
-    metric_name: str = "output"
+    metric_name: str = "output",
+    batch_fn: Optional[Callable[[np.ndarray, List[str]], np.ndarray]] = None
 ) -> Dict[str, Dict[str, float]]:
     """
     Calculate sensitivity of output to each input variable.
@@ -20,6 +26,10 @@ def calculate_sensitivity(
         inputs: Dictionary of input variables {name: value}
         bump_pct: How much to bump each input (0.01 = 1%)
         metric_name: Name of the output metric for display
+        batch_fn: Optional vectorized model - takes a (K+1, K) matrix of input
+            rows (row 0 = baseline, row i+1 = input i bumped) and the K input
+            names, returns the (K+1,) outputs. Replaces the per-input calls
+            to baseline_fn.
     
     Returns:
         Dict mapping input name to sensitivity metrics:
@@ -35,6 +45,9 @@ def calculate_sensitivity(
             ...
         }
     """
+    if batch_fn is not None:
+        return _batch_sensitivity(batch_fn, inputs, bump_pct)
+    
     baseline_output = baseline_fn(inputs)
     sensitivities = {}
     
@@ -88,10 +101,67 @@ def calculate_sensitivity(
     return sensitivities
 
 
+def _batch_sensitivity(
+    batch_fn: Callable[[np.ndarray, List[str]], np.ndarray],
+    inputs: Dict[str, float],
+    bump_pct: float
+) -> Dict[str, Dict[str, float]]:
+    """calculate_sensitivity with every bumped scenario evaluated in one batch_fn call"""
+    keys = list(inputs)
+    values = np.array([inputs[k] for k in keys], dtype=np.float64)
+    bumped_values = values * (1 + bump_pct)
+    
+    rows = np.tile(values, (len(keys) + 1, 1))
+    np.fill_diagonal(rows[1:], bumped_values)
+    outputs = np.asarray(batch_fn(rows, keys), dtype=np.float64)
+    baseline_output = outputs[0]
+    bumped_outputs = outputs[1:]
+    
+    # Zero inputs can't be bumped meaningfully; zero baseline has no % change
+    bumpable = values != 0
+    if baseline_output != 0:
+        sensitivity = (bumped_outputs - baseline_output) / baseline_output / bump_pct
+        sensitivity[~bumpable] = 0
+    else:
+        sensitivity = np.zeros(len(keys))
+    abs_sensitivity = np.abs(sensitivity)
+    abs_change = np.abs(bumped_outputs - baseline_output)
+    
+    baseline_output = baseline_output.item()
+    sensitivities = {}
+    for i, key in enumerate(keys):
+        if not bumpable[i]:
+            sensitivities[key] = {
+                'baseline': inputs[key],
+                'bumped': inputs[key],
+                'output_baseline': baseline_output,
+                'output_bumped': baseline_output,
+                'sensitivity': 0,
+                'abs_sensitivity': 0
+            }
+            continue
+        sensitivities[key] = {
+            'baseline': inputs[key],
+            'bumped': bumped_values[i].item(),
+            'output_baseline': baseline_output,
+            'output_bumped': bumped_outputs[i].item(),
+            'sensitivity': sensitivity[i].item(),
+            'abs_sensitivity': abs_sensitivity[i].item(),
+            'abs_change': abs_change[i].item()
+        }
+    
+    # Rank by absolute sensitivity (stable, like sorted())
+    for rank, i in enumerate(np.argsort(-abs_sensitivity, kind='stable'), 1):
+        sensitivities[keys[i]]['rank'] = rank
+    
+    return sensitivities
+
+
 def multi_metric_sensitivity(
     baseline_fn: Callable[[Dict], Dict[str, float]],
     inputs: Dict[str, float],
-    bump_pct: float = 0.01
+    bump_pct: float = 0.01,
+    parallel: bool = False
 ) -> Dict[str, Dict[str, Any]]:
     """
     Calculate sensitivity for multiple output metrics at once.
@@ -100,6 +170,9 @@ def multi_metric_sensitivity(
         baseline_fn: Function returning dict of metrics {metric_name: value}
         inputs: Input variables
         bump_pct: Bump percentage
+        parallel: Run the bumped evaluations on a thread pool. Only pays off
+            when baseline_fn releases the GIL (NumPy-heavy models), and
+            baseline_fn must be thread-safe (no st.* calls).
     
     Returns:
         Nested dict: {metric_name: {input_name: sensitivity_data}}
@@ -107,6 +180,18 @@ def multi_metric_sensitivity(
     baseline_outputs = baseline_fn(inputs)
     results = {metric: {} for metric in baseline_outputs.keys()}
     
+    # Bumps are independent - evaluate them all up front
+    bumped_scenarios = [
+        {**inputs, key: value * (1 + bump_pct)}
+        for key, value in inputs.items() if value != 0
+    ]
+    if parallel and len(bumped_scenarios) > 1:
+        workers = min(len(bumped_scenarios), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            bumped_results = iter(list(pool.map(baseline_fn, bumped_scenarios)))
+    else:
+        bumped_results = map(baseline_fn, bumped_scenarios)
+    
     for key, value in inputs.items():
         if value == 0:
             for metric in baseline_outputs.keys():
@@ -117,10 +202,7 @@ def multi_metric_sensitivity(
                 }
             continue
         
-        # Bump this input
-        bumped_inputs = inputs.copy()
-        bumped_inputs[key] = value * (1 + bump_pct)
-        bumped_outputs = baseline_fn(bumped_inputs)
+        bumped_outputs = next(bumped_results)
         
         # Calculate sensitivity for each metric
         for metric, baseline_val in baseline_outputs.items():
@@ -167,13 +249,13 @@ def get_top_drivers(
     if metric not in sensitivities:
         return []
     
-    items = [
+    items = (
         (key, data['sensitivity'])
         for key, data in sensitivities[metric].items()
-    ]
+    )
     
-    sorted_items = sorted(items, key=lambda x: abs(x[1]), reverse=True)
-    return sorted_items[:top_n]
+    # Partial selection; same order (ties included) as sorted(...)[:top_n]
+    return heapq.nlargest(top_n, items, key=lambda x: abs(x[1]))
 
 
 def create_scenario_delta(
@@ -197,6 +279,11 @@ def create_scenario_delta(
     return scenario
 
 
+def _pct_change(diff: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """diff / base * 100; a zero base gives 0% if unchanged, otherwise infinite"""
+    return np.divide(diff, base, out=np.where(diff == 0, 0.0, np.inf), where=base != 0) * 100
+
+
 def compare_scenarios(
     scenario_a: Dict[str, float],
     scenario_b: Dict[str, float],
@@ -216,29 +303,27 @@ def compare_scenarios(
     results_a = calculator_fn(scenario_a)
     results_b = calculator_fn(scenario_b)
     
-    delta = {}
-    delta_pct = {}
+    metrics = list(results_a)
+    values_a = np.fromiter((results_a[m] for m in metrics), dtype=np.float64, count=len(metrics))
+    values_b = np.fromiter((results_b[m] for m in metrics), dtype=np.float64, count=len(metrics))
+    diff = values_b - values_a
     
-    for metric in results_a.keys():
-        diff = results_b[metric] - results_a[metric]
-        delta[metric] = diff
-        
-        if results_a[metric] != 0:
-            delta_pct[metric] = (diff / results_a[metric]) * 100
-        else:
-            delta_pct[metric] = 0 if diff == 0 else float('inf')
+    pct = _pct_change(diff, values_a)
     
     return {
         'scenario_a': results_a,
         'scenario_b': results_b,
-        'delta': delta,
-        'delta_pct': delta_pct
+        'delta': dict(zip(metrics, diff.tolist())),
+        'delta_pct': dict(zip(metrics, pct.tolist()))
     }
 
 
 class ScenarioManager:
     """
     Manage named scenarios for comparison.
+    
+    Scenarios are flat {input_name: number} dicts, so a one-level dict()
+    copy is enough to keep callers from mutating saved scenarios.
     """
     
     def __init__(self):
@@ -247,12 +332,12 @@ class ScenarioManager:
     
     def add_scenario(self, name: str, inputs: Dict[str, float], description: str = ""):
         """Save a named scenario"""
-        self.scenarios[name] = copy.deepcopy(inputs)
+        self.scenarios[name] = dict(inputs)
         self.descriptions[name] = description
     
     def get_scenario(self, name: str) -> Dict[str, float]:
         """Retrieve a scenario by name"""
-        return copy.deepcopy(self.scenarios.get(name, {}))
+        return dict(self.scenarios.get(name, {}))
     
     def list_scenarios(self) -> List[str]:
         """List all scenario names"""
@@ -273,6 +358,51 @@ class ScenarioManager:
         
         return compare_scenarios(scenario_a, scenario_b, calculator_fn)
     
+    def as_frame(self, names: Optional[List[str]] = None) -> pd.DataFrame:
+        """Saved scenarios as one table: a row per scenario, a column per input"""
+        names = self.list_scenarios() if names is None else names
+        missing = [name for name in names if name not in self.scenarios]
+        if missing:
+            raise ValueError(f"Scenario not found: {', '.join(missing)}")
+        return pd.DataFrame.from_dict({name: self.scenarios[name] for name in names}, orient='index')
+    
+    def compare_many(
+        self,
+        names: List[str],
+        batch_fn: Callable[[np.ndarray, List[str]], Dict[str, np.ndarray]]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Compare several saved scenarios against the first with one model call.
+        
+        Args:
+            names: Scenario names; names[0] is the baseline
+            batch_fn: Vectorized calculator - takes an (N, K) input matrix and
+                the K input names, returns {metric: (N,) array}
+        
+        Returns:
+            {'inputs', 'results', 'delta', 'delta_pct'} frames indexed by scenario
+        """
+        inputs = self.as_frame(names)
+        if inputs.isna().any(axis=None):
+            raise ValueError("Scenarios must share the same inputs to be compared in bulk")
+        
+        keys = list(inputs.columns)
+        outputs = batch_fn(inputs.to_numpy(dtype=np.float64), keys)
+        results = pd.DataFrame(
+            {metric: np.asarray(values, dtype=np.float64) for metric, values in outputs.items()},
+            index=inputs.index
+        )
+        
+        values = results.to_numpy()
+        diff = values - values[0]
+        return {
+            'inputs': inputs,
+            'results': results,
+            'delta': pd.DataFrame(diff, index=results.index, columns=results.columns),
+            'delta_pct': pd.DataFrame(_pct_change(diff, np.broadcast_to(values[0], diff.shape)),
+                                      index=results.index, columns=results.columns)
+        }
+    
     def delete_scenario(self, name: str):
         """Delete a scenario"""
         if name in self.scenarios:
@@ -289,5 +419,5 @@ class ScenarioManager:
     
     def import_from_dict(self, data: Dict):
         """Import scenarios from a dict"""
-        self.scenarios = copy.deepcopy(data.get('scenarios', {}))
-        self.descriptions = copy.deepcopy(data.get('descriptions', {}))
+        self.scenarios = {name: dict(inputs) for name, inputs in data.get('scenarios', {}).items()}
+        self.descriptions = dict(data.get('descriptions', {}))
@@ -4,8 +4,74 @@ State management and cache key generation
 
 import json
 import hashlib
+from types import MappingProxyType
 from typing import Any, List, Dict
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if ORJSON_AVAILABLE else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    """Encode NumPy values by content (str() elides big arrays); anything else as str"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def _serialize(objects: tuple) -> bytes:
+    """Sorted-key JSON bytes; orjson when installed (no str round-trip)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(objects, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(objects, sort_keys=True, default=_default).encode()
+
+
+def _digest(data: bytes) -> str:
+    """128-bit hex fingerprint; xxh3 when installed, else BLAKE2b"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _short_digest(data: bytes) -> str:
+    """32-bit fingerprint as 8 hex chars; xxh32 when installed, else BLAKE2b-32"""
+    if XXHASH_AVAILABLE:
+        return f"{xxhash.xxh32_intdigest(data):08x}"
+    return hashlib.blake2b(data, digest_size=4).hexdigest()
+
+
+def _serialize_any(objects: tuple) -> bytes:
+    """_serialize, falling back for inputs the fast encoder rejects"""
+    try:
+        return _serialize(objects)
+    except (TypeError, ValueError):
+        # Non-string dict keys, huge ints, ... - fall back to the stdlib
+        # encoder, then to the string representation
+        try:
+            return json.dumps(objects, sort_keys=True, default=_default).encode()
+        except (TypeError, ValueError):
+            return str(objects).encode()
+
 
 def hash_key(*objects: Any) -> str:
     """
@@ -16,14 +82,9 @@ def hash_key(*objects: Any) -> str:
         *objects: Any JSON-serializable objects
     
     Returns:
-        MD5 hash string (32 chars)
+        128-bit hex digest (32 chars) - xxh3 or BLAKE2b, see _digest
     """
-    try:
-        serialized = json.dumps(objects, sort_keys=True, default=str)
-        return hashlib.md5(serialized.encode()).hexdigest()
-    except (TypeError, ValueError) as e:
-        # Fallback to string representation
-        return hashlib.md5(str(objects).encode()).hexdigest()
+    return _digest(_serialize_any(objects))
 
 
 def version_token(prefix: str, *dependencies: Any) -> str:
@@ -37,8 +98,7 @@ def version_token(prefix: str, *dependencies: Any) -> str:
     Returns:
         Version string like 'gtm_v1_abc123def'
     """
-    hash_suffix = hash_key(*dependencies)[:8]  # Short hash
-    return f"{prefix}_{hash_suffix}"
+    return f"{prefix}_{_short_digest(_serialize_any(dependencies))}"
 
 
 def extract_gtm_state(session_state) -> Dict:
@@ -48,7 +108,9 @@ def extract_gtm_state(session_state) -> Dict:
     Returns dict with only the fields that affect GTM calculations.
     """
     return {
-        'channels': session_state.get('gtm_channels', []),
+        # Copy the (flat) channel dicts - the UI edits them in place, and a
+        # snapshot must not change with it
+        'channels': [dict(ch) for ch in session_state.get('gtm_channels', [])],
         'avg_deal_value': session_state.get('avg_deal_value'),
         'upfront_pct': session_state.get('upfront_payment_pct'),
         'grr': session_state.get('grr_rate')
@@ -107,11 +169,19 @@ class StateSnapshot:
     """
     Immutable snapshot of relevant state for calculations.
     Prevents accidental mutation and makes cache keys deterministic.
+    
+    The data is held in a read-only mapping; hashes are computed on first
+    use, so snapshots that are built and dropped never serialize anything.
     """
+    __slots__ = ('_data', '_hash', '_part_hashes')
     
     def __init__(self, **kwargs):
-        self._data = dict(kwargs)
-        self._hash = hash_key(self._data)
+        object.__setattr__(self, '_data', MappingProxyType(kwargs))
+        object.__setattr__(self, '_hash', None)
+        object.__setattr__(self, '_part_hashes', {})
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"StateSnapshot is immutable (tried to set {name!r})")
     
     def __getitem__(self, key):
         return self._data[key]
@@ -120,18 +190,26 @@ class StateSnapshot:
         return self._data.get(key, default)
     
     def to_dict(self) -> Dict:
-        return self._data.copy()
+        return dict(self._data)
     
     def cache_key(self) -> str:
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash_key(dict(self._data)))
         return self._hash
     
+    def part_key(self, key: str) -> str:
+        """hash_key of one section (e.g. 'gtm'), computed once per snapshot"""
+        if key not in self._part_hashes:
+            self._part_hashes[key] = hash_key(self._data.get(key))
+        return self._part_hashes[key]
+    
     def __hash__(self):
-        return hash(self._hash)
+        return hash(self.cache_key())
     
     def __eq__(self, other):
         if not isinstance(other, StateSnapshot):
             return False
-        return self._hash == other._hash
+        return self.cache_key() == other.cache_key()
 
 
 def create_business_snapshot(session_state) -> StateSnapshot:
@@ -146,6 +224,14 @@ def create_business_snapshot(session_state) -> StateSnapshot:
     )
 
 
+# Scope -> extractor for that snapshot section, used by has_state_changed
+_SCOPE_EXTRACTORS = {
+    'gtm': extract_gtm_state,
+    'pnl': extract_pnl_state,
+    'comp': extract_compensation_state,
+}
+
+
 def has_state_changed(
     session_state,
     last_snapshot: StateSnapshot,
@@ -162,18 +248,16 @@ def has_state_changed(
     Returns:
         True if state has changed
     """
-    if scope == 'gtm':
-        current = extract_gtm_state(session_state)
-        return hash_key(current) != hash_key(last_snapshot.get('gtm'))
-    
-    elif scope == 'pnl':
-        current = extract_pnl_state(session_state)
-        return hash_key(current) != hash_key(last_snapshot.get('pnl'))
-    
-    elif scope == 'comp':
-        current = extract_compensation_state(session_state)
-        return hash_key(current) != hash_key(last_snapshot.get('comp'))
+    extract = _SCOPE_EXTRACTORS.get(scope)
+    if extract is not None:
+        current = extract(session_state)
+        # Plain equality is far cheaper than serializing; hash only on a miss
+        if current == last_snapshot.get(scope):
+            return False
+        return hash_key(current) != last_snapshot.part_key(scope)
     
-    else:  # 'all'
-        current_snapshot = create_business_snapshot(session_state)
-        return current_snapshot.cache_key() != last_snapshot.cache_key()
+    # 'all'
+    current_snapshot = create_business_snapshot(session_state)
+    if current_snapshot.to_dict() == last_snapshot.to_dict():
+        return False
+    return current_snapshot.cache_key() != last_snapshot.cache_key()
@@ -0,0 +1,183 @@
+"""
+Test suite for enhanced calculations - timeline math and sensitivity tables
+Run with: pytest modules/tests/test_calculations_enhanced.py -v
+"""
+
+import numpy as np
+import pytest
+from modules.calculations_enhanced import (
+    EnhancedRevenueCalculator, TeamMetricsCalculator, BottleneckAnalyzer, _timeline_core
+)
+
+
+# ============= TIMELINE TESTS =============
+
+def test_timeline_deferred_arrives_month_19():
+    """Deferred 30% from month-1 sales lands 18 months later, times persistency"""
+    df = EnhancedRevenueCalculator.calculate_monthly_timeline(10, 1000, num_months=24)
+    deferred_per_sale = 1000 * 300 * 0.027 * 0.3
+    
+    assert (df['deferred_revenue'].iloc[:18] == 0).all()
+    assert df['deferred_revenue'].iloc[18] == pytest.approx(10 * deferred_per_sale * 0.9)
+
+
+def test_timeline_cumulative_matches_running_sum():
+    """Cumulative columns equal running sums of the monthly columns"""
+    df = EnhancedRevenueCalculator.calculate_monthly_timeline(10, 1000, num_months=30, growth_rate=0.02)
+    
+    assert np.allclose(df['cumulative_total'], df['total_revenue'].cumsum())
+    assert np.allclose(df['cumulative_immediate'], df['immediate_revenue'].cumsum())
+
+
+def test_timeline_float32_columns_within_a_cent():
+    """float32 monthly columns stay within $0.01 of the float64 math"""
+    df = EnhancedRevenueCalculator.calculate_monthly_timeline(10, 1000, num_months=36, growth_rate=0.015)
+    kernel = getattr(_timeline_core, 'py_func', _timeline_core)
+    per_sale = 1000 * 300 * 0.027
+    sales, immediate, deferred = kernel(36, 10.0, per_sale * 0.7, per_sale * 0.3, 0.9, 0.015)
+    
+    assert df['total_revenue'].dtype == np.float32
+    assert np.abs(df['immediate_revenue'].to_numpy(np.float64) - immediate).max() < 0.01
+    assert np.abs(df['total_revenue'].to_numpy(np.float64) - (immediate + deferred)).max() < 0.01
+    assert df['cumulative_total'].iloc[-1] == pytest.approx((immediate + deferred).sum(), abs=0.01)
+
+
+def test_timeline_float32_large_flows_relative_precision():
+    """Above ~$131k/month float32 keeps ~7 significant digits; running totals stay exact"""
+    df = EnhancedRevenueCalculator.calculate_monthly_timeline(25, 1200, num_months=36, growth_rate=0.015)
+    kernel = getattr(_timeline_core, 'py_func', _timeline_core)
+    per_sale = 1200 * 300 * 0.027
+    sales, immediate, deferred = kernel(36, 25.0, per_sale * 0.7, per_sale * 0.3, 0.9, 0.015)
+    
+    assert np.allclose(df['total_revenue'], immediate + deferred, rtol=1e-7, atol=0)
+    assert df['cumulative_total'].iloc[-1] == pytest.approx((immediate + deferred).sum(), abs=0.01)
+
+
+def test_timeline_kernel_matches_closed_form():
+    """Loop kernel (JIT or not) reproduces the closed-form growth math"""
+    kernel = getattr(_timeline_core, 'py_func', _timeline_core)
+    sales, immediate, deferred = kernel(40, 10.0, 5670.0, 2430.0, 0.9, 0.03)
+    expected_sales = 10.0 * 1.03 ** np.arange(40)
+    
+    assert np.allclose(sales, expected_sales)
+    assert np.allclose(immediate, expected_sales * 5670.0)
+    assert np.allclose(deferred[18:], expected_sales[:-18] * 2430.0 * 0.9)
+
+
+def test_timeline_cached_result_not_shared():
+    """Mutating a returned timeline doesn't leak into later calls"""
+    df = EnhancedRevenueCalculator.calculate_monthly_timeline(5, 500)
+    df['sales'] = -1
+    
+    again = EnhancedRevenueCalculator.calculate_monthly_timeline(5, 500)
+    assert (again['sales'] == 5).all()
+
+
+def test_timeline_cell_writes_do_not_reach_cache():
+    """In-place edits on a returned timeline copy on write"""
+    df = EnhancedRevenueCalculator.calculate_monthly_timeline(7, 700)
+    df.loc[0, 'total_revenue'] = 0.0
+    
+    again = EnhancedRevenueCalculator.calculate_monthly_timeline(7, 700)
+    assert again.loc[0, 'total_revenue'] > 0
+
+
+def test_importing_module_leaves_pandas_options_alone():
+    """The module must not switch process-wide pandas modes (CoW is opt-in on 2.x)"""
+    import subprocess
+    import sys
+    from pathlib import Path
+    script = (
+        "import warnings; warnings.simplefilter('ignore'); import pandas as pd; "
+        "before = pd.get_option('mode.copy_on_write'); "
+        "import modules.calculations_enhanced; "
+        "print(before == pd.get_option('mode.copy_on_write'))"
+    )
+    repo_root = Path(__file__).resolve().parents[2]
+    result = subprocess.run([sys.executable, '-c', script], cwd=repo_root,
+                            capture_output=True, text=True, check=True)
+    
+    assert result.stdout.strip() == 'True'
+
+
+
+# ============= RAMP TESTS =============
+
+def test_ramp_pads_curve_to_full_productivity():
+    """Months past the curve are fully productive; one extra ramped month included"""
+    ramp = TeamMetricsCalculator.calculate_ramp_impact(4, ramp_months=5, productivity_curve=[0.5, 0.8])
+    
+    assert ramp['month'].tolist() == [1, 2, 3, 4, 5, 6]
+    assert ramp['productivity'].tolist() == [0.5, 0.8, 1.0, 1.0, 1.0, 1.0]
+    assert ramp['effective_capacity'].tolist() == pytest.approx([2.0, 3.2, 4.0, 4.0, 4.0, 4.0])
+    assert ramp['status'].tolist()[:3] == ['Ramping', 'Ramping', 'Fully Productive']
+
+
+def test_ramp_dataframe_opt_in():
+    """as_dataframe=True returns the same columns as a DataFrame"""
+    df = TeamMetricsCalculator.calculate_ramp_impact(3, as_dataframe=True)
+    
+    assert list(df.columns) == ['month', 'new_hires', 'productivity',
+                                'effective_capacity', 'cost_efficiency', 'status']
+    assert len(df) == 4
+
+
+# ============= SENSITIVITY TESTS =============
+
+def test_sensitivity_applies_coefficients():
+    """Each KPI impact is change × coefficient; untouched KPIs are NaN"""
+    df = BottleneckAnalyzer.analyze_sensitivity(
+        {'close_rate': 0.25},
+        {'close_rate': [-0.1, 0.1], 'avg_deal_size': [0.2]}
+    )
+    
+    close = df[df['variable'] == 'close_rate']
+    assert close['new_value'].tolist() == pytest.approx([0.225, 0.275])
+    assert close['ebitda_impact'].tolist() == pytest.approx([-0.08, 0.08])
+    assert close['ltv_impact'].isna().all()
+    
+    deal = df[df['variable'] == 'avg_deal_size']
+    assert deal['new_value'].iloc[0] == pytest.approx(1.2)  # Missing base defaults to 1
+
+
+def test_sensitivity_batch_matches_per_variable_calls():
+    """One batch call equals stacking single-variable calls"""
+    base = {'close_rate': 0.25, 'cost_per_lead': 150}
+    batch = BottleneckAnalyzer.analyze_sensitivity_batch(
+        base, {'close_rate': [-0.2, 0.2], 'cost_per_lead': 0.1}
+    )
+    
+    close = BottleneckAnalyzer.analyze_sensitivity(base, {'close_rate': [-0.2, 0.2]})
+    cpl = BottleneckAnalyzer.analyze_sensitivity(base, {'cost_per_lead': [0.1]})
+    
+    assert len(batch) == 3
+    assert batch['sales_impact'].iloc[:2].tolist() == close['sales_impact'].tolist()
+    assert batch['cac_impact'].iloc[2] == pytest.approx(cpl['cac_impact'].iloc[0])
+    assert batch['new_value'].iloc[2] == pytest.approx(165.0)
+
+
+# ============= HEALTH TESTS =============
+
+def test_health_nan_ratio_scores_at_cap():
+    """A NaN capped ratio scores 100, as the per-score min(100, x) did"""
+    from modules.calculations_enhanced import _health_metrics
+    team = {'utilization': 0.75, 'ramp_efficiency': 0.7, 'attrition_rate': 0.15}
+    financial = {'ltv_cac_ratio': 3, 'ebitda_margin': 0.15, 'growth_rate': 0.1}
+    
+    scores = _health_metrics({'contact_rate': float('nan'), 'meeting_rate': 0.35, 'close_rate': 0.25},
+                             team, financial)
+    
+    assert scores['funnel_health'] == pytest.approx(100)
+    assert scores['overall_health'] == pytest.approx(0.3 * 100 + 0.3 * 85 + 0.4 * (60 + 50 + 50) / 3)
+    assert scores['status'] == '🟡 Good'
+
+
+@pytest.mark.parametrize("ramp_efficiency", [float('nan'), float('inf')])
+def test_health_undefined_overall_is_critical(ramp_efficiency):
+    """A non-finite overall score never shows as a good status"""
+    from modules.calculations_enhanced import _health_metrics
+    
+    scores = _health_metrics({}, {'ramp_efficiency': ramp_efficiency}, {})
+    
+    assert not np.isfinite(scores['overall_health'])
+    assert (scores['status'], scores['color']) == ('🔴 Critical', 'red')
@@ -0,0 +1,154 @@
+"""
+Test suite for improved calculations - P&L layout and cost funnel math
+Run with: pytest modules/tests/test_calculations_improved.py -v
+"""
+
+import pytest
+import numpy as np
+from modules.calculations_improved import (
+    ImprovedCostCalculator, ImprovedPnLCalculator, ImprovedReverseEngineering
+)
+
+
+# ============= FIXTURES =============
+
+@pytest.fixture
+def sample_revenue():
+    """Monthly revenue inputs"""
+    return {
+        'monthly_sales': 10,
+        'immediate_revenue': 50000,
+        'deferred_revenue': 20000,
+        'total_projected': 900000
+    }
+
+
+@pytest.fixture
+def sample_costs():
+    """Monthly cost inputs"""
+    return {
+        'cogs': 5000,
+        'marketing_costs': 10000,
+        'commissions': 8000,
+        'sales_base_salaries': 20000,
+        'office_rent': 3000,
+        'software': 1000,
+        'other_opex': 500,
+        'gov_fee_pct': 0.15
+    }
+
+
+def _line(pnl, line_item):
+    """Row of the P&L columns for a line item"""
+    row = list(pnl['line_item']).index(line_item)
+    return {column: values[row] for column, values in pnl.items()}
+
+
+# ============= P&L TESTS =============
+
+def test_pnl_net_ebitda_waterfall(sample_revenue, sample_costs):
+    """Net EBITDA = revenue - COGS - OpEx - gov fees, for month 1 and month 18"""
+    pnl = ImprovedPnLCalculator.calculate_detailed_pnl(sample_revenue, sample_costs)
+    opex = 10000 + 8000 + 20000 + 3000 + 1000 + 500
+    
+    assert _line(pnl, 'TOTAL OPERATING EXPENSES')['month_1'] == -opex
+    assert _line(pnl, 'NET EBITDA')['month_1'] == pytest.approx(50000 - 5000 - opex - 50000 * 0.15)
+    assert _line(pnl, 'NET EBITDA')['month_18'] == pytest.approx(70000 - 5000 - opex - 70000 * 0.15)
+    assert _line(pnl, 'Gov Fees (15%)')['pct_of_revenue'] == pytest.approx(-0.15)
+
+
+def test_pnl_projection_blends_deferred_months(sample_revenue, sample_costs):
+    """Flat lines scale by months; blended lines switch rate after month 17"""
+    pnl = ImprovedPnLCalculator.calculate_detailed_pnl(sample_revenue, sample_costs, projection_months=24)
+    gross = _line(pnl, 'GROSS PROFIT')
+    
+    assert _line(pnl, 'Lead Generation')['total_projection'] == -10000 * 24
+    assert _line(pnl, 'Deferred Collections (30%)')['total_projection'] == 20000 * 7
+    assert gross['total_projection'] == pytest.approx(gross['month_1'] * 17 + gross['month_18'] * 7)
+    assert _line(pnl, 'GROSS REVENUE')['total_projection'] == 900000
+
+
+def test_pnl_cogs_line_only_when_nonzero(sample_revenue, sample_costs):
+    """COGS row is omitted without direct costs"""
+    with_cogs = ImprovedPnLCalculator.calculate_detailed_pnl(sample_revenue, sample_costs)
+    no_cogs = ImprovedPnLCalculator.calculate_detailed_pnl(sample_revenue, {**sample_costs, 'cogs': 0})
+    
+    assert 'Cost of Goods Sold' in with_cogs['line_item'].tolist()
+    assert 'Cost of Goods Sold' not in no_cogs['line_item'].tolist()
+    assert len(no_cogs['month_1']) == len(with_cogs['month_1']) - 1
+
+
+def test_pnl_zero_revenue_no_divide_by_zero(sample_costs):
+    """Percent-of-revenue falls back to 0 without revenue"""
+    pnl = ImprovedPnLCalculator.calculate_detailed_pnl({}, sample_costs)
+    
+    assert _line(pnl, 'Lead Generation')['pct_of_revenue'] == 0
+    assert _line(pnl, 'EBITDA Margin %')['month_1'] == 0
+
+
+def test_pnl_columns_read_only_and_dataframe_option(sample_revenue, sample_costs):
+    """Cached columns can't be mutated; as_dataframe builds the frame at the edge"""
+    columns = ImprovedPnLCalculator.calculate_detailed_pnl(sample_revenue, sample_costs)
+    with pytest.raises(ValueError):
+        columns['month_1'][0] = 0
+    
+    pnl = ImprovedPnLCalculator.calculate_detailed_pnl(sample_revenue, sample_costs, as_dataframe=True)
+    assert list(pnl.columns) == list(columns)
+    assert pnl['month_1'].sum() == pytest.approx(columns['month_1'].sum())
+    assert pnl['category'].dtype == 'category'
+    assert (pnl['category'] == 'OPEX').sum() == 7
+
+
+
+def test_pnl_monthly_columns_float32_projection_float64(sample_revenue, sample_costs):
+    """Monthly lines are narrowed to float32; multi-month totals keep float64"""
+    columns = ImprovedPnLCalculator.calculate_detailed_pnl(sample_revenue, sample_costs)
+    
+    assert columns['month_1'].dtype == np.float32
+    assert columns['pct_of_revenue'].dtype == np.float32
+    assert columns['total_projection'].dtype == np.float64
+    assert _line(columns, 'Immediate Collections (70%)')['month_1'] == 50000
+
+
+# ============= ACQUISITION COST TESTS =============
+
+STAGE_KEYS = ['cost_per_lead', 'cost_per_contact', 'cost_per_meeting_scheduled',
+              'cost_per_meeting_held', 'cost_per_sale']
+
+
+@pytest.mark.parametrize('input_type', ['CPL', 'CPA', 'Total Budget'])
+def test_acquisition_batch_matches_scalar(input_type):
+    """Each batch row equals the single-input stage costs"""
+    volume = {'leads': 400, 'contact_rate': 0.6, 'meeting_rate': 0.35,
+              'show_up_rate': 0.75, 'close_rate': 0.25}
+    inputs = np.array([50.0, 150.0, 60000.0])
+    
+    matrix = ImprovedCostCalculator.calculate_acquisition_costs_batch(input_type, inputs, volume)
+    
+    assert matrix.shape == (3, 5)
+    for row, value in zip(matrix, inputs):
+        costs = ImprovedCostCalculator.from_volume_dict(input_type, value, volume)
+        assert row == pytest.approx([costs[key] for key in STAGE_KEYS])
+
+
+def test_acquisition_zero_rate_leaves_later_stages_unpriced():
+    """A zero show-up rate prices held meetings and sales at 0"""
+    costs = ImprovedCostCalculator.calculate_acquisition_costs('CPL', 100, show_up_rate=0, leads=100)
+    
+    assert costs['cost_per_meeting_scheduled'] == pytest.approx(100 / 0.6 / 0.35)
+    assert costs['cost_per_meeting_held'] == 0
+    assert costs['cost_per_sale'] == 0
+
+
+# ============= REVERSE ENGINEERING TESTS =============
+
+def test_revenue_target_walks_funnel_back_to_leads():
+    """Revenue gap -> sales -> meetings -> leads through the conversion rates"""
+    metrics = {'monthly_revenue': 100000, 'avg_deal_value': 20000,
+               'close_rate': 0.3, 'meeting_rate': 0.4, 'contact_rate': 0.7}
+    result = ImprovedReverseEngineering.calculate_from_target('revenue', 500000, metrics)
+    changes = result['required_changes']
+    
+    assert changes['additional_sales'] == pytest.approx(20)
+    assert changes['additional_meetings'] == pytest.approx(20 / 0.3)
+    assert changes['additional_leads'] == pytest.approx(20 / 0.3 / 0.4 / 0.7)
@@ -0,0 +1,83 @@
+"""
+Test suite for capacity validator - GTM workload math and status thresholds
+Run with: pytest modules/tests/test_capacity_validator.py -v
+"""
+
+import pytest
+from modules.capacity_validator import validate_capacity
+
+
+# ============= FIXTURES =============
+
+@pytest.fixture
+def sample_channels():
+    """Two live channels and one disabled"""
+    return [
+        {'monthly_leads': 1000, 'contact_rate': 0.65, 'meeting_rate': 0.40, 'cpl': 50},
+        {'monthly_leads': 300, 'contact_rate': 0.55, 'meeting_rate': 0.35, 'cpl': 200, 'enabled': True},
+        {'monthly_leads': 500, 'contact_rate': 0.50, 'meeting_rate': 0.50, 'cpl': 900, 'enabled': False}
+    ]
+
+
+# ============= WORKLOAD TESTS =============
+
+def test_totals_skip_disabled_channels(sample_channels):
+    """Only enabled channels feed the lead/contact/meeting totals"""
+    capacity = validate_capacity(sample_channels, num_setters=4, num_closers=8)
+    
+    assert capacity['total_leads_monthly'] == 1300
+    assert capacity['total_contacts_monthly'] == pytest.approx(1000 * 0.65 + 300 * 0.55)
+    assert capacity['total_meetings_monthly'] == pytest.approx(1000 * 0.65 * 0.40 + 300 * 0.55 * 0.35)
+
+
+def test_setter_hours_follow_cadence(sample_channels):
+    """Daily hours = leads/day/setter × calls per lead × minutes per call"""
+    capacity = validate_capacity(sample_channels, num_setters=4, num_closers=8,
+                                 calls_per_lead=3, avg_call_mins=8)
+    leads_per_day = 1300 / 20 / 4
+    
+    assert capacity['daily_leads_per_setter'] == pytest.approx(leads_per_day)
+    assert capacity['daily_hours_per_setter'] == pytest.approx(leads_per_day * 3 * 8 / 60)
+
+
+def test_overloaded_setters_suggest_fixes(sample_channels):
+    """Setters over 100% are CRITICAL with hire/cut suggestions priced at enabled-channel CPL"""
+    capacity = validate_capacity(sample_channels, num_setters=1, num_closers=8)
+    pct = capacity['setter_capacity_pct']
+    leads_to_cut = 1300 - 1300 / pct * 85
+    
+    assert capacity['setter_status'] == 'CRITICAL'
+    assert capacity['suggestions'][0].startswith('Hire ')
+    assert capacity['suggestions'][1] == f"Reduce marketing by ${leads_to_cut * 125:,.0f} - brings to 85% capacity"
+
+
+@pytest.mark.parametrize('monthly_leads, status', [
+    (255, 'HEALTHY'),   # exactly 85%
+    (300, 'WARNING'),   # exactly 100%
+    (303, 'CRITICAL'),
+])
+def test_setter_status_bands_are_strict(monthly_leads, status):
+    """A band only starts above its threshold"""
+    capacity = validate_capacity([{'monthly_leads': monthly_leads}], num_setters=1, num_closers=8)
+    
+    assert capacity['setter_status'] == status
+
+
+# ============= CACHE TESTS =============
+
+def test_cached_report_isolated_from_callers(sample_channels):
+    """Mutating a returned report doesn't leak into the next identical call"""
+    first = validate_capacity(sample_channels, num_setters=1, num_closers=8)
+    first['suggestions'].clear()
+    first['setter_status'] = 'HEALTHY'
+    
+    second = validate_capacity(sample_channels, num_setters=1, num_closers=8)
+    assert second['setter_status'] == 'CRITICAL'
+    assert len(second['suggestions']) == 3
+
+
+def test_unhashable_channel_values_still_validate(sample_channels):
+    """Channels carrying unhashable extras fall back to direct computation"""
+    channels = [{**ch, 'tags': ['paid']} for ch in sample_channels]
+    
+    assert validate_capacity(channels, 4, 8) == validate_capacity(sample_channels, 4, 8)
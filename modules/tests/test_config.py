@@ -0,0 +1,60 @@
+"""
+Test suite for model config - attainment tiers and OTE health
+Run with: pytest modules/tests/test_config.py -v
+"""
+
+import numpy as np
+import pytest
+from modules import config as config_module
+from modules.config import config
+
+
+# ============= ATTAINMENT TESTS =============
+
+@pytest.mark.parametrize('attainment, multiplier', [
+    (0.0, 0.6), (0.39, 0.6), (0.40, 0.8), (0.70, 1.0), (1.00, 1.2), (1.49, 1.2), (1.50, 1.6),
+    (-0.1, 1.0), (10.0, 1.0)  # outside every tier
+])
+def test_attainment_tiers_are_half_open(attainment, multiplier):
+    """Each tier covers [min, max); attainment outside all tiers gets 1.0"""
+    assert config.get_attainment_multiplier(attainment) == multiplier
+
+
+def test_tier_table_views_match_lookup():
+    """ATTAINMENT_TIERS keeps its tier_N dict shape for existing callers"""
+    tier = config.ATTAINMENT_TIERS['tier_4']
+    
+    assert (tier['min'], tier['max'], tier['name']) == (1.00, 1.50, 'Exceeding')
+    assert config.get_attainment_multiplier(tier['min']) == tier['multiplier']
+    assert config.default_sales_cycle_days == sum(config.SALES_CYCLE_STAGES.values())
+
+
+def test_config_is_immutable():
+    """The shared config singleton can't be modified by callers"""
+    # FrozenInstanceError, or TypeError from frozen+slots on Python 3.11
+    with pytest.raises((AttributeError, TypeError)):
+        config.CARRIER_RATE = 0.5
+    with pytest.raises(TypeError):
+        config.ATTAINMENT_TIERS['tier_1'] = {}
+    assert not hasattr(config, '__dict__')
+
+
+def test_module_constants_back_class_attributes():
+    """Module-level constants and ModelConfig attributes are the same values"""
+    for name in ('CARRIER_RATE', 'DEFERRED_MONTH', 'MIN_LTV_CAC_RATIO', 'STANDARD_PIPELINE_COVERAGE'):
+        assert getattr(config, name) == getattr(config_module, name)
+
+
+def test_ote_health_array_matches_scalar():
+    """Vectorized OTE health agrees with the scalar method, zero OTE included"""
+    base = np.array([40000, 20000, 0, 60000])
+    variable = np.array([60000, 80000, 0, 40000])
+    
+    health = config.get_ote_health_array(base, variable)
+    
+    for i in range(len(base)):
+        expected = config.get_ote_health(float(base[i]), float(variable[i]))
+        assert health['base_pct'][i] == pytest.approx(expected['base_pct'])
+        assert health['variable_pct'][i] == pytest.approx(expected['variable_pct'])
+        assert health['health_score'][i] == expected['health_score']
+        assert bool(health['is_healthy'][i]) == expected['is_healthy']
@@ -0,0 +1,201 @@
+"""
+Test suite for dashboard adapter - session state → cache key and metrics
+Run with: pytest modules/tests/test_dashboard_adapter.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import streamlit as st
+from modules.dashboard_adapter import DashboardAdapter
+from modules.models import CostMethod, Segment
+
+
+# ============= FIXTURES =============
+
+@pytest.fixture
+def session():
+    """Fresh session state with one paid channel"""
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+    st.session_state['gtm_channels'] = [
+        {'id': 'paid', 'name': 'Paid', 'monthly_leads': 1000, 'cpl': 50,
+         'cost_method': 'Cost per Lead', 'segment': 'SMB'}
+    ]
+    DashboardAdapter.clear_cache()
+    yield st.session_state
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+
+# ============= CACHE KEY TESTS =============
+
+def test_cache_key_tracks_channel_and_deal_inputs(session):
+    """Key changes with any relevant input and is stable otherwise"""
+    baseline = DashboardAdapter.get_cache_key()
+    assert DashboardAdapter.get_cache_key() == baseline
+    
+    session['gtm_channels'][0]['cpl'] = 51
+    assert DashboardAdapter.get_cache_key() != baseline
+    session['gtm_channels'][0]['cpl'] = 50
+    assert DashboardAdapter.get_cache_key() == baseline
+    
+    session['avg_deal_value'] = 60000
+    assert DashboardAdapter.get_cache_key() != baseline
+
+
+def test_cache_key_ignores_unread_fields(session):
+    """Channel fields the metrics never read don't invalidate the cache"""
+    baseline = DashboardAdapter.get_cache_key()
+    session['gtm_channels'][0]['avg_deal_value'] = 99999
+    
+    assert DashboardAdapter.get_cache_key() == baseline
+
+
+@pytest.mark.parametrize('field, value, read', [
+    ('working_days', 10, lambda m, _: m.per_person.closer.daily_comm),
+    ('closer_variable', 10000, lambda m, _: m.per_person.closer.ote_attainment),
+    ('setter_variable', 1000, lambda m, _: m.per_person.setter.ote_attainment),
+    ('manager_variable', 1000, lambda m, _: m.per_person.manager.ote_attainment),
+    ('bench_variable', 1000, lambda m, _: m.per_person.bench.ote),
+    ('bench_base', 99000, lambda m, _: m.per_person.bench.monthly_base),
+    ('contract_length_months', 24, lambda _, models: models['deal'].contract_length_months),
+    ('deferred_timing_months', 6, lambda _, models: models['deal'].deferred_timing_months),
+])
+def test_metrics_follow_every_session_input(session, field, value, read):
+    """Every session value the metrics read reaches the cached results"""
+    session['num_benchs_main'] = 1
+    before = read(DashboardAdapter.get_metrics(), DashboardAdapter.get_models())
+    
+    session[field] = value
+    
+    assert read(DashboardAdapter.get_metrics(), DashboardAdapter.get_models()) != before
+
+
+@pytest.mark.parametrize('field, value', [('name', 'New name'), ('segment', 'ENT')])
+def test_metrics_follow_channel_labels(session, field, value):
+    """Channel name/segment edits show up in the breakdown"""
+    before = DashboardAdapter.get_metrics()
+    session['gtm_channels'][0][field] = value
+    
+    assert DashboardAdapter.get_metrics()['channels_breakdown'][field] == (value,)
+    assert before['channels_breakdown'][field] != (value,)
+
+
+def test_cache_key_distinguishes_none_from_values(session):
+    """A missing value and a zero hash differently"""
+    baseline = DashboardAdapter.get_cache_key()
+    session['office_rent'] = 0
+    
+    assert DashboardAdapter.get_cache_key() != baseline
+
+
+# ============= CONVENIENCE FUNCTION TESTS =============
+
+def test_sections_follow_session_changes(session):
+    """Section helpers refresh when the cache key changes"""
+    from modules.dashboard_adapter import get_gtm_metrics, get_pnl
+    
+    assert get_gtm_metrics()['monthly_leads'] == 1000
+    revenue = get_pnl()['gross_revenue']
+    
+    session['gtm_channels'][0]['monthly_leads'] = 2000
+    assert get_gtm_metrics()['monthly_leads'] == 2000
+    assert get_pnl()['gross_revenue'] == pytest.approx(revenue * 2)
+
+
+def test_sections_are_copies(session):
+    """Mutating a returned section doesn't leak into the next call"""
+    from modules.dashboard_adapter import get_unit_economics
+    
+    first = get_unit_economics()
+    first['ltv'] = -1
+    
+    assert get_unit_economics()['ltv'] != -1
+
+
+
+def test_channels_breakdown_is_columnar(session):
+    """Channel breakdown comes back as parallel columns, one entry per channel"""
+    from modules.dashboard_adapter import get_gtm_metrics
+    
+    session['gtm_channels'].append(
+        {'id': 'ent', 'name': 'Outbound', 'cost_method': 'Total Budget',
+         'segment': 'ENT', 'monthly_budget': 5000, 'monthly_leads': 200}
+    )
+    breakdown = get_gtm_metrics()['channels_breakdown']
+    
+    assert breakdown['name'] == ('Paid', 'Outbound')
+    assert breakdown['segment'] == ('SMB', 'ENT')
+    assert isinstance(breakdown['leads'], np.ndarray)
+    assert breakdown['leads'].tolist() == [1000, 200]
+    assert breakdown['revenue'].sum() == pytest.approx(get_gtm_metrics()['monthly_revenue_immediate'])
+    assert pd.DataFrame(dict(breakdown)).shape == (2, 9)
+
+
+
+def test_cached_metrics_are_shared_and_read_only(session):
+    """Repeat calls hit the in-process cache; cached containers can't be mutated"""
+    first = DashboardAdapter.get_metrics()
+    
+    assert DashboardAdapter.get_metrics() is first
+    with pytest.raises(ValueError):
+        first['channels_breakdown']['leads'][0] = 0
+    with pytest.raises(TypeError):
+        first['channels_breakdown']['leads'] = np.zeros(1)
+    
+    models = DashboardAdapter.get_models()
+    with pytest.raises(TypeError):
+        models['deal'] = None
+    with pytest.raises(AttributeError):
+        models['channels'].append(None)
+
+# ============= METRICS BUNDLE TESTS =============
+
+def test_metrics_bundle_supports_key_and_attribute_access(session):
+    """Bundles read the same by attribute and by string key"""
+    metrics = DashboardAdapter.get_metrics()
+    
+    assert metrics['monthly_leads'] == metrics.monthly_leads == 1000
+    assert metrics['unit_economics']['ltv'] == metrics.unit_economics.ltv
+    assert metrics['pnl'].get('ebitda') == metrics.pnl.ebitda
+    assert metrics.get('missing', 0) == 0
+    assert 'commissions' in metrics and 'missing' not in metrics
+    with pytest.raises(KeyError):
+        metrics['missing']
+
+
+def test_metrics_bundle_converts_to_dict(session):
+    """dict() on a bundle gives the old field-name mapping"""
+    commissions = DashboardAdapter.get_metrics().commissions
+    
+    as_dict = dict(commissions)
+    
+    assert list(as_dict) == list(commissions.keys())
+    assert as_dict['total_commission'] == commissions.total_commission
+
+
+def test_models_only_attached_on_request(session):
+    """Plain metrics skip the model instances; get_models() builds them"""
+    assert DashboardAdapter.get_metrics().models is None
+    
+    models = DashboardAdapter.get_models()
+    
+    assert models['gtm_total'].leads == 1000
+    assert [ch.name for ch in models['channels']] == ['Paid']
+
+# ============= MODEL CONVERSION TESTS =============
+
+def test_session_channels_map_enums_with_fallbacks(session):
+    """Known enum values map through; unknown ones fall back to CPL / SMB"""
+    session['gtm_channels'].append(
+        {'id': 'odd', 'cost_method': 'Per Vibe', 'segment': 'Galactic', 'monthly_leads': 10}
+    )
+    session['gtm_channels'].append(
+        {'id': 'ent', 'cost_method': 'Total Budget', 'segment': 'ENT', 'monthly_budget': 5000}
+    )
+    paid, odd, ent = DashboardAdapter.session_to_channels()
+    
+    assert (paid.cost_method, paid.segment) == (CostMethod.CPL, Segment.SMB)
+    assert (odd.cost_method, odd.segment) == (CostMethod.CPL, Segment.SMB)
+    assert (ent.cost_method, ent.segment) == (CostMethod.BUDGET, Segment.ENT)
@@ -0,0 +1,128 @@
+"""
+Test suite for dynamic benchmarks - context multipliers and status bands
+Run with: pytest modules/tests/test_dynamic_benchmarks.py -v
+"""
+
+import numpy as np
+import pytest
+from modules.dynamic_benchmarks import DynamicBenchmarks
+
+
+# ============= BENCHMARK TABLE TESTS =============
+
+def test_funnel_multipliers_compound_and_cap():
+    """Industry × size × maturity scale every level; levels are capped"""
+    benchmarks = DynamicBenchmarks.get_funnel_benchmarks('real_estate', 'startup', 'saturated')
+    contact = benchmarks['contact_rate']
+    mult = 1.2 * 1.1 * 1.1
+    
+    assert contact['min'] == pytest.approx(0.45 * mult)
+    assert contact['good'] == pytest.approx(0.60 * mult)
+    assert contact['excellent'] == 0.99  # 0.75 × 1.452 capped
+    assert benchmarks['show_up_rate']['good'] == pytest.approx(0.75)  # no multipliers
+    assert contact['context'] == "Real_Estate | Startup | Saturated"
+
+
+def test_unknown_context_uses_base_benchmarks():
+    """Unknown context keys fall back to a 1.0 multiplier"""
+    costs = DynamicBenchmarks.get_cost_benchmarks('other', 'other', 'other')
+    financial = DynamicBenchmarks.get_financial_benchmarks('other', 'other')
+    
+    assert costs['cac'] == {'min': 1000, 'good': 3000, 'max': 6000, 'context': 'Other | Other | Other'}
+    assert financial['payback_months']['min'] == 18
+
+
+def test_cost_geography_scales_all_metrics():
+    """Geography multiplier applies to every cost metric"""
+    mexico = DynamicBenchmarks.get_cost_benchmarks('saas', 'referral', 'mexico')
+    usa = DynamicBenchmarks.get_cost_benchmarks('saas', 'referral', 'usa')
+    
+    for metric in ('cpl', 'cpc', 'cpm', 'cac'):
+        assert usa[metric]['good'] == pytest.approx(mexico[metric]['good'] * 3.5)
+
+
+def test_cached_tables_isolated_from_callers():
+    """Mutating a returned table doesn't leak into the next call"""
+    first = DynamicBenchmarks.get_funnel_benchmarks()
+    first['close_rate']['min'] = 0
+    first.pop('contact_rate')
+    
+    second = DynamicBenchmarks.get_funnel_benchmarks()
+    assert second['close_rate']['min'] == pytest.approx(0.15 * 1.2)
+    assert 'contact_rate' in second
+
+
+# ============= STATUS TESTS =============
+
+@pytest.mark.parametrize('value, status', [(0.40, 'Excellent'), (0.25, 'Good'),
+                                           (0.15, 'Acceptable'), (0.10, 'Below Standard')])
+def test_ratio_status_bands(value, status):
+    """Higher-is-better bands are inclusive at each threshold"""
+    benchmark = {'min': 0.15, 'good': 0.25, 'excellent': 0.40}
+    
+    assert DynamicBenchmarks.get_performance_status(value, benchmark)[0] == status
+
+
+def test_cost_status_defaults_max_to_twice_good():
+    """Cost benchmarks without 'max' treat 2 × good as the acceptable ceiling"""
+    benchmark = {'min': 50, 'good': 150}
+    
+    assert DynamicBenchmarks.get_performance_status(300, benchmark)[0] == 'Acceptable'
+    assert DynamicBenchmarks.get_performance_status(301, benchmark)[0] == 'Below Standard'
+
+
+
+def test_classify_many_matches_scalar_status():
+    """Vectorized classification agrees with the scalar ladder, per-row levels too"""
+    ratio = {'min': 0.15, 'good': 0.25, 'excellent': 0.40}
+    values = np.array([0.40, 0.30, 0.15, 0.10, np.nan])
+    
+    idx = DynamicBenchmarks.classify_many(values, np.array([0.15, 0.25, 0.40]))
+    
+    assert DynamicBenchmarks.STATUSES[idx].tolist() == [
+        DynamicBenchmarks.get_performance_status(v, ratio)[0] for v in values
+    ]
+    
+    costs = np.array([40.0, 400.0])
+    levels = np.array([[50, 150, 300], [100, 200, 500]])
+    idx = DynamicBenchmarks.classify_many(costs, levels, higher_is_better=False)
+    assert DynamicBenchmarks.STATUSES[idx].tolist() == ['Excellent', 'Acceptable']
+
+# ============= GAP TESTS =============
+
+def test_gaps_pick_next_target_per_metric():
+    """Next target is the first level still above the current value"""
+    benchmarks = {'close_rate': {'min': 0.15, 'good': 0.25, 'excellent': 0.35},
+                  'contact_rate': {'min': 0.45, 'good': 0.60, 'excellent': 0.75}}
+    gaps = DynamicBenchmarks.calculate_benchmark_gaps(
+        {'close_rate': 0.20, 'contact_rate': 0.80, 'unknown': 1.0}, benchmarks
+    )
+    
+    assert set(gaps) == {'close_rate', 'contact_rate'}
+    assert gaps['close_rate']['next_target'] == 'good'
+    assert gaps['close_rate']['gap_to_next'] == pytest.approx(0.05)
+    assert gaps['contact_rate']['next_target'] == 'excellent'
+    assert gaps['contact_rate']['gap_to_min'] == pytest.approx(-0.35)
+
+
+def test_gaps_keep_ladder_on_reversed_scales():
+    """Payback (lower is better) uses the same min → good → excellent ladder"""
+    payback = {'payback_months': {'min': 18, 'good': 12, 'excellent': 6}}
+    gaps = DynamicBenchmarks.calculate_benchmark_gaps({'payback_months': 15}, payback)
+    
+    assert gaps['payback_months']['next_target'] == 'min'
+    assert gaps['payback_months']['gap_to_next'] == 3
+
+
+def test_funnel_kernel_matches_numpy_path():
+    """The JIT kernel (run as plain Python here) matches the NumPy path"""
+    from modules.dynamic_benchmarks import (
+        _funnel_mults_core, _FUNNEL_BASE, _FUNNEL_CAPS,
+        _FUNNEL_INDUSTRY_MULT, _FUNNEL_SIZE_MULT, _FUNNEL_MATURITY_MULT
+    )
+    kernel = getattr(_funnel_mults_core, 'py_func', _funnel_mults_core)
+    ind, size, mat = (_FUNNEL_INDUSTRY_MULT['saas'], _FUNNEL_SIZE_MULT['startup'],
+                      _FUNNEL_MATURITY_MULT['saturated'])
+    
+    expected = np.minimum(_FUNNEL_BASE * (ind * size * mat)[:, None], _FUNNEL_CAPS)
+    assert kernel(_FUNNEL_BASE, ind, size, mat, _FUNNEL_CAPS) == pytest.approx(expected)
@@ -6,14 +6,16 @@ Run with: pytest modules/tests/test_engine.py -v
 import pytest
 from modules.models import Channel, DealEconomics, CostMethod, Segment, CommissionPolicy, RoleCompensation
 from modules.engine import (
-    compute_channel_metrics, compute_gtm_aggregate,
-    calculate_channel_spend, reverse_engineer_leads
+    compute_channel_metrics, compute_gtm_aggregate, compute_gtm_aggregate_fast,
+    compute_gtm_aggregate_batch, calculate_channel_spend, reverse_engineer_leads,
+    reverse_engineer_channel_leads, calculate_effective_cpl, calculate_channel_effective_cpl
 )
 from modules.engine_pnl import (
     calculate_unit_economics, calculate_commission_pools,
-    calculate_pnl, calculate_ote_requirements
+    calculate_pnl, calculate_ote_requirements, project_financials,
+    project_financials_batch, make_pnl_kernel, calculate_pnl_batch
 )
-from modules.models import TeamStructure, OperatingCosts
+from modules.models import TeamStructure, OperatingCosts, BusinessSnapshot, Scenario
 
 
 # ============= FIXTURES =============
@@ -177,6 +179,96 @@ def test_disabled_channel_returns_zeros(sample_channel, sample_deal):
     assert metrics.revenue_upfront == 0
 
 
+
+def test_vectorized_aggregate_matches_per_channel_math(sample_deal):
+    """Array funnel agrees with compute_channel_metrics for every cost method"""
+    costs = {
+        CostMethod.CPL: {'cpl': 50.0},
+        CostMethod.CPC: {'cost_per_contact': 80.0},
+        CostMethod.CPM: {'cost_per_meeting': 200.0},
+        CostMethod.CPA: {'cost_per_sale': 900.0},
+        CostMethod.BUDGET: {'monthly_budget': 5000.0},
+    }
+    channels = [
+        Channel(id=f"ch_{i}", name=method.value, monthly_leads=400 + 100 * i,
+                contact_rate=0.6, meeting_rate=0.3, show_up_rate=0.7, close_rate=0.25,
+                cost_method=method, enabled=(method != CostMethod.CPC), **cost)
+        for i, (method, cost) in enumerate(costs.items())
+    ]
+    
+    per_channel, aggregate = compute_gtm_aggregate(channels, sample_deal)
+    
+    for channel, metrics in zip(channels, per_channel):
+        expected = compute_channel_metrics(channel, sample_deal)
+        assert metrics.spend == pytest.approx(expected.spend)
+        assert metrics.sales == pytest.approx(expected.sales)
+        assert metrics.cost_per_sale == pytest.approx(expected.cost_per_sale)
+    assert per_channel[1].leads == 0  # disabled
+    
+    fast = compute_gtm_aggregate_fast(channels, sample_deal)
+    assert fast.spend == pytest.approx(aggregate.spend)
+    assert fast.blended_close_rate == pytest.approx(aggregate.blended_close_rate)
+
+
+def test_funnel_kernel_matches_numpy_path(sample_deal):
+    """The JIT kernel (run as plain Python here) matches the NumPy path"""
+    from modules.engine import _funnel_core, _funnel_numpy, _channels_to_arrays, _GTM_FIELDS
+    kernel = getattr(_funnel_core, 'py_func', _funnel_core)
+    channels = [
+        Channel(id=f"ch_{i}", name=f"Channel {i}", monthly_leads=300 * (i + 1),
+                contact_rate=0.6, meeting_rate=0.3, show_up_rate=0.7, close_rate=0.25 * (i % 2),
+                cost_method=method, enabled=(i != 3), cpl=50.0, cost_per_contact=80.0,
+                cost_per_meeting=200.0, cost_per_sale=900.0, monthly_budget=5000.0)
+        for i, method in enumerate(CostMethod)
+    ]
+    arrays = _channels_to_arrays(channels)
+    
+    rows = kernel(arrays['leads'], arrays['contact_rate'], arrays['meeting_rate'],
+                  arrays['show_up_rate'], arrays['close_rate'], arrays['enabled'],
+                  arrays['method_code'], arrays['cpl'], arrays['cpc'], arrays['cpm'],
+                  arrays['cpa'], arrays['budget'], sample_deal.upfront_cash)
+    expected = _funnel_numpy(arrays, sample_deal.upfront_cash)
+    
+    for field, row in zip(_GTM_FIELDS, rows):
+        assert row == pytest.approx(expected[field]), field
+
+
+def test_deal_cash_split_tracks_edits(sample_deal):
+    """Cached upfront/deferred cash refresh when the deal inputs change"""
+    assert sample_deal.upfront_cash == 35000
+    
+    sample_deal.upfront_pct = 50.0
+    assert sample_deal.upfront_cash == sample_deal.deferred_cash == 25000
+    
+    smaller = sample_deal.model_copy(update={'avg_deal_value': 10000})
+    assert smaller.upfront_cash == 5000
+
+
+def test_commission_base_follows_policy(sample_deal):
+    """Cached commission base switches with the policy and the cash split"""
+    assert sample_deal.commission_base == sample_deal.upfront_cash
+    
+    sample_deal.commission_policy = CommissionPolicy.FULL
+    assert sample_deal.commission_base == sample_deal.avg_deal_value
+    
+    upfront = sample_deal.model_copy(update={'commission_policy': CommissionPolicy.UPFRONT, 'upfront_pct': 40.0})
+    assert upfront.commission_base == 20000
+
+
+def test_team_and_opex_totals_are_cached_on_frozen_models(sample_roles):
+    """Totals are cached; edits go through model_copy and recompute"""
+    from pydantic import ValidationError
+    team = TeamStructure(num_bench=0, bench=sample_roles['setter'], **sample_roles)
+    opex = OperatingCosts()
+    
+    assert team.total_base == 8 * 32000 + 4 * 16000 + 2 * 72000
+    assert opex.total == 35000
+    with pytest.raises(ValidationError):
+        opex.office_rent = 0
+    
+    assert team.model_copy(update={'num_closers': 0}).total_base == 4 * 16000 + 2 * 72000
+    assert opex.model_copy(update={'office_rent': 0}).total == 15000
+
 # ============= UNIT ECONOMICS TESTS =============
 
 def test_unit_econ_ltv_calculation(sample_deal):
@@ -281,6 +373,23 @@ def test_ote_requirements_calculation():
     assert abs(req['monthly_deals_needed'] - expected_annual/12) < 0.01
 
 
+def test_per_person_earnings_records(sample_deal, sample_roles):
+    """Per-person earnings come back as attribute records with a dict bridge"""
+    from modules.engine_pnl import calculate_per_person_earnings
+    team = TeamStructure(num_closers=4, num_setters=0, num_bench=0, bench=sample_roles['setter'], **sample_roles)
+    comm = calculate_commission_pools(5.0, sample_roles['closer'], sample_roles['setter'],
+                                      sample_roles['manager'], sample_deal)
+    
+    earnings = calculate_per_person_earnings(comm, team, working_days=20)
+    
+    assert earnings.closer.monthly_comm == comm.closer_pool / 4
+    assert earnings.closer.daily_comm == earnings.closer.monthly_comm / 20
+    assert earnings.setter.monthly_comm == 0
+    assert earnings.setter.monthly_total == sample_roles['setter'].base / 12
+    assert earnings.to_dict()['closer']['annual_comm'] == earnings.closer.annual_comm
+    assert set(earnings.to_dict()) == {'closer', 'setter', 'manager', 'bench'}
+
+
 # ============= P&L TESTS =============
 
 def test_pnl_gross_margin_calculation():
@@ -330,6 +439,72 @@ def test_pnl_ebitda_calculation():
     assert abs(pnl.ebitda - expected_ebitda) < 1
 
 
+
+def test_pnl_kernel_is_shared_per_fixed_inputs():
+    """Kernels are cached per (gov %, opex, team base) and match calculate_pnl"""
+    kernel = make_pnl_kernel(10.0, 35000, 480000)
+    
+    assert make_pnl_kernel(10.0, 35000, 480000) is kernel
+    assert kernel(100000, 10000, 20000) == calculate_pnl(
+        gross_revenue=100000, team_base_annual=480000, commissions=10000,
+        marketing_spend=20000, operating_costs=OperatingCosts(), gov_cost_pct=10.0
+    )
+
+
+def test_batch_projection_matches_scalar():
+    """Batched annual projections equal project_financials per statement"""
+    pnls = [
+        calculate_pnl(gross_revenue=revenue, team_base_annual=500000, commissions=10000,
+                      marketing_spend=20000, operating_costs=OperatingCosts(), gov_cost_pct=10)
+        for revenue in (100000, 250000, 0)
+    ]
+    
+    batch = project_financials_batch(pnls, months=6)
+    
+    assert batch.shape == (3,)
+    for record, pnl in zip(batch, pnls):
+        for name, value in project_financials(pnl, months=6).items():
+            assert record[name] == pytest.approx(value)
+
+
+
+def test_scenario_sweep_matches_per_scenario_runs(sample_deal):
+    """Batched GTM + P&L sweep equals running each scenario on its own"""
+    import numpy as np
+    
+    channels = [
+        Channel(id="a", name="A", monthly_leads=1000, contact_rate=0.6, meeting_rate=0.3,
+                show_up_rate=0.7, close_rate=0.3, cost_method=CostMethod.CPL, cpl=50),
+        Channel(id="b", name="B", monthly_leads=400, contact_rate=0.5, meeting_rate=0.4,
+                show_up_rate=0.8, close_rate=0.2, cost_method=CostMethod.CPA, cost_per_sale=900),
+        Channel(id="c", name="C", monthly_leads=0, contact_rate=0.5, meeting_rate=0.4,
+                show_up_rate=0.8, close_rate=0.2, cost_method=CostMethod.BUDGET, monthly_budget=5000),
+    ]
+    leads_delta = np.array([[0, 0, 0], [200, -100, 0], [-1000, 0, 50]], dtype=float)
+    close_delta = np.array([[0, 0, 0], [0.05, 0, 0], [0, -0.2, 0.1]])
+    
+    batch = compute_gtm_aggregate_batch(
+        channels, sample_deal, {'leads': leads_delta, 'close_rate': close_delta}
+    )
+    pnl_batch = calculate_pnl_batch(
+        batch['revenue_upfront'], 480000, batch['sales'] * 500, batch['spend'], OperatingCosts(), 10.0
+    )
+    
+    for s in range(3):
+        scenario = [
+            ch.model_copy(update={'monthly_leads': ch.monthly_leads + leads_delta[s, i],
+                                  'close_rate': ch.close_rate + close_delta[s, i]})
+            for i, ch in enumerate(channels)
+        ]
+        _, expected = compute_gtm_aggregate(scenario, sample_deal)
+        for field in ('leads', 'sales', 'revenue_upfront', 'spend', 'cost_per_sale', 'blended_close_rate'):
+            assert batch[field][s] == pytest.approx(getattr(expected, field))
+        
+        pnl = calculate_pnl(expected.revenue_upfront, 480000, expected.sales * 500, expected.spend,
+                            OperatingCosts(), 10.0)
+        for field, values in pnl_batch.items():
+            assert values[s] == pytest.approx(getattr(pnl, field))
+
 # ============= REVERSE ENGINEERING TESTS =============
 
 def test_reverse_engineer_leads_for_sales():
@@ -369,6 +544,31 @@ def test_reverse_engineer_leads_for_meetings():
     assert abs(leads_needed - 183.15) < 0.1
 
 
+def test_channel_partials_match_rate_based_helpers(sample_channel):
+    """Cached cascade partials give the same answers as the rate-based helpers"""
+    rates = dict(contact_rate=sample_channel.contact_rate, meeting_rate=sample_channel.meeting_rate,
+                 show_up_rate=sample_channel.show_up_rate, close_rate=sample_channel.close_rate)
+    
+    for stage in ("leads", "contacts", "meetings", "sales"):
+        assert reverse_engineer_channel_leads(sample_channel, 10.0, stage) == \
+            reverse_engineer_leads(target_value=10.0, target_stage=stage, **rates)
+    for method in CostMethod:
+        assert calculate_channel_effective_cpl(sample_channel, method, 500) == \
+            calculate_effective_cpl(method, 500, **rates)
+
+
+def test_channel_partials_refresh_on_rate_change(sample_channel):
+    """Changing a rate (in place or via model_copy) drops the cached partials"""
+    before = sample_channel.cascade_partials
+    copied = sample_channel.model_copy(update={'close_rate': 0.5})
+    sample_channel.meeting_rate = 0.5
+    
+    assert copied.cascade_partials[2] == pytest.approx(before[1] * 0.5)
+    assert sample_channel.cascade_partials[1] == pytest.approx(
+        sample_channel.contact_rate * 0.5 * sample_channel.show_up_rate
+    )
+
+
 # ============= EDGE CASES =============
 
 def test_zero_sales_no_divide_by_zero(sample_channel, sample_deal):
@@ -396,5 +596,120 @@ def test_zero_cac_ltv_ratio_safe():
     assert unit_econ.ltv_cac_ratio >= 0  # No crash
 
 
+
+def test_engine_outputs_are_plain_frozen_records(sample_channel, sample_deal):
+    """Output models are frozen dataclasses: asdict works, assignment doesn't"""
+    from dataclasses import asdict, FrozenInstanceError
+    metrics = compute_channel_metrics(sample_channel, sample_deal)
+    
+    assert asdict(metrics)['spend'] == metrics.spend
+    assert metrics.roas == metrics.revenue_upfront / metrics.spend
+    with pytest.raises((FrozenInstanceError, TypeError)):
+        metrics.spend = 0
+
+
+def test_bulk_validation_matches_per_channel(sample_channel):
+    """validate_channels_bulk emits the same issues as validate_channel"""
+    from modules.engine import validate_channel, validate_channels_bulk
+    broken = sample_channel.model_copy(update={'cost_method': CostMethod.CPM, 'monthly_leads': 0})
+    broken.contact_rate = 1.5
+    broken.close_rate = -0.1
+    budget = sample_channel.model_copy(update={'cost_method': CostMethod.BUDGET, 'monthly_budget': 2500})
+    channels = [sample_channel, broken, budget]
+    
+    assert validate_channels_bulk(channels) == [validate_channel(ch) for ch in channels]
+    assert validate_channels_bulk(channels)[0] == []
+    assert len(validate_channels_bulk(channels)[1]) == 4
+    assert validate_channels_bulk([]) == []
+
+
+# ============= SCENARIO TESTS =============
+
+def test_scenario_apply_shares_untouched_models(sample_deal, sample_channel, sample_roles):
+    """Only models on a delta path are copied; the baseline is untouched"""
+    other = sample_channel.model_copy(update={'id': 'test_2'})
+    team = TeamStructure(bench=sample_roles['setter'], **sample_roles)
+    snapshot = BusinessSnapshot(deal_economics=sample_deal, channels=[sample_channel, other],
+                                team=team, operating_costs=OperatingCosts())
+    scenario = Scenario(name="Better closing", description="",
+                        deltas={'channels[1].close_rate': 0.05, 'team.closer.base': 1000,
+                                'deal_economics.upfront_pct': -20})
+    
+    result = scenario.apply_to(snapshot)
+    
+    assert result.channels[1].close_rate == pytest.approx(0.35)
+    assert result.team.closer.base == 33000
+    assert result.deal_economics.upfront_cash == 25000
+    assert snapshot.channels[1].close_rate == 0.30
+    assert snapshot.deal_economics.upfront_cash == 35000
+    assert result.channels[0] is snapshot.channels[0]
+    assert result.team.setter is snapshot.team.setter
+    assert result.operating_costs is snapshot.operating_costs
+
+
+def test_scenario_bare_channel_field_applies_to_all_channels(sample_deal, sample_channel, sample_roles):
+    """A bare channel field name shifts that field on every channel"""
+    team = TeamStructure(bench=sample_roles['setter'], **sample_roles)
+    snapshot = BusinessSnapshot(deal_economics=sample_deal, channels=[sample_channel] * 2,
+                                team=team, operating_costs=OperatingCosts())
+    
+    result = Scenario(name="s", description="", deltas={'close_rate': 0.03}).apply_to(snapshot)
+    
+    assert [ch.close_rate for ch in result.channels] == pytest.approx([0.33, 0.33])
+
+
+def test_scenario_delta_on_unset_cost_field(sample_deal, sample_channel, sample_roles):
+    """An unset Optional cost field counts as 0 before the delta is added"""
+    team = TeamStructure(bench=sample_roles['setter'], **sample_roles)
+    snapshot = BusinessSnapshot(deal_economics=sample_deal, channels=[sample_channel],
+                                team=team, operating_costs=OperatingCosts())
+    assert sample_channel.cost_per_meeting is None
+    
+    result = Scenario(name="s", description="",
+                      deltas={'channels[0].cost_per_meeting': 50}).apply_to(snapshot)
+    
+    assert result.channels[0].cost_per_meeting == 50
+    with pytest.raises(ValueError, match="cost_per_meeting"):
+        Scenario(name="s", description="",
+                 deltas={'channels[0].cost_per_meeting': -50}).apply_to(snapshot)
+
+
+@pytest.mark.parametrize("deltas, field", [
+    ({'close_rate': 0.9}, 'close_rate'),
+    ({'team.num_closers': 0.5}, 'num_closers'),
+    ({'deal_economics.upfront_pct': -200}, 'upfront_pct'),
+    ({'channels[0].no_such_rate': 0.1}, 'no_such_rate'),
+])
+def test_scenario_rejects_invalid_deltas(sample_deal, sample_channel, sample_roles, deltas, field):
+    """Deltas that break a field constraint raise instead of producing bad inputs"""
+    team = TeamStructure(bench=sample_roles['setter'], **sample_roles)
+    snapshot = BusinessSnapshot(deal_economics=sample_deal, channels=[sample_channel],
+                                team=team, operating_costs=OperatingCosts())
+    
+    with pytest.raises(ValueError, match=field):
+        Scenario(name="s", description="", deltas=deltas).apply_to(snapshot)
+
+
+def test_recompute_fills_every_result(sample_deal, sample_channel, sample_roles):
+    """recompute() matches the individual engine calls, and a scenario clears it"""
+    from modules.engine_snapshot import recompute
+    team = TeamStructure(bench=sample_roles['setter'], **sample_roles)
+    snapshot = BusinessSnapshot(deal_economics=sample_deal, channels=[sample_channel],
+                                team=team, operating_costs=OperatingCosts())
+    
+    result = recompute(snapshot)
+    
+    _, gtm_total = compute_gtm_aggregate([sample_channel], sample_deal)
+    assert result.gtm_total == gtm_total
+    assert result.unit_economics == calculate_unit_economics(sample_deal, gtm_total.cost_per_sale)
+    assert result.commissions.total_commission == pytest.approx(
+        gtm_total.sales * sample_deal.upfront_cash * 0.28
+    )
+    assert result.pnl.gross_revenue == gtm_total.revenue_upfront
+    assert snapshot.pnl is None
+    
+    changed = Scenario(name="s", description="", deltas={'close_rate': 0.05}).apply_to(result)
+    assert changed.pnl is None
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
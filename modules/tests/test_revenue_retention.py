@@ -0,0 +1,119 @@
+"""
+Test suite for revenue retention - GRR/NRR projections
+Run with: pytest modules/tests/test_revenue_retention.py -v
+"""
+
+import numpy as np
+import pytest
+from modules.revenue_retention import (
+    RevenueRetentionCalculator, MultiChannelGTM, _project_kernel, _project_numpy
+)
+
+
+# ============= PROJECTION TESTS =============
+
+def test_projection_compounds_monthly():
+    """GRR/NRR MRR compound the monthly factors; churn/expansion accrue on NRR MRR"""
+    proj = RevenueRetentionCalculator.project_retention_impact(100000, 0.02, 0.03, months_forward=3)
+    
+    assert proj['month'] == [0, 1, 2, 3]
+    assert proj['grr_mrr'][0] == proj['nrr_mrr'][0] == 100000
+    assert proj['grr_mrr'][3] == pytest.approx(100000 * 0.98 ** 3)
+    assert proj['nrr_mrr'][3] == pytest.approx(100000 * 1.01 ** 3)
+    
+    expected_churn = sum(proj['nrr_mrr'][m] * 0.02 for m in range(3))
+    assert proj['churned_cumulative'] == pytest.approx([0, 2000, 2000 + 2020, expected_churn])
+    assert proj['expanded_cumulative'][1] == pytest.approx(3000)
+
+
+def test_projection_with_no_months():
+    """Zero months forward returns just the starting point"""
+    proj = RevenueRetentionCalculator.project_retention_impact(5000, 0.05, 0.0, months_forward=0)
+    
+    assert proj['grr_mrr'] == proj['nrr_mrr'] == [5000]
+    assert proj['churned_cumulative'] == proj['expanded_cumulative'] == [0]
+
+
+def test_batch_projection_matches_single_runs():
+    """Each batch row equals project_retention_impact for that scenario"""
+    mrr = np.array([100000.0, 250000.0, 0.0])
+    churn = np.array([0.02, 0.05, 0.01])
+    
+    batch = RevenueRetentionCalculator.project_retention_batch(mrr, churn, 0.03, months_forward=24)
+    
+    assert batch['nrr_mrr'].shape == (3, 25)
+    for s in range(3):
+        single = RevenueRetentionCalculator.project_retention_impact(mrr[s], churn[s], 0.03, 24)
+        for field in ('grr_mrr', 'nrr_mrr', 'churned_cumulative', 'expanded_cumulative'):
+            assert batch[field][s].tolist() == single[field]
+
+
+def test_projection_kernel_matches_numpy_path():
+    """The Numba month loop and the cumprod fallback agree exactly"""
+    mrr, churn, expansion = np.array([1e5, 3e4]), np.array([0.02, 0.1]), np.array([0.03, 0.0])
+    out = [np.empty((2, 13)) for _ in range(4)]
+    
+    getattr(_project_kernel, 'py_func', _project_kernel)(mrr, churn, expansion, *out)
+    
+    for got, expected in zip(out, _project_numpy(mrr, churn, expansion, 12)):
+        np.testing.assert_array_equal(got, expected)
+
+
+# ============= COHORT TESTS =============
+
+def test_cohort_retention_columns():
+    """Cohort grid has one row per (cohort, month); missing months carry the initial values"""
+    cohorts = {
+        '2024-01': {'initial_customers': 10, 'initial_mrr': 5000,
+                    'month_1_customers': 8, 'month_1_mrr': 4500},
+        '2024-02': {'initial_customers': 0, 'initial_mrr': 0},
+    }
+    
+    df = RevenueRetentionCalculator.calculate_cohort_retention(cohorts, current_month=2)
+    
+    assert len(df) == 6
+    assert list(df['Cohort']) == ['2024-01'] * 3 + ['2024-02'] * 3
+    assert list(df['Month']) == [0, 1, 2] * 2
+    assert list(df['Customer_Retention']) == [100, 80, 100, 0, 0, 0]
+    assert df['Revenue_Retention'][1] == pytest.approx(90)
+    assert df['Retained_MRR'][2] == 5000
+
+
+# ============= MULTI-CHANNEL TESTS =============
+
+def test_aggregate_channels_totals_and_blends():
+    """Column sums match per-field sums; blended rates come from the totals"""
+    channels = MultiChannelGTM.get_default_channels()
+    
+    agg = MultiChannelGTM.aggregate_channels(channels)
+    
+    assert agg['total_leads'] == 1350
+    assert agg['total_cost'] == sum(ch['monthly_leads'] * ch['cpl'] for ch in channels)
+    assert agg['total_sales'] == pytest.approx(sum(ch['sales'] for ch in channels))
+    assert agg['blended_close_rate'] == pytest.approx(agg['total_sales'] / agg['total_meetings_held'])
+    assert agg['roas'] == pytest.approx(agg['total_revenue'] / agg['total_cost'])
+    assert MultiChannelGTM.aggregate_channels([]) == {}
+
+
+def test_default_channels_are_fresh_copies():
+    """Defaults are built once, but each call hands out editable copies"""
+    first = MultiChannelGTM.get_default_channels()
+    first[0]['monthly_leads'] = 0
+    
+    second = MultiChannelGTM.get_default_channels()
+    
+    assert second[0]['monthly_leads'] == 1000
+    assert second[0] is not first[0]
+    assert [ch['segment'] for ch in second] == ['SMB', 'MID', 'ENT']
+
+
+def test_channel_efficiency_record():
+    """Efficiency metrics come back as a frozen record with a dict bridge"""
+    channel = MultiChannelGTM.get_default_channels()[0]
+    
+    eff = MultiChannelGTM.calculate_channel_efficiency(channel)
+    
+    assert eff.cost_per_meeting == pytest.approx(50 / (0.65 * 0.40 * 0.70))
+    assert eff.lead_to_sale == pytest.approx(channel['sales'] / 1000)
+    assert eff.to_dict()['payback_months'] == eff.payback_months
+    assert len(eff.to_dict()) == 6
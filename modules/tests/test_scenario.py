@@ -0,0 +1,134 @@
+"""
+Test suite for scenario engine - sensitivity and saved scenarios
+Run with: pytest modules/tests/test_scenario.py -v
+"""
+
+import pytest
+from modules.scenario import (
+    ScenarioManager, calculate_sensitivity, multi_metric_sensitivity, compare_scenarios,
+    get_top_drivers
+)
+
+
+# ============= SENSITIVITY TESTS =============
+
+def test_batch_sensitivity_matches_scalar_path():
+    """One vectorized call gives the same sensitivities and ranks as the loop"""
+    inputs = {'leads': 1000.0, 'close_rate': 0.3, 'discount': 0.0, 'deal_value': 50000.0, 'cpl': 50.0}
+    
+    def revenue(x):
+        return x['leads'] * x['close_rate'] * x['deal_value'] * (1 - x['discount']) - x['leads'] * x['cpl']
+    
+    def revenue_batch(rows, keys):
+        cols = dict(zip(keys, rows.T))
+        return revenue(cols)
+    
+    scalar = calculate_sensitivity(revenue, inputs)
+    batch = calculate_sensitivity(revenue, inputs, batch_fn=revenue_batch)
+    
+    assert batch.keys() == scalar.keys()
+    for key in inputs:
+        assert batch[key].keys() == scalar[key].keys()
+        assert batch[key]['rank'] == scalar[key]['rank']
+        assert batch[key]['sensitivity'] == pytest.approx(scalar[key]['sensitivity'])
+        assert batch[key]['output_bumped'] == pytest.approx(scalar[key]['output_bumped'])
+    assert batch['discount']['sensitivity'] == 0
+
+
+def test_parallel_multi_metric_matches_sequential():
+    """Thread-pooled bumps give the same per-metric results, in input order"""
+    inputs = {'leads': 1000.0, 'zero': 0.0, 'close_rate': 0.3, 'cpl': 50.0}
+    
+    def metrics(x):
+        return {'sales': x['leads'] * x['close_rate'], 'spend': x['leads'] * x['cpl'] + x['zero']}
+    
+    sequential = multi_metric_sensitivity(metrics, inputs)
+    parallel = multi_metric_sensitivity(metrics, inputs, parallel=True)
+    
+    assert parallel == sequential
+    assert list(parallel['sales']) == list(inputs)
+    assert parallel['sales']['cpl']['sensitivity'] == 0
+    assert parallel['spend']['cpl']['sensitivity'] == pytest.approx(1.0)
+
+
+def test_top_drivers_by_absolute_sensitivity():
+    """Largest |sensitivity| first; ties keep input order; unknown metric is empty"""
+    sensitivities = {'revenue': {
+        'leads': {'sensitivity': 1.0}, 'cpl': {'sensitivity': -2.0},
+        'close_rate': {'sensitivity': 1.0}, 'discount': {'sensitivity': 0.1},
+    }}
+    
+    assert get_top_drivers(sensitivities, 'revenue', top_n=3) == [
+        ('cpl', -2.0), ('leads', 1.0), ('close_rate', 1.0)
+    ]
+    assert len(get_top_drivers(sensitivities, 'revenue', top_n=10)) == 4
+    assert get_top_drivers(sensitivities, 'spend') == []
+
+def test_compare_scenarios_deltas():
+    """Deltas and % changes per metric, with the zero-baseline cases"""
+    def calc(x):
+        return {'revenue': x['revenue'], 'churn': x['churn'], 'refunds': x['refunds']}
+    
+    result = compare_scenarios(
+        {'revenue': 100.0, 'churn': 0.0, 'refunds': 0.0},
+        {'revenue': 80.0, 'churn': 0.0, 'refunds': -5.0},
+        calc
+    )
+    
+    assert result['delta'] == {'revenue': -20.0, 'churn': 0.0, 'refunds': -5.0}
+    assert result['delta_pct']['revenue'] == pytest.approx(-20.0)
+    assert result['delta_pct']['churn'] == 0
+    assert result['delta_pct']['refunds'] == float('inf')
+
+# ============= SCENARIO MANAGER TESTS =============
+
+def test_saved_scenarios_are_isolated_copies():
+    """Saving, reading and importing never alias the caller's dicts"""
+    inputs = {'close_rate': 0.3, 'cpl': 50.0}
+    manager = ScenarioManager()
+    manager.add_scenario('base', inputs, "Baseline")
+    
+    inputs['cpl'] = 999.0
+    fetched = manager.get_scenario('base')
+    fetched['close_rate'] = 0.0
+    
+    assert manager.get_scenario('base') == {'close_rate': 0.3, 'cpl': 50.0}
+    assert manager.get_scenario('missing') == {}
+    
+    exported = manager.export_to_dict()
+    restored = ScenarioManager()
+    restored.import_from_dict(exported)
+    exported['scenarios']['base']['cpl'] = 1.0
+    
+    assert restored.get_scenario('base')['cpl'] == 50.0
+    assert restored.descriptions == {'base': "Baseline"}
+
+
+def test_compare_many_matches_pairwise_compare():
+    """One batched call gives the same deltas as comparing each pair"""
+    manager = ScenarioManager()
+    manager.add_scenario('base', {'leads': 1000.0, 'close_rate': 0.3, 'cpl': 50.0})
+    manager.add_scenario('more_leads', {'leads': 1500.0, 'close_rate': 0.3, 'cpl': 50.0})
+    manager.add_scenario('free_leads', {'leads': 1000.0, 'close_rate': 0.25, 'cpl': 0.0})
+    
+    def calc(x):
+        return {'sales': x['leads'] * x['close_rate'], 'spend': x['leads'] * x['cpl']}
+    
+    def calc_batch(rows, keys):
+        return calc(dict(zip(keys, rows.T)))
+    
+    bulk = manager.compare_many(['base', 'more_leads', 'free_leads'], calc_batch)
+    
+    assert list(bulk['results'].index) == ['base', 'more_leads', 'free_leads']
+    for name in ('more_leads', 'free_leads'):
+        pair = manager.compare('base', name, calc)
+        for metric in ('sales', 'spend'):
+            assert bulk['delta'].loc[name, metric] == pytest.approx(pair['delta'][metric])
+            assert bulk['delta_pct'].loc[name, metric] == pytest.approx(pair['delta_pct'][metric])
+    assert (bulk['delta'].loc['base'] == 0).all()
+    
+    manager.add_scenario('partial', {'leads': 10.0})
+    with pytest.raises(ValueError):
+        manager.compare_many(['base', 'partial'], calc_batch)
+    with pytest.raises(ValueError):
+        manager.compare_many(['base', 'missing'], calc_batch)
@@ -0,0 +1,93 @@
+"""
+Test suite for state helpers - cache key hashing
+Run with: pytest modules/tests/test_state.py -v
+"""
+
+import numpy as np
+import pytest
+from modules.state import hash_key, version_token
+
+
+# ============= HASH KEY TESTS =============
+
+def test_hash_key_ignores_dict_order():
+    """Keys are sorted before hashing, so insertion order doesn't matter"""
+    assert hash_key({'b': 1, 'a': [1, 2]}) == hash_key({'a': [1, 2], 'b': 1})
+    assert hash_key({'a': 1}) != hash_key({'a': 2})
+    assert len(hash_key({'a': 1})) == 32
+
+
+def test_hash_key_handles_awkward_inputs():
+    """Non-string keys and non-JSON values still hash deterministically"""
+    assert hash_key({1: 'x'}) == hash_key({1: 'x'})
+    assert hash_key({(1, 2): 3}) != hash_key({(1, 3): 3})
+    assert hash_key(np.float64(1.5)) == hash_key(np.float64(1.5))
+
+
+def test_hash_key_sees_whole_numpy_arrays():
+    """Arrays are hashed by content, not by their (elided) repr"""
+    big = np.zeros(5000)
+    changed = big.copy()
+    changed[2500] = 1.0
+    
+    assert hash_key({'spend': big}) != hash_key({'spend': changed})
+    assert hash_key({'spend': big[::2]}) == hash_key({'spend': np.zeros(2500)})
+
+
+def test_version_token_has_short_stable_suffix():
+    """Tokens are prefix + 8 hex chars and track their dependencies"""
+    token = version_token('gtm_v1', {'a': 1}, [1, 2])
+    prefix, suffix = token.rsplit('_', 1)
+    
+    assert prefix == 'gtm_v1' and len(suffix) == 8
+    int(suffix, 16)
+    assert version_token('gtm_v1', {'a': 1}, [1, 2]) == token
+    assert version_token('gtm_v1', {'a': 2}, [1, 2]) != token
+    assert version_token('gtm_v1', {(1, 2): 3}) == version_token('gtm_v1', {(1, 2): 3})
+
+
+# ============= SNAPSHOT TESTS =============
+
+def test_scoped_change_detection_reuses_snapshot_hashes():
+    """Section hashes are computed once per snapshot and match hash_key"""
+    from modules.state import create_business_snapshot, has_state_changed
+    state = {'gtm_channels': [{'name': 'Inbound', 'cpl': 50}], 'avg_deal_value': 50000}
+    snapshot = create_business_snapshot(state)
+    
+    assert not has_state_changed(state, snapshot, scope='gtm')
+    assert snapshot.part_key('gtm') == hash_key(snapshot['gtm'])
+    assert snapshot._part_hashes.keys() == {'gtm'}
+    
+    state['avg_deal_value'] = 60000
+    assert has_state_changed(state, snapshot, scope='gtm')
+    assert not has_state_changed(state, snapshot, scope='pnl')
+
+
+def test_snapshot_is_read_only_and_hashes_lazily():
+    """Snapshots can't be mutated and only hash when a key is asked for"""
+    from modules.state import StateSnapshot
+    snapshot = StateSnapshot(gtm={'avg_deal_value': 50000}, timestamp=0)
+    
+    assert snapshot._hash is None
+    with pytest.raises(TypeError):
+        snapshot._data['gtm'] = {}
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1
+    
+    assert snapshot.cache_key() == hash_key(snapshot.to_dict())
+    assert snapshot == StateSnapshot(timestamp=0, gtm={'avg_deal_value': 50000})
+    assert len({snapshot, StateSnapshot(timestamp=0, gtm={'avg_deal_value': 50000})}) == 1
+
+
+def test_change_detection_sees_in_place_channel_edits():
+    """Editing a channel dict in place after snapshotting counts as a change"""
+    from modules.state import create_business_snapshot, has_state_changed
+    state = {'gtm_channels': [{'name': 'Inbound', 'cpl': 50}]}
+    snapshot = create_business_snapshot(state)
+    
+    assert not has_state_changed(state, snapshot)
+    
+    state['gtm_channels'][0]['cpl'] = 75
+    assert has_state_changed(state, snapshot, scope='gtm')
+    assert has_state_changed(state, snapshot)
+    assert snapshot['gtm']['channels'][0]['cpl'] == 50
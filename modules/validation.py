@@ -3,7 +3,11 @@ Validation module - QA checks and error detection
 """
 from typing import Dict, List, Tuple, Optional
 import numpy as np
-from .config import config
+from .config import (
+    CLOSE_RATE_MAX, CLOSE_RATE_MIN, CONTACT_RATE_MAX, CONTACT_RATE_MIN,
+    DEFAULT_CONTACTS_PER_SETTER, DEFAULT_MEETINGS_PER_CLOSER, MEETING_RATE_MAX,
+    MEETING_RATE_MIN, MIN_GROSS_MARGIN, MIN_LTV_CAC_RATIO
+)
 
 class ModelValidator:
     """Validates model inputs and outputs for errors"""
@@ -19,24 +23,24 @@ class ModelValidator:
         # Check ranges
         if not 0 <= contact_rate <= 1:
             errors.append(f"Contact rate {contact_rate:.1%} is outside valid range [0-100%]")
-        elif contact_rate < config.CONTACT_RATE_MIN:
-            warnings.append(f"Contact rate {contact_rate:.1%} is below benchmark {config.CONTACT_RATE_MIN:.1%}")
-        elif contact_rate > config.CONTACT_RATE_MAX:
-            warnings.append(f"Contact rate {contact_rate:.1%} is above benchmark {config.CONTACT_RATE_MAX:.1%}")
+        elif contact_rate < CONTACT_RATE_MIN:
+            warnings.append(f"Contact rate {contact_rate:.1%} is below benchmark {CONTACT_RATE_MIN:.1%}")
+        elif contact_rate > CONTACT_RATE_MAX:
+            warnings.append(f"Contact rate {contact_rate:.1%} is above benchmark {CONTACT_RATE_MAX:.1%}")
         
         if not 0 <= meeting_rate <= 1:
             errors.append(f"Meeting rate {meeting_rate:.1%} is outside valid range [0-100%]")
-        elif meeting_rate < config.MEETING_RATE_MIN:
-            warnings.append(f"Meeting rate {meeting_rate:.1%} is below benchmark {config.MEETING_RATE_MIN:.1%}")
-        elif meeting_rate > config.MEETING_RATE_MAX:
-            warnings.append(f"Meeting rate {meeting_rate:.1%} is above benchmark {config.MEETING_RATE_MAX:.1%}")
+        elif meeting_rate < MEETING_RATE_MIN:
+            warnings.append(f"Meeting rate {meeting_rate:.1%} is below benchmark {MEETING_RATE_MIN:.1%}")
+        elif meeting_rate > MEETING_RATE_MAX:
+            warnings.append(f"Meeting rate {meeting_rate:.1%} is above benchmark {MEETING_RATE_MAX:.1%}")
         
         if not 0 <= close_rate <= 1:
             errors.append(f"Close rate {close_rate:.1%} is outside valid range [0-100%]")
-        elif close_rate < config.CLOSE_RATE_MIN:
-            warnings.append(f"Close rate {close_rate:.1%} is below benchmark {config.CLOSE_RATE_MIN:.1%}")
-        elif close_rate > config.CLOSE_RATE_MAX:
-            warnings.append(f"Close rate {close_rate:.1%} is above benchmark {config.CLOSE_RATE_MAX:.1%}")
+        elif close_rate < CLOSE_RATE_MIN:
+            warnings.append(f"Close rate {close_rate:.1%} is below benchmark {CLOSE_RATE_MIN:.1%}")
+        elif close_rate > CLOSE_RATE_MAX:
+            warnings.append(f"Close rate {close_rate:.1%} is above benchmark {CLOSE_RATE_MAX:.1%}")
         
         # Check logical consistency
         lead_to_sale = contact_rate * meeting_rate * close_rate
@@ -58,13 +62,13 @@ class ModelValidator:
         warnings = []
         
         # Calculate capacity
-        closer_capacity = num_closers * config.DEFAULT_MEETINGS_PER_CLOSER * 4
-        setter_capacity = num_setters * config.DEFAULT_CONTACTS_PER_SETTER * 20
+        closer_capacity = num_closers * DEFAULT_MEETINGS_PER_CLOSER * 4
+        setter_capacity = num_setters * DEFAULT_CONTACTS_PER_SETTER * 20
         
         # Check closer capacity
         if meetings_needed > closer_capacity:
             shortage = meetings_needed - closer_capacity
-            additional_closers = int(np.ceil(shortage / (config.DEFAULT_MEETINGS_PER_CLOSER * 4)))
+            additional_closers = int(np.ceil(shortage / (DEFAULT_MEETINGS_PER_CLOSER * 4)))
             errors.append(f"Need {additional_closers} more closers. Current capacity: {closer_capacity:.0f}, Need: {meetings_needed:.0f}")
         elif meetings_needed < closer_capacity * 0.5:
             warnings.append(f"Closers at {(meetings_needed/closer_capacity)*100:.0f}% capacity. Consider reducing headcount")
@@ -72,7 +76,7 @@ class ModelValidator:
         # Check setter capacity  
         if contacts_needed > setter_capacity:
             shortage = contacts_needed - setter_capacity
-            additional_setters = int(np.ceil(shortage / (config.DEFAULT_CONTACTS_PER_SETTER * 20)))
+            additional_setters = int(np.ceil(shortage / (DEFAULT_CONTACTS_PER_SETTER * 20)))
             errors.append(f"Need {additional_setters} more setters. Current capacity: {setter_capacity:.0f}, Need: {contacts_needed:.0f}")
         elif contacts_needed < setter_capacity * 0.5:
             warnings.append(f"Setters at {(contacts_needed/setter_capacity)*100:.0f}% capacity. Consider reducing headcount")
@@ -91,8 +95,8 @@ class ModelValidator:
         # LTV:CAC validation
         if ltv_cac_ratio < 1:
             errors.append(f"LTV:CAC ratio {ltv_cac_ratio:.1f} is below 1. Losing money on every customer!")
-        elif ltv_cac_ratio < config.MIN_LTV_CAC_RATIO:
-            warnings.append(f"LTV:CAC ratio {ltv_cac_ratio:.1f} is below healthy minimum of {config.MIN_LTV_CAC_RATIO}:1")
+        elif ltv_cac_ratio < MIN_LTV_CAC_RATIO:
+            warnings.append(f"LTV:CAC ratio {ltv_cac_ratio:.1f} is below healthy minimum of {MIN_LTV_CAC_RATIO}:1")
         elif ltv_cac_ratio > 10:
             warnings.append(f"LTV:CAC ratio {ltv_cac_ratio:.1f} might be too good to be true. Verify calculations")
         
@@ -105,8 +109,8 @@ class ModelValidator:
             warnings.append(f"EBITDA margin {ebitda_margin:.1%} seems very high. Verify calculations")
         
         # Gross margin validation
-        if gross_margin < config.MIN_GROSS_MARGIN:
-            warnings.append(f"Gross margin {gross_margin:.1%} is below target {config.MIN_GROSS_MARGIN:.1%}")
+        if gross_margin < MIN_GROSS_MARGIN:
+            warnings.append(f"Gross margin {gross_margin:.1%} is below target {MIN_GROSS_MARGIN:.1%}")
         
         # Cost of sales validation
         if cos_percentage > 0.30: